@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Image cache index persistence benchmark
+
+Compares rewriting the whole cache_index.json on every hit (previous implementation)
+with the journaled index (inserts/removals appended to a journal, access times flushed
+periodically): hit latency and index writes for several index sizes.
+
+Usage:
+    python benchmarks/bench_image_cache_index.py --sizes 100 1000 5000 --hits 2000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import ImageCache  # noqa: E402
+
+
+class RewriteOnHitCache(ImageCache):
+    """Cache that rewrites the whole index on every hit, like the previous implementation"""
+
+    def get(self, source: str):
+        result = super().get(source)
+        if result is not None:
+            self._save_cache_index()
+        return result
+
+
+def measure(cache_class: type[ImageCache], size: int, hits: int) -> tuple[float, int]:
+    """Return the mean hit latency (microseconds) and the number of index writes"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = cache_class(cache_dir=Path(directory), max_size=size)
+        sources = [f"https://example.com/images/{i}.png" for i in range(size)]
+        for source in sources:
+            cache.set(source, b"x" * 1024, "image/png")
+        cache.flush()
+
+        rng = random.Random(42)
+        plan = [rng.choice(sources) for _ in range(hits)]
+        writes = 0
+        save = cache._save_cache_index
+
+        def counting_save():
+            nonlocal writes
+            writes += 1
+            save()
+
+        cache._save_cache_index = counting_save
+        start = time.perf_counter()
+        for source in plan:
+            cache.get(source)
+        seconds = time.perf_counter() - start
+        return seconds / hits * 1e6, writes
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(
+        description="Image cache index persistence benchmark"
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1000, 5000], help="index entries"
+    )
+    parser.add_argument("--hits", type=int, default=2000, help="hits per index size")
+    args = parser.parse_args()
+
+    print(f"{'entries':>8} {'implementation':<16} {'us/hit':>10} {'index writes':>13}")
+    for size in args.sizes:
+        for label, cache_class in (
+            ("rewrite on hit", RewriteOnHitCache),
+            ("journaled", ImageCache),
+        ):
+            latency, writes = measure(cache_class, size, args.hits)
+            print(f"{size:>8} {label:<16} {latency:10.1f} {writes:13d}")
+
+
+if __name__ == "__main__":
+    main()
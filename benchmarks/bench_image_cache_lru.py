@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Image cache LRU eviction benchmark
+
+Compares sorting the whole index by access_time on every write (previous
+implementation) with an OrderedDict index kept in recency order: mean time per set
+while evicting continuously, for several max_size values.
+
+Usage:
+    python benchmarks/bench_image_cache_lru.py --sizes 100 1000 10000 --sets 2000
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import ImageCache  # noqa: E402
+
+
+class SortingCache(ImageCache):
+    """Cache that sorts the whole index by access time to evict, like the previous implementation"""
+
+    def _cleanup_old_cache(self) -> None:
+        if len(self._cache_index) <= self._max_size:
+            return
+        sorted_items = sorted(
+            self._cache_index.items(), key=lambda x: x[1].get("access_time", 0)
+        )
+        for cache_key, cache_info in sorted_items[
+            : len(self._cache_index) - self._max_size
+        ]:
+            self._remove_cache_item(cache_key, cache_info)
+
+
+def measure(cache_class: type[ImageCache], size: int, sets: int) -> float:
+    """Keep writing to a full cache and return the mean time per set (microseconds)"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = cache_class(cache_dir=Path(directory), max_size=size)
+        for i in range(size):
+            cache.set(f"https://example.com/warm/{i}.png", b"x", "image/png")
+
+        start = time.perf_counter()
+        for i in range(sets):
+            cache.set(f"https://example.com/new/{i}.png", b"x", "image/png")
+        return (time.perf_counter() - start) / sets * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Image cache LRU eviction benchmark")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000, 10_000],
+        help="max_size values",
+    )
+    parser.add_argument(
+        "--sets", type=int, default=2000, help="writes after the cache is full"
+    )
+    args = parser.parse_args()
+
+    print(f"{'max_size':>9} {'implementation':<16} {'us/set':>10}")
+    for size in args.sizes:
+        for label, cache_class in (
+            ("sort on set", SortingCache),
+            ("ordered index", ImageCache),
+        ):
+            print(
+                f"{size:>9} {label:<16} {measure(cache_class, size, args.sets):10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
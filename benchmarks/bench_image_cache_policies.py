@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Image cache eviction policy benchmark
+
+Under a byte budget, compares the LRU, LFU and GDSF eviction policies on a mixed
+workload of a few frequently used small icons and many occasionally used large charts:
+hit ratio, byte hit ratio, evictions and time.
+
+Usage:
+    python benchmarks/bench_image_cache_policies.py --requests 5000 --max-mb 4
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import EVICTION_POLICIES, ImageCache  # noqa: E402
+
+
+def build_workload(requests: int, seed: int = 42) -> list[tuple[str, int]]:
+    """Build the request sequence [(source, size)]: icons follow a Zipf distribution, charts are uniform and rarer"""
+    rng = random.Random(seed)
+    icons = [(f"https://example.com/icons/{i}.png", 2 * 1024) for i in range(50)]
+    charts = [(f"https://example.com/charts/{i}.png", 200 * 1024) for i in range(200)]
+    icon_weights = [1 / (rank + 1) for rank in range(len(icons))]
+    workload = []
+    for _ in range(requests):
+        if rng.random() < 0.8:
+            workload.append(rng.choices(icons, icon_weights)[0])
+        else:
+            workload.append(rng.choice(charts))
+    return workload
+
+
+def run(policy: str, workload: list[tuple[str, int]], max_bytes: int) -> dict:
+    """Replay the requests against the cache, writing on every miss"""
+    payloads = {}
+    hits = hit_bytes = total_bytes = 0
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ImageCache(
+            cache_dir=Path(directory),
+            max_size=10_000,
+            max_bytes=max_bytes,
+            policy=policy,
+        )
+        start = time.perf_counter()
+        for source, size in workload:
+            total_bytes += size
+            if cache.get(source) is not None:
+                hits += 1
+                hit_bytes += size
+            else:
+                payload = payloads.setdefault(size, b"x" * size)
+                cache.set(source, payload, "image/png")
+        seconds = time.perf_counter() - start
+        evictions = sum(cache.get_cache_stats()["evictions"].values())
+    return {
+        "hit_ratio": hits / len(workload),
+        "byte_hit_ratio": hit_bytes / total_bytes,
+        "evictions": evictions,
+        "seconds": seconds,
+    }
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(
+        description="Image cache eviction policy benchmark"
+    )
+    parser.add_argument("--requests", type=int, default=5000, help="number of requests")
+    parser.add_argument(
+        "--max-mb", type=float, default=4, help="cache byte budget (MB)"
+    )
+    args = parser.parse_args()
+
+    workload = build_workload(args.requests)
+    max_bytes = int(args.max_mb * 1024 * 1024)
+
+    print(
+        f"{'policy':<8} {'hit ratio':>10} {'byte hits':>10} {'evictions':>10} {'seconds':>9}"
+    )
+    for policy in EVICTION_POLICIES:
+        result = run(policy, workload, max_bytes)
+        print(
+            f"{policy:<8} {result['hit_ratio']:10.1%} {result['byte_hit_ratio']:10.1%} "
+            f"{result['evictions']:10d} {result['seconds']:9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Image cache tier benchmark
+
+Compares a disk-only cache (memory_bytes=0) with a memory tier in front of the disk
+tier when the same images (e.g. a company logo embedded in every email) are read
+repeatedly: mean time per hit and hits per tier.
+
+Usage:
+    python benchmarks/bench_image_cache_tiers.py --sizes-kb 10 1024 5120 --hits 500
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import ImageCache  # noqa: E402
+
+
+def measure(memory_bytes: int, size: int, hits: int) -> tuple[float, dict[str, int]]:
+    """Return the mean time per hit (microseconds) and the hits per tier"""
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ImageCache(cache_dir=Path(directory), memory_bytes=memory_bytes)
+        sources = [f"https://example.com/assets/logo-{i}.png" for i in range(4)]
+        for source in sources:
+            cache.set(source, b"x" * size, "image/png")
+
+        start = time.perf_counter()
+        for i in range(hits):
+            cache.get(sources[i % len(sources)])
+        seconds = time.perf_counter() - start
+        return seconds / hits * 1e6, cache.get_cache_stats()["hits"]
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Image cache tier benchmark")
+    parser.add_argument(
+        "--sizes-kb",
+        type=int,
+        nargs="+",
+        default=[10, 1024, 5120],
+        help="image sizes (KB)",
+    )
+    parser.add_argument("--hits", type=int, default=500, help="number of hits")
+    args = parser.parse_args()
+
+    print(
+        f"{'size KB':>8} {'tiers':<14} {'us/hit':>10} {'memory hits':>12} {'disk hits':>10}"
+    )
+    for size_kb in args.sizes_kb:
+        for label, memory_bytes in (
+            ("disk only", 0),
+            ("memory + disk", 64 * 1024 * 1024),
+        ):
+            latency, hits = measure(memory_bytes, size_kb * 1024, args.hits)
+            print(
+                f"{size_kb:>8} {label:<14} {latency:10.1f} "
+                f"{hits['memory']:12d} {hits['disk']:10d}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Image embedding benchmark
+
+Compares base64-encoding again after a cache hit (ImageCache.get +
+ImageUtils.base64_img, previous implementation) with returning the cached data URI
+(ImageUtils.process_image_source): mean time per embed of the same image.
+
+Usage:
+    python benchmarks/bench_image_embed.py --sizes-kb 10 1024 5120 --embeds 200
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import ImageCache  # noqa: E402
+from email_widget.utils.image_utils import ImageUtils  # noqa: E402
+
+
+def encode_on_hit(cache: ImageCache, source: str) -> str:
+    """Encode again after the hit, like the previous implementation"""
+    data, mime_type = cache.get(source)
+    return ImageUtils.base64_img(data, mime_type)
+
+
+def cached_data_uri(cache: ImageCache, source: str) -> str:
+    """Embed through process_image_source, which returns the cached data URI on a hit"""
+    return ImageUtils.process_image_source(source)
+
+
+def measure(func, size: int, embeds: int) -> float:
+    """Return the mean time per embed (microseconds)"""
+    with tempfile.TemporaryDirectory() as directory:
+        image_path = Path(directory) / "logo.png"
+        image_path.write_bytes(b"x" * size)
+        cache = ImageCache(
+            cache_dir=Path(directory) / "cache", memory_bytes=256 * 1024 * 1024
+        )
+        source = str(image_path)
+        with mock.patch(
+            "email_widget.utils.image_utils.get_image_cache", return_value=cache
+        ):
+            expected = ImageUtils.process_image_source(source)
+
+            start = time.perf_counter()
+            for _ in range(embeds):
+                assert func(cache, source) == expected
+            return (time.perf_counter() - start) / embeds * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Image embedding benchmark")
+    parser.add_argument(
+        "--sizes-kb",
+        type=int,
+        nargs="+",
+        default=[10, 1024, 5120],
+        help="image sizes (KB)",
+    )
+    parser.add_argument("--embeds", type=int, default=200, help="number of embeds")
+    args = parser.parse_args()
+
+    print(f"{'size KB':>8} {'implementation':<18} {'us/embed':>10}")
+    for size_kb in args.sizes_kb:
+        for label, func in (
+            ("encode on hit", encode_on_hit),
+            ("cached data URI", cached_data_uri),
+        ):
+            print(
+                f"{size_kb:>8} {label:<18} {measure(func, size_kb * 1024, args.embeds):10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Logging overhead benchmark
+
+With debug logging disabled, compares the per-call cost of eagerly formatted f-string
+log calls on hot paths with deferred formatting (%-style arguments plus an
+is_enabled_for check), and reports the time per TemplateEngine.render and
+ImageCache.get call.
+
+Usage:
+    python benchmarks/bench_logging_overhead.py --iterations 200000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.cache import ImageCache  # noqa: E402
+from email_widget.core.logger import get_project_logger  # noqa: E402
+from email_widget.core.template_engine import TemplateEngine  # noqa: E402
+
+
+def per_call(func, iterations: int) -> float:
+    """Return the mean time per call (nanoseconds)"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e9
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Logging overhead benchmark")
+    parser.add_argument("--iterations", type=int, default=200000, help="calls per case")
+    parser.add_argument(
+        "--html-size",
+        type=int,
+        default=1_000_000,
+        help="characters in the rendered output",
+    )
+    args = parser.parse_args()
+
+    logger = get_project_logger()
+    assert not logger.is_enabled_for(logging.DEBUG), (
+        "run with the log level above DEBUG"
+    )
+
+    result = "<td>cell</td>" * (args.html_size // 13)
+    source = "https://example.com/images/" + "x" * 200 + ".png"
+
+    def eager_render_log():
+        logger.debug(
+            f"Template rendering successful, output length: {len(result)} characters"
+        )
+
+    def lazy_render_log():
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug(
+                "Template rendering successful, output length: %d characters",
+                len(result),
+            )
+
+    def eager_cache_log():
+        logger.debug(f"Retrieved image from cache: {source[:50]}... ")
+
+    def lazy_cache_log():
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Retrieved image from cache: %s... ", source[:50])
+
+    print(f"{'log statement':<28} {'f-string ns':>12} {'lazy ns':>10} {'saved ns':>10}")
+    for label, eager, lazy in (
+        ("TemplateEngine.render", eager_render_log, lazy_render_log),
+        ("ImageCache.get", eager_cache_log, lazy_cache_log),
+    ):
+        eager_ns = per_call(eager, args.iterations)
+        lazy_ns = per_call(lazy, args.iterations)
+        print(
+            f"{label:<28} {eager_ns:12.1f} {lazy_ns:10.1f} {eager_ns - lazy_ns:10.1f}"
+        )
+
+    engine = TemplateEngine()
+    template = "<p>{{ text }}</p>"
+    engine.render(template, {"text": "hello"})
+    render_ns = per_call(
+        lambda: engine.render(template, {"text": "hello"}), args.iterations // 10
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache = ImageCache(cache_dir=Path(tmp_dir), max_size=10)
+        cache.set(source, b"\x89PNG" + b"\x00" * 1024, "image/png")
+        get_ns = per_call(lambda: cache.get(source), args.iterations // 100)
+
+    print(f"\nTemplateEngine.render (small template): {render_ns:10.1f} ns/call")
+    print(f"ImageCache.get (1 KB image):              {get_ns:10.1f} ns/call")
+
+
+if __name__ == "__main__":
+    main()
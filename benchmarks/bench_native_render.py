@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Native render backend benchmark
+
+Compares the Jinja2 and native backends rendering all 17 widget templates and checks
+that their output is identical. Only template rendering is timed: contexts are built
+beforehand, so get_template_context is excluded.
+
+Usage:
+    python benchmarks/bench_native_render.py --iterations 2000
+"""
+
+import argparse
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import LogLevel, StatusType  # noqa: E402
+from email_widget.core.template_engine import (  # noqa: E402
+    TemplateEngine,
+    get_template_key,
+)
+from email_widget.widgets import (  # noqa: E402
+    AlertWidget,
+    ButtonWidget,
+    CardWidget,
+    ChartWidget,
+    ChecklistWidget,
+    CircularProgressWidget,
+    ColumnWidget,
+    ImageWidget,
+    LogWidget,
+    MetricWidget,
+    ProgressWidget,
+    QuoteWidget,
+    SeparatorWidget,
+    StatusWidget,
+    TableWidget,
+    TextWidget,
+    TimelineWidget,
+)
+
+
+def build_widgets(rows: int) -> list:
+    """Build one sample of every widget type"""
+    chart = ChartWidget().set_title("Chart").set_description("Description")
+    chart._image_url = "data:image/png;base64,iVBORw0KGgo="
+
+    table = TableWidget().set_title("Table").set_headers(["Name", "Status", "Value"])
+    for r in range(rows):
+        table.add_row([f"item-{r}", "OK" if r % 2 else "FAIL", f"{r * 1.5:.2f}"])
+
+    logs = LogWidget().set_title("Logs")
+    for r in range(rows):
+        logs.add_log_entry(
+            f"line {r}", LogLevel.INFO, datetime(2024, 1, 1), "job", "run", r
+        )
+
+    checklist = ChecklistWidget().set_title("Checklist")
+    timeline = TimelineWidget().set_title("Timeline")
+    metrics = MetricWidget().set_title("Metrics")
+    status = StatusWidget().set_title("Status")
+    card = CardWidget().set_title("Card").set_content("Content")
+    for r in range(10):
+        checklist.add_item(f"Task {r}", r % 2 == 0, description="desc")
+        timeline.add_event(
+            f"Event {r}", datetime(2024, 1, r + 1), "desc", StatusType.INFO
+        )
+        status.add_status_item(f"Service {r}", "Up", StatusType.SUCCESS)
+        card.add_metadata(f"Key {r}", f"Value {r}")
+    for r in range(4):
+        metrics.add_metric(f"KPI {r}", r * 100, "units", "+1%", StatusType.SUCCESS)
+
+    return [
+        AlertWidget().set_content("Alert").set_title("Title"),
+        ButtonWidget().set_text("Open").set_href("https://example.com"),
+        card,
+        chart,
+        checklist,
+        CircularProgressWidget().set_value(42).set_label("CPU"),
+        ColumnWidget().add_widgets(
+            [TextWidget().set_content(str(i)) for i in range(4)]
+        ),
+        ImageWidget()
+        .set_image_url("https://example.com/a.png", embed=False)
+        .set_title("Image"),
+        logs,
+        metrics,
+        ProgressWidget().set_value(75).set_label("Progress"),
+        QuoteWidget().set_content("Quote").set_author("Author"),
+        SeparatorWidget(),
+        status,
+        table,
+        TextWidget().set_content("Line one\nLine two"),
+        timeline,
+    ]
+
+
+def measure(engine: TemplateEngine, widget, context: dict, iterations: int) -> float:
+    """Return the mean time per render (seconds)"""
+    name = get_template_key(type(widget))
+    engine.render(widget.TEMPLATE, context, name=name)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        engine.render(widget.TEMPLATE, context, name=name)
+    return (time.perf_counter() - start) / iterations
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Native render backend benchmark")
+    parser.add_argument(
+        "--iterations", type=int, default=2000, help="renders per widget"
+    )
+    parser.add_argument("--rows", type=int, default=50, help="rows per table/log")
+    args = parser.parse_args()
+
+    jinja = TemplateEngine(render_backend="jinja")
+    native = TemplateEngine(render_backend="native")
+
+    total_jinja = total_native = 0.0
+    print(f"{'widget':<24} {'jinja µs':>10} {'native µs':>10} {'speedup':>8}")
+    for widget in build_widgets(args.rows):
+        context = widget.get_template_context()
+        name = get_template_key(type(widget))
+        # Both backends must produce identical output
+        assert native.render(widget.TEMPLATE, context, name=name) == jinja.render(
+            widget.TEMPLATE, context, name=name
+        ), type(widget).__name__
+
+        jinja_time = measure(jinja, widget, context, args.iterations)
+        native_time = measure(native, widget, context, args.iterations)
+        total_jinja += jinja_time
+        total_native += native_time
+        print(
+            f"{type(widget).__name__:<24} {jinja_time * 1e6:10.1f} {native_time * 1e6:10.1f} "
+            f"{jinja_time / native_time:7.2f}x"
+        )
+
+    print(
+        f"{'total':<24} {total_jinja * 1e6:10.1f} {total_native * 1e6:10.1f} "
+        f"{total_jinja / total_native:7.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
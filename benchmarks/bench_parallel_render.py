@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Parallel render benchmark
+
+Compares Email.export_str rendering sequentially, with a thread pool and with a
+process pool.
+
+Usage:
+    python benchmarks/bench_parallel_render.py --widgets 200 --workers 4
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget import Email  # noqa: E402
+from email_widget.core.enums import LogLevel  # noqa: E402
+
+
+def build_email(widget_count: int, rows: int) -> Email:
+    """Build an email with many independent widgets"""
+    email = Email("Parallel Render Benchmark")
+    for i in range(widget_count):
+        kind = i % 3
+        if kind == 0:
+            data = [[f"item-{i}-{r}", str(r), f"{r * 1.5:.2f}"] for r in range(rows)]
+            email.add_table_from_data(data, ["Name", "Count", "Value"], f"Table {i}")
+        elif kind == 1:
+            logs = [
+                f"2024-01-01 12:00:{r % 60:02d} | INFO | job:{r} - line {r}"
+                for r in range(rows)
+            ]
+            email.add_log(logs, title=f"Log {i}", filter_level=LogLevel.DEBUG)
+        else:
+            email.add_metric(
+                title=f"Metrics {i}",
+                metrics=[(f"KPI {m}", m * 100, "units") for m in range(4)],
+            )
+    return email
+
+
+def measure(email: Email, repeat: int, **kwargs) -> float:
+    """Return the best export time (seconds), invalidating render caches so every widget is rendered"""
+    best = float("inf")
+    for _ in range(repeat):
+        for widget in email.widgets:
+            widget.invalidate_render_cache()
+        start = time.perf_counter()
+        email.export_str(**kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Email parallel render benchmark")
+    parser.add_argument("--widgets", type=int, default=200, help="number of widgets")
+    parser.add_argument("--rows", type=int, default=200, help="rows per table/log")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--repeat", type=int, default=3, help="repetitions")
+    args = parser.parse_args()
+
+    email = build_email(args.widgets, args.rows)
+    reference = email.export_str()
+
+    # Parallel output must match sequential output exactly
+    for executor in ("thread", "process"):
+        assert email.export_str(workers=args.workers, executor=executor) == reference
+
+    sequential = measure(email, args.repeat)
+    results = [("sequential", sequential)]
+    for executor in ("thread", "process"):
+        results.append(
+            (
+                f"{executor} x{args.workers}",
+                measure(email, args.repeat, workers=args.workers, executor=executor),
+            )
+        )
+
+    print(f"🚀 {args.widgets} widgets, {args.rows} rows each, {len(reference):,} chars")
+    for name, elapsed in results:
+        print(
+            f"  {name:<14} {elapsed * 1000:10.1f} ms   speedup {sequential / elapsed:5.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+DataFrame ingestion benchmark
+
+Compares the column-wise vectorized conversion in TableWidget.set_dataframe with the
+previous row-by-row df.iterrows() conversion at 10k / 100k / 1M cells, and checks that
+both produce the same rows.
+
+Usage:
+    python benchmarks/bench_table_ingest.py --columns 10 --repeat 3
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import StatusType  # noqa: E402
+from email_widget.widgets.table_widget import TableCell, TableWidget  # noqa: E402
+
+
+def iterrows_rows(df: pd.DataFrame) -> list[list]:
+    """Row-by-row conversion of the previous set_dataframe, used as the baseline"""
+    rows = []
+    for _, row in df.iterrows():
+        row_data = []
+        for col in df.columns:
+            value = row[col]
+            if isinstance(value, dict) and "status" in value:
+                row_data.append(
+                    TableCell(
+                        value=value.get("text", str(value)),
+                        status=StatusType(value["status"]),
+                    )
+                )
+            else:
+                row_data.append(str(value))
+        rows.append(row_data)
+    return rows
+
+
+def build_frames(rows: int, columns: int) -> dict[str, pd.DataFrame]:
+    """Build a numeric-only and a mixed-type DataFrame"""
+    rng = np.random.default_rng(42)
+    numeric = pd.DataFrame(
+        {f"n{c}": rng.random(rows) * 1000 for c in range(columns)},
+    )
+
+    statuses = [
+        {"text": "OK", "status": "success"},
+        {"text": "FAIL", "status": "error"},
+    ]
+    mixed = {}
+    for c in range(columns):
+        kind = c % 4
+        if kind == 0:
+            mixed[f"c{c}"] = np.arange(rows)
+        elif kind == 1:
+            mixed[f"c{c}"] = rng.random(rows)
+        elif kind == 2:
+            mixed[f"c{c}"] = [f"item-{i}" if i % 10 else None for i in range(rows)]
+        else:
+            mixed[f"c{c}"] = [statuses[i % 2] for i in range(rows)]
+    return {"numeric": numeric, "mixed": pd.DataFrame(mixed)}
+
+
+def normalize(rows: list[list]) -> list[list]:
+    """Turn TableCell objects into comparable tuples"""
+    return [
+        [
+            (cell.value, cell.status) if isinstance(cell, TableCell) else cell
+            for cell in row
+        ]
+        for row in rows
+    ]
+
+
+def best_time(func, repeat: int) -> float:
+    """Return the best time over several runs (seconds)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="DataFrame ingestion benchmark")
+    parser.add_argument("--columns", type=int, default=10, help="number of columns")
+    parser.add_argument(
+        "--cells", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case")
+    args = parser.parse_args()
+
+    print(
+        f"{'frame':<10} {'cells':>10} {'iterrows ms':>12} {'vectorized ms':>14} {'speedup':>8}"
+    )
+    for cells in args.cells:
+        rows = max(1, cells // args.columns)
+        for name, df in build_frames(rows, args.columns).items():
+            assert normalize(TableWidget().set_dataframe(df).rows) == normalize(
+                iterrows_rows(df)
+            )
+
+            old = best_time(lambda df=df: iterrows_rows(df), args.repeat)
+            new = best_time(lambda df=df: TableWidget().set_dataframe(df), args.repeat)
+            print(
+                f"{name:<10} {cells:>10} {old * 1000:12.1f} {new * 1000:14.1f} {old / new:7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
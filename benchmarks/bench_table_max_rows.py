@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Table row limit benchmark
+
+Compares exporting a large DataFrame through Email.add_table_from_df in full and with
+max_rows set: time and HTML size.
+
+Usage:
+    python benchmarks/bench_table_max_rows.py --rows 200000 --max-rows 1000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget import Email  # noqa: E402
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Build a DataFrame mixing numeric and string columns"""
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "customer": [f"customer-{i}" for i in range(rows)],
+            "amount": rng.random(rows) * 1000,
+            "region": rng.choice(["EU", "US", "APAC"], rows),
+        }
+    )
+
+
+def export(df: pd.DataFrame, **kwargs) -> str:
+    """Export the DataFrame as a table to HTML"""
+    return Email("Orders").add_table_from_df(df, "Orders", **kwargs).export_str()
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Table row limit benchmark")
+    parser.add_argument("--rows", type=int, default=200_000, help="DataFrame rows")
+    parser.add_argument(
+        "--max-rows", type=int, default=1000, help="maximum rendered rows"
+    )
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+
+    print(f"{'mode':<22} {'seconds':>9} {'HTML MB':>9}")
+    for label, kwargs in (
+        ("all rows", {}),
+        (f"max_rows={args.max_rows}", {"max_rows": args.max_rows}),
+        ("head_tail", {"max_rows": args.max_rows, "max_rows_strategy": "head_tail"}),
+        ("sample", {"max_rows": args.max_rows, "max_rows_strategy": "sample"}),
+    ):
+        start = time.perf_counter()
+        html = export(df, **kwargs)
+        seconds = time.perf_counter() - start
+        print(f"{label:<22} {seconds:9.2f} {len(html.encode()) / 1024 / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Polars table ingestion benchmark
+
+Compares converting a Polars DataFrame to pandas first (to_pandas + set_dataframe)
+with passing the Polars DataFrame / LazyFrame to set_dataframe directly: time and
+tracemalloc peak memory. Also checks that all three render the same HTML.
+
+Usage:
+    python benchmarks/bench_table_polars.py --rows 1000000 --max-rows 1000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import polars as pl
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import StatusType  # noqa: E402
+from email_widget.widgets.table_widget import TableWidget  # noqa: E402
+
+
+def build_frame(rows: int) -> pl.DataFrame:
+    """Build a Polars DataFrame with growth and region columns"""
+    rng = np.random.default_rng(42)
+    return pl.DataFrame(
+        {
+            "id": np.arange(rows),
+            "growth": rng.normal(0, 0.1, rows),
+            "revenue": rng.random(rows) * 10_000,
+            "region": rng.choice(["EU", "US", "APAC"], rows),
+        }
+    )
+
+
+def build_table(df, max_rows: int) -> TableWidget:
+    """Build a table with a row limit and a formatting rule"""
+    return (
+        TableWidget()
+        .set_max_rows(max_rows, "head_tail")
+        .add_rule("growth", "<", 0, status=StatusType.ERROR)
+        .set_dataframe(df)
+    )
+
+
+def measure(func) -> tuple[float, int]:
+    """Return the time (seconds) and peak memory (bytes)"""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        func()
+        return seconds, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Polars table ingestion benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="DataFrame rows")
+    parser.add_argument("--max-rows", type=int, default=1000, help="maximum table rows")
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    cases = {
+        "to_pandas": lambda: build_table(df.to_pandas(), args.max_rows),
+        "polars eager": lambda: build_table(df, args.max_rows),
+        "polars lazy": lambda: build_table(df.lazy(), args.max_rows),
+    }
+    rendered = {cases[label]().render_html() for label in cases}
+    assert len(rendered) == 1
+
+    print(f"{'case':<14} {'seconds':>9} {'peak MB':>9}")
+    for label, func in cases.items():
+        seconds, peak = measure(func)
+        print(f"{label:<14} {seconds:9.3f} {peak / 1024 / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
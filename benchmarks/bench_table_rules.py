@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Conditional formatting rule benchmark
+
+Compares creating a TableCell per value in a Python loop after ingesting a DataFrame
+(add_status_cell) with column-wise vectorized TableWidget.add_rule rules: time,
+retained and peak tracemalloc memory to build the formatted table. Also checks that
+both render the same cell styles.
+
+Usage:
+    python benchmarks/bench_table_rules.py --rows 100000
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import StatusType  # noqa: E402
+from email_widget.widgets.table_widget import TableWidget  # noqa: E402
+
+
+def build_frame(rows: int) -> pd.DataFrame:
+    """Build a DataFrame with growth and region columns"""
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "id": np.arange(rows),
+            "growth": rng.normal(0, 0.1, rows),
+            "revenue": rng.random(rows) * 10_000,
+            "region": rng.choice(["EU", "US", "APAC"], rows),
+        }
+    )
+
+
+def status_for(growth: float) -> StatusType | None:
+    """Return the status for a growth value"""
+    if growth < 0:
+        return StatusType.ERROR
+    if growth >= 0.1:
+        return StatusType.SUCCESS
+    return None
+
+
+def cell_loop(df: pd.DataFrame) -> TableWidget:
+    """Create a TableCell per value after ingestion, used as the baseline"""
+    table = TableWidget().set_dataframe(df)
+    rows = table.rows
+    for row, growth in zip(rows, df["growth"].tolist(), strict=True):
+        status = status_for(growth)
+        if status:
+            row[1] = table.add_status_cell(row[1], status)
+    return table.set_rows(rows)
+
+
+def rules(df: pd.DataFrame) -> TableWidget:
+    """Rules evaluated column-wise"""
+    return (
+        TableWidget()
+        .add_rule("growth", "<", 0, status=StatusType.ERROR)
+        .add_rule("growth", ">=", 0.1, status=StatusType.SUCCESS)
+        .set_dataframe(df)
+    )
+
+
+def growth_styles(table: TableWidget) -> list[str]:
+    """Return the rendered styles of the growth column"""
+    return [
+        row["cells"][1]["style"] for row in table.get_template_context()["rows_data"]
+    ]
+
+
+def measure(func, df: pd.DataFrame) -> tuple[float, int, int]:
+    """Return the time (seconds), memory retained by the table and peak memory (bytes)"""
+    start = time.perf_counter()
+    func(df)
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    try:
+        # Retained memory is read while the table is alive, then the table is released
+        result = func(df)
+        current, peak = tracemalloc.get_traced_memory()
+        del result
+        return seconds, current, peak
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(
+        description="Conditional formatting rule benchmark"
+    )
+    parser.add_argument("--rows", type=int, default=100_000, help="DataFrame rows")
+    args = parser.parse_args()
+
+    df = build_frame(args.rows)
+    sample = df.head(1000)
+    assert growth_styles(cell_loop(sample)) == growth_styles(rules(sample))
+
+    print(f"{'implementation':<16} {'seconds':>9} {'kept MB':>9} {'peak MB':>9}")
+    for label, func in (("TableCell loop", cell_loop), ("add_rule", rules)):
+        seconds, current, peak = measure(func, df)
+        print(
+            f"{label:<16} {seconds:9.2f} {current / 1024 / 1024:9.1f} {peak / 1024 / 1024:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Table file ingestion benchmark
+
+Compares creating a table from a file through pandas (read_csv / read_parquet +
+set_dataframe) with TableWidget.from_csv / from_parquet. Each case runs in a fresh
+Python process, so the time includes importing pandas or pyarrow.
+
+Usage:
+    python benchmarks/bench_table_sources.py --rows 100000 --max-rows 1000
+"""
+
+import argparse
+import csv
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+CASES = {
+    "pandas read_csv": (
+        "import pandas as pd\n"
+        "from email_widget.widgets.table_widget import TableWidget\n"
+        "df = pd.read_csv({csv!r})\n"
+        "TableWidget().set_max_rows({max_rows}).set_dataframe(df)\n"
+    ),
+    "from_csv": (
+        "from email_widget.widgets.table_widget import TableWidget\n"
+        "TableWidget.from_csv({csv!r}, max_rows={max_rows})\n"
+    ),
+    "pandas read_parquet": (
+        "import pandas as pd\n"
+        "from email_widget.widgets.table_widget import TableWidget\n"
+        "df = pd.read_parquet({parquet!r}, columns=['id', 'customer'])\n"
+        "TableWidget().set_max_rows({max_rows}).set_dataframe(df)\n"
+    ),
+    "from_parquet": (
+        "from email_widget.widgets.table_widget import TableWidget\n"
+        "TableWidget.from_parquet({parquet!r}, columns=['id', 'customer'], max_rows={max_rows})\n"
+    ),
+}
+
+
+def write_files(directory: Path, rows: int) -> tuple[Path, Path]:
+    """Write CSV and Parquet files with the same data"""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    columns = {
+        "id": list(range(rows)),
+        "customer": [f"customer-{i}" for i in range(rows)],
+        "region": [("EU", "US", "APAC")[i % 3] for i in range(rows)],
+        "amount": [i * 1.5 for i in range(rows)],
+    }
+    csv_path = directory / "data.csv"
+    with open(csv_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(columns)
+        writer.writerows(zip(*columns.values(), strict=True))
+
+    parquet_path = directory / "data.parquet"
+    pq.write_table(pa.table(columns), parquet_path, row_group_size=10_000)
+    return csv_path, parquet_path
+
+
+def run_case(code: str) -> float:
+    """Run code in a new process and return the time (seconds)"""
+    timer = (
+        "import time\n"
+        "_start = time.perf_counter()\n"
+        f"{code}"
+        "print(time.perf_counter() - _start)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", timer],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Table file ingestion benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="file rows")
+    parser.add_argument("--max-rows", type=int, default=1000, help="maximum table rows")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path, parquet_path = write_files(Path(directory), args.rows)
+
+        print(f"{'case':<22} {'seconds':>9}")
+        for label, template in CASES.items():
+            code = template.format(
+                csv=str(csv_path), parquet=str(parquet_path), max_rows=args.max_rows
+            )
+            seconds = min(run_case(code) for _ in range(args.repeat))
+            print(f"{label:<22} {seconds:9.3f}")
+
+
+if __name__ == "__main__":
+    main()
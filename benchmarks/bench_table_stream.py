@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Table streaming benchmark
+
+Compares rendering a large table in full through set_rows (Email.export_str) with
+streaming it in chunks through set_row_source (Email.export_stream): tracemalloc peak
+memory and time.
+
+Usage:
+    python benchmarks/bench_table_stream.py --rows 200000 --chunk-size 1000
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget import Email  # noqa: E402
+from email_widget.widgets.table_widget import TableWidget  # noqa: E402
+
+HEADERS = ["ID", "Name", "Region", "Amount", "Status"]
+
+
+def generate_rows(count: int):
+    """Generate rows one by one, like a database cursor"""
+    regions = ("EU", "US", "APAC")
+    for i in range(count):
+        yield (str(i), f"customer-{i}", regions[i % 3], f"{i * 1.5:.2f}", "active")
+
+
+def run_materialized(rows: int) -> None:
+    """Load all rows with set_rows and export at once"""
+    table = (
+        TableWidget()
+        .set_headers(HEADERS)
+        .set_rows([list(r) for r in generate_rows(rows)])
+    )
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        f.write(Email("Materialized").add_widget(table).export_str())
+
+
+def run_streaming(rows: int, chunk_size: int) -> None:
+    """Stream the export through a row source"""
+    table = TableWidget().set_row_source(
+        generate_rows(rows), headers=HEADERS, chunk_size=chunk_size
+    )
+    with open(os.devnull, "w", encoding="utf-8") as f:
+        for chunk in Email("Streaming").add_widget(table).export_stream():
+            f.write(chunk)
+
+
+def measure(func, *args) -> tuple[float, int]:
+    """Return the time (seconds) and peak memory (bytes)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        func(*args)
+        return time.perf_counter() - start, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Table streaming benchmark")
+    parser.add_argument("--rows", type=int, default=200_000, help="table rows")
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, help="rows rendered per chunk"
+    )
+    args = parser.parse_args()
+
+    print(f"{'mode':<14} {'seconds':>9} {'peak MB':>9}")
+    for label, func, func_args in (
+        ("export_str", run_materialized, (args.rows,)),
+        ("export_stream", run_streaming, (args.rows, args.chunk_size)),
+    ):
+        seconds, peak = measure(func, *func_args)
+        print(f"{label:<14} {seconds:9.2f} {peak / 1024 / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Table style interning benchmark
+
+Compares building TableWidget row data by concatenating a style string per cell
+(previous implementation) with styles cached per combination and row styles built once
+per stripe parity (current implementation): CPU time and tracemalloc allocations. Also
+checks that both build the same row data.
+
+Usage:
+    python benchmarks/bench_table_styles.py --cells 100000 --columns 10
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import StatusType  # noqa: E402
+from email_widget.widgets.table_widget import TableCell, TableWidget  # noqa: E402
+
+
+def concat_rows_data(table: TableWidget, rows: list) -> list:
+    """Per-cell style concatenation of the previous get_template_context, used as the baseline"""
+    rows_data = []
+    for idx, row in enumerate(rows):
+        row_style = ""
+        if table._striped and idx % 2 == 1:
+            row_style = "background: #faf9f8;"
+        if table._bordered:
+            row_style += f" border-bottom: 1px solid {table._border_color};"
+
+        cells_data = []
+        for cell in row:
+            td_style = "padding: 8px; vertical-align: top;"
+            if isinstance(cell, TableCell):
+                if cell.status:
+                    status_style = table._get_status_style(cell.status)
+                    td_style += f" color: {status_style['color']}; background: {status_style['background']};"
+                if cell.color:
+                    td_style += f" color: {cell.color};"
+                if cell.bold:
+                    td_style += " font-weight: bold;"
+                td_style += f" text-align: {cell.align};"
+                if table._bordered:
+                    td_style += f" border-right: 1px solid {table._border_color};"
+                cells_data.append({"value": cell.value, "style": td_style})
+            else:
+                td_style += " color: #323130; text-align: center;"
+                if table._bordered:
+                    td_style += f" border-right: 1px solid {table._border_color};"
+                cells_data.append({"value": cell, "style": td_style})
+
+        rows_data.append(
+            {"index": idx + 1, "row_style": row_style, "cells": cells_data}
+        )
+    return rows_data
+
+
+def build_rows(row_count: int, columns: int) -> list:
+    """Build rows mixing plain strings and status cells"""
+    statuses = (StatusType.SUCCESS, StatusType.WARNING, StatusType.ERROR)
+    return [
+        [
+            TableCell(f"{r}-{c}", status=statuses[r % 3]) if c % 2 else f"{r}-{c}"
+            for c in range(columns)
+        ]
+        for r in range(row_count)
+    ]
+
+
+def measure(func, repeat: int) -> tuple[float, int]:
+    """Return the best CPU time (seconds) and the tracemalloc peak of one run (bytes)"""
+    times = []
+    for _ in range(repeat):
+        start = time.process_time()
+        func()
+        times.append(time.process_time() - start)
+
+    tracemalloc.start()
+    try:
+        # Keep the result alive until the peak is read, then release it
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+    finally:
+        tracemalloc.stop()
+    return min(times), peak
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Table style interning benchmark")
+    parser.add_argument("--cells", type=int, default=100_000, help="number of cells")
+    parser.add_argument("--columns", type=int, default=10, help="number of columns")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs")
+    args = parser.parse_args()
+
+    rows = build_rows(max(1, args.cells // args.columns), args.columns)
+    table = (
+        TableWidget().set_headers([f"C{c}" for c in range(args.columns)]).set_rows(rows)
+    )
+    indexed_rows = list(enumerate(rows))
+    assert table._build_rows_data(indexed_rows) == concat_rows_data(table, rows)
+
+    print(f"{'implementation':<16} {'cpu ms':>9} {'peak MB':>9}")
+    for label, func in (
+        ("concatenate", lambda: concat_rows_data(table, rows)),
+        ("interned", lambda: table._build_rows_data(indexed_rows)),
+    ):
+        seconds, peak = measure(func, args.repeat)
+        print(f"{label:<16} {seconds * 1000:9.1f} {peak / 1024 / 1024:9.1f}")
+
+
+if __name__ == "__main__":
+    main()
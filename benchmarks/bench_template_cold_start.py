@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Template cold start benchmark
+
+Measures the first render of every built-in widget in a fresh subprocess, comparing
+runtime compilation, the template bytecode cache (EMAILWIDGET_TEMPLATE_CACHE_DIR) and
+precompiled templates (EMAILWIDGET_PRECOMPILED_TEMPLATES).
+
+Usage:
+    python benchmarks/bench_template_cold_start.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Run in the subprocess: render every widget once after importing, timing only the render
+CHILD_SCRIPT = """
+import json, time
+from email_widget import Email
+from email_widget.core.enums import LogLevel, StatusType
+
+email = Email("Cold Start")
+email.add_text("Title")
+email.add_table_from_data([["a", "1"]], ["Name", "Value"])
+email.add_alert("Alert")
+email.add_progress(50, label="Progress")
+email.add_circular_progress(75, label="Circle")
+email.add_card("Card", "Content")
+email.add_status_items([{"label": "CPU", "value": "20%"}], title="Status")
+email.add_quote("Quote", author="Author")
+email.add_log(["2024-01-01 00:00:00 | INFO | app:main:1 - started"], filter_level=LogLevel.DEBUG)
+email.add_button("Button", "https://example.com")
+email.add_separator()
+email.add_checklist("Checklist", [("Item", True)])
+email.add_timeline("Timeline", [("Event", "2024-01-01")])
+email.add_metric("Metrics", [("Users", 100, "people")])
+
+start = time.perf_counter()
+email.export_str()
+print(json.dumps({"first_render_ms": (time.perf_counter() - start) * 1000}))
+"""
+
+
+def run_child(
+    cache_dir: str | None = None, precompiled_dir: str | None = None
+) -> float:
+    """Run a first render in a new process and return the time (milliseconds)"""
+    env = os.environ.copy()
+    env.pop("EMAILWIDGET_TEMPLATE_CACHE_DIR", None)
+    env.pop("EMAILWIDGET_PRECOMPILED_TEMPLATES", None)
+    env["EMAILWIDGET_DISABLE_LOGGING"] = "true"
+    if cache_dir is not None:
+        env["EMAILWIDGET_TEMPLATE_CACHE_DIR"] = cache_dir
+    if precompiled_dir is not None:
+        env["EMAILWIDGET_PRECOMPILED_TEMPLATES"] = precompiled_dir
+
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])["first_render_ms"]
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Template cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="processes per mode")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        cache_dir = str(Path(tmp_dir) / "bytecode")
+        precompiled_dir = str(Path(tmp_dir) / "precompiled")
+        subprocess.run(
+            [sys.executable, "-m", "email_widget.precompile", precompiled_dir],
+            cwd=PROJECT_ROOT,
+            capture_output=True,
+            check=True,
+        )
+
+        # Warm up: the first run writes the bytecode cache and the precompiled modules' __pycache__
+        run_child(cache_dir=cache_dir)
+        run_child(precompiled_dir=precompiled_dir)
+
+        results = {
+            "runtime compile": [run_child() for _ in range(args.runs)],
+            "bytecode cache": [
+                run_child(cache_dir=cache_dir) for _ in range(args.runs)
+            ],
+            "precompiled": [
+                run_child(precompiled_dir=precompiled_dir) for _ in range(args.runs)
+            ],
+        }
+
+    baseline = statistics.median(results["runtime compile"])
+    print(f"🚀 first render, median of {args.runs} fresh processes")
+    for name, timings in results.items():
+        median = statistics.median(timings)
+        print(f"  {name:<18} {median:8.1f} ms   speedup {baseline / median:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Value object memory benchmark
+
+Uses tracemalloc to compare the peak memory of large tables and logs when TableCell,
+LogEntry and StatusItem use __slots__ versus an instance __dict__ (a class with the
+same constructor and no __slots__).
+
+Usage:
+    python benchmarks/bench_value_objects.py --rows 100000 --columns 10 --log-lines 1000000
+"""
+
+import argparse
+import sys
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from email_widget.core.enums import StatusType  # noqa: E402
+from email_widget.widgets import log_widget  # noqa: E402
+from email_widget.widgets.log_widget import LogEntry, LogWidget  # noqa: E402
+from email_widget.widgets.status_widget import StatusItem  # noqa: E402
+from email_widget.widgets.table_widget import TableCell, TableWidget  # noqa: E402
+
+
+def without_slots(cls: type) -> type:
+    """Build a baseline class with the constructor of cls but an instance __dict__"""
+    return type(f"Dict{cls.__name__}", (), {"__init__": cls.__init__})
+
+
+DictTableCell = without_slots(TableCell)
+DictLogEntry = without_slots(LogEntry)
+DictStatusItem = without_slots(StatusItem)
+
+
+def peak_memory(func: Callable[[], Any]) -> int:
+    """Return the tracemalloc peak memory while func runs (bytes)"""
+    tracemalloc.start()
+    try:
+        # Keep the result alive until the peak is read, then release it
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        del result
+        return peak
+    finally:
+        tracemalloc.stop()
+
+
+def build_table(cell_class: type, rows: int, columns: int) -> TableWidget:
+    """Build a table made only of cell_class cells"""
+    statuses = (StatusType.SUCCESS, StatusType.WARNING, StatusType.ERROR)
+    return TableWidget().set_rows(
+        [
+            [cell_class(f"{r}-{c}", status=statuses[c % 3]) for c in range(columns)]
+            for r in range(rows)
+        ]
+    )
+
+
+def build_log(entry_class: type, lines: list[str]) -> LogWidget:
+    """Parse logs with entry_class as the log entry type"""
+    with mock.patch.object(log_widget, "LogEntry", entry_class):
+        return LogWidget().set_logs(lines)
+
+
+def build_status_items(item_class: type, count: int) -> list:
+    """Build count status items"""
+    return [item_class(f"Service {i}", "Up", StatusType.SUCCESS) for i in range(count)]
+
+
+def main() -> None:
+    """Run the benchmark and print the results"""
+    parser = argparse.ArgumentParser(description="Value object memory benchmark")
+    parser.add_argument("--rows", type=int, default=100_000, help="table rows")
+    parser.add_argument("--columns", type=int, default=10, help="table columns")
+    parser.add_argument("--log-lines", type=int, default=1_000_000, help="log lines")
+    parser.add_argument(
+        "--status-items", type=int, default=100_000, help="status items"
+    )
+    args = parser.parse_args()
+
+    levels = ("DEBUG", "INFO", "WARNING", "ERROR")
+    lines = [
+        f"2024-01-01 12:{i // 60 % 60:02d}:{i % 60:02d}.000 | {levels[i % 4]} | "
+        f"app.module:handler:{i % 500} - processed request {i}"
+        for i in range(args.log_lines)
+    ]
+
+    cases = (
+        (
+            f"TableCell ({args.rows}x{args.columns})",
+            lambda: build_table(DictTableCell, args.rows, args.columns),
+            lambda: build_table(TableCell, args.rows, args.columns),
+        ),
+        (
+            f"LogEntry ({args.log_lines} lines)",
+            lambda: build_log(DictLogEntry, lines),
+            lambda: build_log(LogEntry, lines),
+        ),
+        (
+            f"StatusItem ({args.status_items})",
+            lambda: build_status_items(DictStatusItem, args.status_items),
+            lambda: build_status_items(StatusItem, args.status_items),
+        ),
+    )
+
+    print(
+        f"{'case':<28} {'__dict__ MB':>12} {'__slots__ MB':>13} {'saved MB':>10} {'saved':>7}"
+    )
+    for label, dict_case, slots_case in cases:
+        dict_peak = peak_memory(dict_case)
+        slots_peak = peak_memory(slots_case)
+        saved = dict_peak - slots_peak
+        print(
+            f"{label:<28} {dict_peak / 1024 / 1024:12.1f} {slots_peak / 1024 / 1024:13.1f} "
+            f"{saved / 1024 / 1024:10.1f} {saved / dict_peak:7.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Local fake SMTP server
+
+For benchmarks only: implements on the loopback address the minimal SMTP subset needed
+to send an email (EHLO/HELO, AUTH PLAIN, MAIL, RCPT, DATA, RSET, NOOP, QUIT), accepts
+any credentials, and only counts received messages and bytes without delivering them.
+"""
+
+import socketserver
+import threading
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Handle a single SMTP session"""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self) -> None:
+        self.reply("220 localhost fake SMTP ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode("utf-8", "replace").strip()
+            verb = command.split(" ", 1)[0].upper()
+
+            if verb == "EHLO":
+                self.reply("250-localhost")
+                self.reply("250-AUTH PLAIN")
+                self.reply("250 SIZE 104857600")
+            elif verb == "AUTH":
+                self.reply("235 Authentication successful")
+            elif verb in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                size = 0
+                for data_line in self.rfile:
+                    if data_line == b".\r\n":
+                        break
+                    size += len(data_line)
+                self.server.record_message(size)
+                self.reply("250 OK: queued")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """Fake SMTP server running in a background thread
+
+    Examples:
+        >>> with FakeSMTPServer() as server:
+        ...     sender = MySender("user@example.com", "pw", smtp_server=server.host, smtp_port=server.port)
+        ...     sender.send(email)
+        ...     print(server.messages, server.bytes_received)
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _SMTPHandler)
+        self.messages = 0
+        self.bytes_received = 0
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def host(self) -> str:
+        return self.server_address[0]
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def record_message(self, size: int) -> None:
+        with self._lock:
+            self.messages += 1
+            self.bytes_received += size
+
+    def __enter__(self) -> "FakeSMTPServer":
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+EmailWidget benchmark suite
+
+Covers ingestion, rendering, caching and delivery paths at production scale:
+
+    table_set_dataframe     TableWidget.set_dataframe, 100k rows
+    log_set_logs            LogWidget.set_logs, 1M lines
+    email_export_500        Email.export_str, 500 widgets (cold render)
+    image_cache_churn       ImageCache mixed get/set load with constant eviction
+    chart_set_chart         ChartWidget.set_chart, matplotlib figure to PNG
+    sender_fake_smtp        EmailSender delivering to a local fake SMTP server
+
+Each benchmark records the best/mean time over several runs and optionally the
+tracemalloc peak memory; results are written as JSON. The thresholds file
+(thresholds.json) gives time/memory limits at scale=1, scaled linearly
+(fixed_seconds is a constant overhead independent of scale). With --baseline,
+results are also compared to a previous run and anything slower than
+--tolerance counts as a regression. Exits with status 1 when anything fails.
+
+Usage:
+    python benchmarks/suite.py --json results.json
+    python benchmarks/suite.py --scale 0.1 --only table_set_dataframe log_set_logs
+    python benchmarks/suite.py --baseline results.json --tolerance 0.2
+    pytest benchmarks/ --no-cov    # scale=0.05 by default, override with EMAILWIDGET_BENCH_SCALE
+"""
+
+import argparse
+import atexit
+import importlib.util
+import json
+import os
+import platform
+import random
+import shutil
+import smtplib
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from fake_smtp import FakeSMTPServer  # noqa: E402
+
+from email_widget import Email  # noqa: E402
+from email_widget.core.cache import ImageCache  # noqa: E402
+from email_widget.email_sender import EmailSender  # noqa: E402
+from email_widget.widgets import (  # noqa: E402
+    ChartWidget,
+    LogWidget,
+    TableWidget,
+)
+
+DEFAULT_THRESHOLDS = Path(__file__).parent / "thresholds.json"
+
+
+class SkipBenchmark(Exception):
+    """An optional dependency of the benchmark is missing."""
+
+
+class Benchmark:
+    """A single benchmark.
+
+    `setup(scale)` prepares the data and returns the zero-argument function
+    that is timed; setup time is not included in the results.
+    """
+
+    def __init__(
+        self, name: str, description: str, setup: Callable[[float], Callable[[], Any]]
+    ):
+        self.name = name
+        self.description = description
+        self.setup = setup
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(name: str, description: str):
+    """Decorator that registers a benchmark."""
+
+    def decorator(setup: Callable[[float], Callable[[], Any]]):
+        BENCHMARKS[name] = Benchmark(name, description, setup)
+        return setup
+
+    return decorator
+
+
+def _scaled(count: int, scale: float) -> int:
+    return max(1, int(count * scale))
+
+
+def _require(module: str) -> None:
+    if importlib.util.find_spec(module) is None:
+        raise SkipBenchmark(f"{module} is not installed")
+
+
+@benchmark(
+    "table_set_dataframe", "TableWidget.set_dataframe with 100k rows x 5 columns"
+)
+def _table_set_dataframe(scale: float) -> Callable[[], Any]:
+    _require("pandas")
+    import pandas as pd
+
+    rows = _scaled(100_000, scale)
+    statuses = [
+        {"text": "OK", "status": "success"},
+        {"text": "FAIL", "status": "error"},
+    ]
+    df = pd.DataFrame(
+        {
+            "id": range(rows),
+            "name": [f"item-{i}" for i in range(rows)],
+            "value": [i * 1.5 for i in range(rows)],
+            "region": [("EU", "US", "APAC")[i % 3] for i in range(rows)],
+            "status": [statuses[i % 2] for i in range(rows)],
+        }
+    )
+    return lambda: TableWidget().set_dataframe(df)
+
+
+@benchmark("log_set_logs", "LogWidget.set_logs with 1M loguru-style lines")
+def _log_set_logs(scale: float) -> Callable[[], Any]:
+    levels = ("DEBUG", "INFO", "WARNING", "ERROR")
+    lines = [
+        f"2024-01-01 12:{i // 60 % 60:02d}:{i % 60:02d}.000 | {levels[i % 4]} | "
+        f"app.module:handler:{i % 500} - processed request {i}"
+        for i in range(_scaled(1_000_000, scale))
+    ]
+    return lambda: LogWidget().set_logs(lines)
+
+
+@benchmark("email_export_500", "Email.export_str with 500 widgets, render cache cold")
+def _email_export_500(scale: float) -> Callable[[], Any]:
+    email = Email("Benchmark Report")
+    for i in range(_scaled(500, scale)):
+        kind = i % 5
+        if kind == 0:
+            email.add_text(f"Section {i}", font_size="18px")
+        elif kind == 1:
+            data = [[f"row-{r}", str(r), f"{r * 2.5:.1f}"] for r in range(20)]
+            email.add_table_from_data(data, ["Name", "Count", "Value"], f"Table {i}")
+        elif kind == 2:
+            email.add_metric(
+                title=f"Metrics {i}",
+                metrics=[(f"KPI {m}", m * 100, "units") for m in range(4)],
+            )
+        elif kind == 3:
+            email.add_progress(i % 100, label=f"Progress {i}")
+        else:
+            email.add_status_items(
+                [
+                    {"label": f"Service {s}", "value": "Up", "status": "success"}
+                    for s in range(5)
+                ],
+                title=f"Status {i}",
+            )
+
+    def run():
+        for widget in email.widgets:
+            widget.invalidate_render_cache()
+        return email.export_str()
+
+    return run
+
+
+@benchmark("image_cache_churn", "ImageCache get/set mix over 10x the cache capacity")
+def _image_cache_churn(scale: float) -> Callable[[], Any]:
+    tmp_dir = tempfile.mkdtemp(prefix="emailwidget_bench_cache_")
+    atexit.register(shutil.rmtree, tmp_dir, True)
+    cache = ImageCache(cache_dir=Path(tmp_dir), max_size=100)
+    payload = os.urandom(10 * 1024)
+    sources = [f"https://example.com/images/{i}.png" for i in range(1000)]
+    operations = _scaled(2000, scale)
+    rng = random.Random(42)
+    plan = [(rng.random() < 0.3, rng.choice(sources)) for _ in range(operations)]
+
+    def run():
+        for is_set, source in plan:
+            if is_set or cache.get(source) is None:
+                cache.set(source, payload, "image/png")
+
+    return run
+
+
+@benchmark(
+    "chart_set_chart", "ChartWidget.set_chart with a 10k point matplotlib line chart"
+)
+def _chart_set_chart(scale: float) -> Callable[[], Any]:
+    _require("matplotlib")
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    points = _scaled(10_000, scale)
+    xs = list(range(points))
+    ys = [((i * 7919) % 1000) / 10 for i in xs]
+
+    def run():
+        plt.figure(figsize=(8, 4))
+        plt.plot(xs, ys)
+        plt.title("Benchmark")
+        return ChartWidget().set_chart(plt)
+
+    return run
+
+
+class _LocalSender(EmailSender):
+    """Sender that connects to the local fake SMTP server."""
+
+    def _get_default_smtp_server(self) -> str:
+        return "127.0.0.1"
+
+    def _get_default_smtp_port(self) -> int:
+        return 25
+
+
+@benchmark(
+    "sender_fake_smtp",
+    "EmailSender.send of a 50 widget email to a local fake SMTP server",
+)
+def _sender_fake_smtp(scale: float) -> Callable[[], Any]:
+    email = Email("Benchmark Delivery")
+    for i in range(_scaled(50, scale)):
+        email.add_text(f"Paragraph {i}")
+        email.add_table_from_data(
+            [[str(r), f"v{r}"] for r in range(10)], ["#", "Value"]
+        )
+    sends = _scaled(20, scale)
+
+    server = FakeSMTPServer().__enter__()
+    atexit.register(server.__exit__, None, None, None)
+    sender = _LocalSender(
+        "bench@example.com", "password", smtp_server=server.host, smtp_port=server.port
+    )
+
+    def run():
+        received = server.messages
+        # The fake server only speaks plain SMTP, so skip the STARTTLS handshake
+        with mock.patch.object(smtplib.SMTP, "starttls"):
+            for _ in range(sends):
+                sender.send(email, to=["to@example.com"])
+        assert server.messages - received == sends
+
+    return run
+
+
+def run_benchmark(
+    bench: Benchmark, scale: float = 1.0, repeat: int = 3, memory: bool = False
+) -> dict[str, Any]:
+    """Run a single benchmark.
+
+    Args:
+        bench: The benchmark to run.
+        scale: Data scale factor, 1.0 is production scale.
+        repeat: Number of timed runs.
+        memory: Whether to run once more and record the tracemalloc peak memory.
+
+    Returns:
+        The result dictionary, containing "skipped" when the benchmark was skipped.
+    """
+    try:
+        func = bench.setup(scale)
+    except SkipBenchmark as e:
+        return {"skipped": str(e)}
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+
+    result: dict[str, Any] = {
+        "best_seconds": min(times),
+        "mean_seconds": statistics.mean(times),
+        "repeat": repeat,
+    }
+
+    if memory:
+        tracemalloc.start()
+        try:
+            func()
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return result
+
+
+def check_result(
+    name: str,
+    result: dict[str, Any],
+    scale: float,
+    thresholds: dict[str, Any],
+    baseline: dict[str, Any] | None = None,
+    tolerance: float = 0.25,
+) -> list[str]:
+    """Check a result against the thresholds and the baseline.
+
+    Args:
+        name: Benchmark name.
+        result: Result returned by run_benchmark.
+        scale: Scale factor the benchmark ran with.
+        thresholds: {name: {"max_seconds": float, "fixed_seconds": float, "max_peak_memory_mb": float}};
+            the time limit is fixed_seconds + max_seconds * scale and the memory
+            limit is max_peak_memory_mb * scale.
+        baseline: Previously saved JSON results.
+        tolerance: Fraction by which a result may be slower than the baseline.
+
+    Returns:
+        List of failure reasons, empty when the result passes.
+    """
+    if "skipped" in result:
+        return []
+
+    failures = []
+    limits = thresholds.get(name, {})
+    if "max_seconds" in limits:
+        budget = limits.get("fixed_seconds", 0.0) + limits["max_seconds"] * scale
+        if result["best_seconds"] > budget:
+            failures.append(
+                f"{name}: {result['best_seconds']:.3f}s exceeds budget {budget:.3f}s"
+            )
+    if "max_peak_memory_mb" in limits and "peak_memory_bytes" in result:
+        budget_mb = limits["max_peak_memory_mb"] * scale
+        peak_mb = result["peak_memory_bytes"] / 1024 / 1024
+        if peak_mb > budget_mb:
+            failures.append(
+                f"{name}: peak {peak_mb:.1f}MB exceeds budget {budget_mb:.1f}MB"
+            )
+
+    if baseline is not None:
+        previous = baseline.get("results", {}).get(name, {})
+        if baseline.get("scale") == scale and "best_seconds" in previous:
+            allowed = previous["best_seconds"] * (1 + tolerance)
+            if result["best_seconds"] > allowed:
+                failures.append(
+                    f"{name}: {result['best_seconds']:.3f}s is more than {tolerance:.0%} "
+                    f"slower than baseline {previous['best_seconds']:.3f}s"
+                )
+
+    return failures
+
+
+def load_thresholds(path: str | Path = DEFAULT_THRESHOLDS) -> dict[str, Any]:
+    """Read the thresholds file, returning an empty dict when it does not exist."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="EmailWidget benchmark suite")
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="Data scale factor, default 1.0 (production scale)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Timed runs per benchmark"
+    )
+    parser.add_argument(
+        "--memory", action="store_true", help="Record peak memory (slower)"
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        choices=sorted(BENCHMARKS),
+        help="Only run the given benchmarks",
+    )
+    parser.add_argument(
+        "--json", dest="json_path", help="JSON file to write results to"
+    )
+    parser.add_argument(
+        "--thresholds", default=str(DEFAULT_THRESHOLDS), help="Thresholds file"
+    )
+    parser.add_argument("--baseline", help="Previous results JSON to compare against")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown relative to the baseline",
+    )
+    args = parser.parse_args(argv)
+
+    thresholds = load_thresholds(args.thresholds)
+    baseline = None
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+
+    results: dict[str, Any] = {}
+    failures: list[str] = []
+    for name in args.only or BENCHMARKS:
+        bench = BENCHMARKS[name]
+        result = run_benchmark(bench, args.scale, args.repeat, args.memory)
+        results[name] = result
+        failures.extend(
+            check_result(name, result, args.scale, thresholds, baseline, args.tolerance)
+        )
+
+        if "skipped" in result:
+            print(f"⏭️  {name:<22} skipped: {result['skipped']}")
+            continue
+        line = f"⏱️  {name:<22} best {result['best_seconds'] * 1000:10.1f} ms   mean {result['mean_seconds'] * 1000:10.1f} ms"
+        if "peak_memory_bytes" in result:
+            line += f"   peak {result['peak_memory_bytes'] / 1024 / 1024:8.1f} MB"
+        print(line)
+
+    report = {
+        "scale": args.scale,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        "failures": failures,
+    }
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"📄 Results written to {args.json_path}")
+
+    for failure in failures:
+        print(f"❌ {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
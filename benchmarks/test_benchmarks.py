@@ -0,0 +1,61 @@
+"""
+pytest entry point for the benchmark suite
+
+Each registered benchmark becomes one test case, checked against the time and
+peak memory limits in thresholds.json. Runs at scale=0.05 by default; adjust
+with environment variables:
+
+    EMAILWIDGET_BENCH_SCALE     Data scale factor, 1.0 is production scale
+    EMAILWIDGET_BENCH_REPEAT    Timed runs per benchmark
+    EMAILWIDGET_BENCH_BASELINE  Previous results JSON to compare against
+    EMAILWIDGET_BENCH_JSON      JSON file to write results to
+
+Usage:
+    pytest benchmarks/ --no-cov
+    EMAILWIDGET_BENCH_SCALE=1 pytest benchmarks/ --no-cov -k table
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from suite import BENCHMARKS, check_result, load_thresholds, run_benchmark
+
+SCALE = float(os.environ.get("EMAILWIDGET_BENCH_SCALE", "0.05"))
+REPEAT = int(os.environ.get("EMAILWIDGET_BENCH_REPEAT", "1"))
+BASELINE_PATH = os.environ.get("EMAILWIDGET_BENCH_BASELINE")
+JSON_PATH = os.environ.get("EMAILWIDGET_BENCH_JSON")
+
+RESULTS: dict[str, dict] = {}
+
+
+@pytest.fixture(scope="module")
+def thresholds():
+    return load_thresholds()
+
+
+@pytest.fixture(scope="module")
+def baseline():
+    if not BASELINE_PATH:
+        return None
+    return json.loads(Path(BASELINE_PATH).read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="module", autouse=True)
+def write_results():
+    yield
+    if JSON_PATH:
+        report = {"scale": SCALE, "results": RESULTS}
+        Path(JSON_PATH).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+@pytest.mark.parametrize("name", sorted(BENCHMARKS))
+def test_benchmark(name, thresholds, baseline):
+    result = run_benchmark(BENCHMARKS[name], SCALE, REPEAT, memory=True)
+    RESULTS[name] = result
+    if "skipped" in result:
+        pytest.skip(result["skipped"])
+
+    failures = check_result(name, result, SCALE, thresholds, baseline)
+    assert not failures, "\n".join(failures)
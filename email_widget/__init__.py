@@ -18,69 +18,162 @@ Examples:
     >>> email.export_html("report.html")
 """
 
-# Core classes
-# Base classes (for advanced users to extend)
-from email_widget.core.base import BaseWidget
-
-# Configuration classes
-from email_widget.core.config import EmailConfig
-
-# Enums and types
-from email_widget.core.enums import (
-    AlertType,
-    IconType,
-    LayoutType,
-    LogLevel,
-    ProgressTheme,
-    SeparatorType,
-    StatusType,
-    TextAlign,
-    TextType,
-)
-
-# Validator system (for advanced users)
-from email_widget.core.validators import (
-    BaseValidator,
-    ChoicesValidator,
-    ColorValidator,
-    CompositeValidator,
-    EmailValidator,
-    LengthValidator,
-    NonEmptyStringValidator,
-    ProgressValidator,
-    RangeValidator,
-    SizeValidator,
-    TypeValidator,
-    UrlValidator,
-)
-from email_widget.email import Email
-
-# Email sender classes
-from email_widget.email_sender import (
-    EmailSender,
-    NetEaseEmailSender,
-    QQEmailSender,
-    create_email_sender,
-)
-from email_widget.widgets.alert_widget import AlertWidget
-from email_widget.widgets.button_widget import ButtonWidget
-from email_widget.widgets.card_widget import CardWidget
-from email_widget.widgets.chart_widget import ChartWidget
-from email_widget.widgets.checklist_widget import ChecklistWidget
-from email_widget.widgets.circular_progress_widget import CircularProgressWidget
-from email_widget.widgets.column_widget import ColumnWidget
-from email_widget.widgets.image_widget import ImageWidget
-from email_widget.widgets.log_widget import LogEntry, LogWidget
-from email_widget.widgets.metric_widget import MetricWidget
-from email_widget.widgets.progress_widget import ProgressWidget
-from email_widget.widgets.quote_widget import QuoteWidget
-from email_widget.widgets.separator_widget import SeparatorWidget
-from email_widget.widgets.status_widget import StatusItem, StatusWidget
-from email_widget.widgets.table_widget import TableCell, TableWidget
-
-# All widget components
-from email_widget.widgets.text_widget import TextWidget
-from email_widget.widgets.timeline_widget import TimelineWidget
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    # Core classes
+    # Base classes (for advanced users to extend)
+    from email_widget.core.base import BaseWidget, mutator
+
+    # Configuration classes
+    from email_widget.core.config import EmailConfig
+
+    # Enums and types
+    from email_widget.core.enums import (
+        AlertType,
+        IconType,
+        LayoutType,
+        LogLevel,
+        ProgressTheme,
+        SeparatorType,
+        StatusType,
+        TextAlign,
+        TextType,
+    )
+
+    # Validator system (for advanced users)
+    from email_widget.core.validators import (
+        BaseValidator,
+        ChoicesValidator,
+        ColorValidator,
+        CompositeValidator,
+        EmailValidator,
+        LengthValidator,
+        NonEmptyStringValidator,
+        ProgressValidator,
+        RangeValidator,
+        SizeValidator,
+        TypeValidator,
+        UrlValidator,
+    )
+    from email_widget.email import Email
+
+    # Email sender classes
+    from email_widget.email_sender import (
+        EmailSender,
+        NetEaseEmailSender,
+        QQEmailSender,
+        create_email_sender,
+    )
+    from email_widget.widgets.alert_widget import AlertWidget
+    from email_widget.widgets.button_widget import ButtonWidget
+    from email_widget.widgets.card_widget import CardWidget
+    from email_widget.widgets.chart_widget import ChartWidget
+    from email_widget.widgets.checklist_widget import ChecklistWidget
+    from email_widget.widgets.circular_progress_widget import CircularProgressWidget
+    from email_widget.widgets.column_widget import ColumnWidget
+    from email_widget.widgets.image_widget import ImageWidget
+    from email_widget.widgets.log_widget import LogEntry, LogWidget
+    from email_widget.widgets.metric_widget import MetricWidget
+    from email_widget.widgets.progress_widget import ProgressWidget
+    from email_widget.widgets.quote_widget import QuoteWidget
+    from email_widget.widgets.separator_widget import SeparatorWidget
+    from email_widget.widgets.status_widget import StatusItem, StatusWidget
+    from email_widget.widgets.table_widget import TableCell, TableWidget
+
+    # All widget components
+    from email_widget.widgets.text_widget import TextWidget
+    from email_widget.widgets.timeline_widget import TimelineWidget
+
+# Public name -> defining module. Modules are imported on first attribute
+# access (PEP 562), so `import email_widget` only pays for what a job uses.
+_LAZY_IMPORTS = {
+    # Core classes
+    "Email": "email_widget.email",
+    "BaseWidget": "email_widget.core.base",
+    "mutator": "email_widget.core.base",
+    "EmailConfig": "email_widget.core.config",
+    # Email senders
+    "EmailSender": "email_widget.email_sender",
+    "QQEmailSender": "email_widget.email_sender",
+    "NetEaseEmailSender": "email_widget.email_sender",
+    "create_email_sender": "email_widget.email_sender",
+    # Widget components
+    "TextWidget": "email_widget.widgets.text_widget",
+    "TableWidget": "email_widget.widgets.table_widget",
+    "TableCell": "email_widget.widgets.table_widget",
+    "ImageWidget": "email_widget.widgets.image_widget",
+    "ChartWidget": "email_widget.widgets.chart_widget",
+    "AlertWidget": "email_widget.widgets.alert_widget",
+    "ButtonWidget": "email_widget.widgets.button_widget",
+    "ChecklistWidget": "email_widget.widgets.checklist_widget",
+    "ProgressWidget": "email_widget.widgets.progress_widget",
+    "CircularProgressWidget": "email_widget.widgets.circular_progress_widget",
+    "CardWidget": "email_widget.widgets.card_widget",
+    "MetricWidget": "email_widget.widgets.metric_widget",
+    "StatusWidget": "email_widget.widgets.status_widget",
+    "StatusItem": "email_widget.widgets.status_widget",
+    "QuoteWidget": "email_widget.widgets.quote_widget",
+    "SeparatorWidget": "email_widget.widgets.separator_widget",
+    "TimelineWidget": "email_widget.widgets.timeline_widget",
+    "ColumnWidget": "email_widget.widgets.column_widget",
+    "LogWidget": "email_widget.widgets.log_widget",
+    "LogEntry": "email_widget.widgets.log_widget",
+    # Enum types
+    "TextType": "email_widget.core.enums",
+    "TextAlign": "email_widget.core.enums",
+    "AlertType": "email_widget.core.enums",
+    "StatusType": "email_widget.core.enums",
+    "ProgressTheme": "email_widget.core.enums",
+    "SeparatorType": "email_widget.core.enums",
+    "LayoutType": "email_widget.core.enums",
+    "LogLevel": "email_widget.core.enums",
+    "IconType": "email_widget.core.enums",
+    # Validators (for advanced users)
+    "BaseValidator": "email_widget.core.validators",
+    "ColorValidator": "email_widget.core.validators",
+    "SizeValidator": "email_widget.core.validators",
+    "RangeValidator": "email_widget.core.validators",
+    "ProgressValidator": "email_widget.core.validators",
+    "UrlValidator": "email_widget.core.validators",
+    "EmailValidator": "email_widget.core.validators",
+    "NonEmptyStringValidator": "email_widget.core.validators",
+    "LengthValidator": "email_widget.core.validators",
+    "TypeValidator": "email_widget.core.validators",
+    "ChoicesValidator": "email_widget.core.validators",
+    "CompositeValidator": "email_widget.core.validators",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import public names on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested class, enum or function
+
+    Raises:
+        AttributeError: If name is not part of the public API
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including public names not imported yet.
+
+    Returns:
+        Sorted attribute names, used by `dir()` and tab completion
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Version information
 __version__ = "0.23.1"
@@ -92,6 +185,7 @@ __all__ = [
     # Core classes
     "Email",
     "BaseWidget",
+    "mutator",
     "EmailConfig",
     # Email senders
     "EmailSender",
@@ -3,16 +3,70 @@
 This module defines the abstract base class for all widgets, providing basic functionality and interfaces.
 """
 
+import functools
+import time
 import uuid
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, Optional
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
 
 from email_widget.core.logger import get_project_logger
-from email_widget.core.template_engine import get_template_engine
+from email_widget.core.template_engine import get_template_engine, get_template_key
 
 if TYPE_CHECKING:
     from email_widget.email import Email
 
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Render cache counters shared by all widgets {"hits": int, "misses": int}
+_render_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+
+def mutator(method: F) -> F:
+    """Mark a widget method as a state mutator.
+
+    The wrapped method invalidates the widget's cached HTML every time it is called.
+    Widgets that set `RENDER_CACHE = True` must decorate every method that changes
+    rendering state, otherwise `render_html()` keeps returning the old HTML.
+
+    Args:
+        method: Widget method that changes rendering state.
+
+    Returns:
+        Wrapped method.
+
+    Examples:
+        ```python
+        from email_widget.core.base import BaseWidget, mutator
+
+        class GreetingWidget(BaseWidget):
+            TEMPLATE = "<div>{{ text }}</div>"
+            RENDER_CACHE = True
+
+            def __init__(self):
+                super().__init__()
+                self._text = ""
+
+            @mutator
+            def set_text(self, text: str) -> "GreetingWidget":
+                self._text = text
+                return self
+
+            def _get_template_name(self) -> str:
+                return "greeting.html"
+
+            def get_template_context(self) -> dict:
+                return {"text": self._text}
+        ```
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: "BaseWidget", *args: Any, **kwargs: Any) -> Any:
+        self._render_version += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
 
 class BaseWidget(ABC):
     """Abstract base class for all widgets.
@@ -20,6 +74,14 @@ class BaseWidget(ABC):
     This class defines the basic interface and common functionality that all widgets must implement.
     Each widget has a unique ID and can be added to an Email container.
 
+    Widgets that set `RENDER_CACHE = True` cache their rendered HTML. Every method
+    decorated with `mutator` bumps the widget's state version, and `render_html()`
+    only re-renders when that version has changed since the last render. The cache
+    is off by default so subclasses with plain setters always render fresh HTML;
+    all built-in widgets opt in. A subclass that opts in must decorate its own
+    state-changing methods with `mutator` or call `invalidate_render_cache()` after
+    changing state directly.
+
     Attributes:
         widget_id (str): Unique identifier for the widget.
         parent (Optional[Email]): Email container that contains this widget.
@@ -47,6 +109,10 @@ class BaseWidget(ABC):
         ```
     """
 
+    # Whether render_html() may reuse HTML from a previous render. Only safe when
+    # every state-changing method is decorated with `mutator`.
+    RENDER_CACHE: bool = False
+
     def __init__(self, widget_id: str | None = None):
         """Initialize BaseWidget.
 
@@ -57,6 +123,9 @@ class BaseWidget(ABC):
         self._parent: Email | None = None
         self._template_engine = get_template_engine()
         self._logger = get_project_logger()
+        self._render_version: int = 0
+        self._cached_html: str | None = None
+        self._cached_version: Any = None
 
     @property
     def widget_id(self) -> str:
@@ -76,6 +145,34 @@ class BaseWidget(ABC):
         """
         return self._parent
 
+    def __getstate__(self) -> dict[str, Any]:
+        """Get picklable widget state.
+
+        The template engine, logger and parent container are process-local and are
+        left out, so widgets can be sent to worker processes for rendering. Cached
+        HTML is dropped too, since a widget is only sent to a worker to be rendered.
+
+        Returns:
+            Dict[str, Any]: Widget state without process-local helpers.
+        """
+        state = self.__dict__.copy()
+        state.pop("_template_engine", None)
+        state.pop("_logger", None)
+        state["_parent"] = None
+        state["_cached_html"] = None
+        state["_cached_version"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore widget state and reattach process-local helpers.
+
+        Args:
+            state (Dict[str, Any]): State produced by `__getstate__`.
+        """
+        self.__dict__.update(state)
+        self._template_engine = get_template_engine()
+        self._logger = get_project_logger()
+
     def _set_parent(self, parent: "Email") -> None:
         """Set the parent container for the widget.
 
@@ -132,32 +229,168 @@ class BaseWidget(ABC):
             print(html)  # <div>Hello World</div>
             ```
         """
+        cached_html, render_version = self._lookup_cached_html()
+        if cached_html is not None:
+            return cached_html
+
+        html, succeeded = self._render_template()
+
+        # Only successful renders are cached so failures are retried
+        if succeeded:
+            self._store_cached_html(html, render_version)
+        return html
+
+    def _lookup_cached_html(self) -> tuple[str | None, Any]:
+        """Look up cached HTML and record a render cache hit or miss.
+
+        Returns:
+            Tuple[Optional[str], Any]: Cached HTML if it is still valid (else None),
+                and the current render version (None when caching is disabled).
+        """
+        render_version = self._get_render_version() if self.RENDER_CACHE else None
+        if render_version is not None and self._cached_html is not None:
+            if render_version == self._cached_version:
+                _render_cache_stats["hits"] += 1
+                return self._cached_html, render_version
+        _render_cache_stats["misses"] += 1
+        return None, render_version
+
+    def _store_cached_html(self, html: str, render_version: Any) -> None:
+        """Cache successfully rendered HTML for the given render version.
+
+        Args:
+            html (str): Rendered HTML.
+            render_version (Any): Version returned by `_lookup_cached_html()` before
+                rendering; nothing is cached when it is None.
+        """
+        if render_version is not None:
+            self._cached_html = html
+            self._cached_version = render_version
+
+    def render_html_stream(self) -> Iterator[str]:
+        """Render the widget as a stream of HTML chunks.
+
+        Used by `Email.export_stream()` so widgets with large content can emit
+        their HTML piece by piece. The default yields `render_html()` as a single chunk.
+
+        Yields:
+            str: HTML chunks in document order.
+        """
+        yield self.render_html()
+
+    def render_profiled(self) -> tuple[str, dict[str, float]]:
+        """Render the widget while timing each rendering stage.
+
+        Always renders, bypassing the render cache. Used by `Email.render_profile()`.
+
+        Returns:
+            Tuple[str, Dict[str, float]]: Rendered HTML and the seconds spent in
+                `get_template_context()` ("context"), template lookup/compilation
+                ("template") and template rendering ("render").
+        """
+        timings: dict[str, float] = {}
+        html, _ = self._render_template(timings)
+        return html, timings
+
+    def _render_template(
+        self, timings: dict[str, float] | None = None
+    ) -> tuple[str, bool]:
+        """Render the widget template without consulting the render cache.
+
+        Args:
+            timings (Optional[Dict[str, float]]): If given, receives stage timings.
+
+        Returns:
+            Tuple[str, bool]: Rendered HTML (or error fallback) and whether rendering succeeded.
+        """
         try:
             # Check if template is defined
             if not hasattr(self, "TEMPLATE") or not self.TEMPLATE:
                 self._logger.warning(
                     f"Widget {self.__class__.__name__} has no TEMPLATE defined"
                 )
-                return self._render_error_fallback("Template not defined")
+                return self._render_error_fallback("Template not defined"), False
 
             # Get template context
-            context = self.get_template_context()
+            if timings is None:
+                context = self.get_template_context()
+            else:
+                start = time.perf_counter()
+                context = self.get_template_context()
+                timings["context"] = time.perf_counter() - start
             if not isinstance(context, dict):
                 self._logger.error(
                     f"Widget {self.widget_id} get_template_context returned non-dict type"
                 )
-                return self._render_error_fallback("Context data error")
+                return self._render_error_fallback("Context data error"), False
 
             # Render template
-            return self._template_engine.render_safe(
+            fallback = self._render_error_fallback("Template rendering failed")
+            html = self._template_engine.render_safe(
                 self.TEMPLATE,
                 context,
-                fallback=self._render_error_fallback("Template rendering failed"),
+                fallback=fallback,
+                name=get_template_key(type(self)),
+                timings=timings,
             )
+            return html, html is not fallback
 
         except Exception as e:
             self._logger.error(f"Widget {self.widget_id} rendering failed: {e}")
-            return self._render_error_fallback(f"Rendering exception: {e}")
+            return self._render_error_fallback(f"Rendering exception: {e}"), False
+
+    def _get_render_version(self) -> Any:
+        """Get the state version used to validate cached HTML.
+
+        Container widgets override this to include the versions of their children.
+
+        Returns:
+            Any: Hashable value that changes whenever the rendered output may change.
+        """
+        return self._render_version
+
+    def invalidate_render_cache(self) -> "BaseWidget":
+        """Discard cached HTML so the next `render_html()` renders again.
+
+        Only needed when widget state is changed without going through a method
+        decorated with `mutator`.
+
+        Returns:
+            BaseWidget: Returns self to support method chaining.
+
+        Examples:
+            >>> widget._rows.append(["manual", "row"])
+            >>> widget.invalidate_render_cache()
+        """
+        self._render_version += 1
+        self._cached_html = None
+        return self
+
+    @staticmethod
+    def get_render_cache_stats() -> dict[str, Any]:
+        """Get render cache statistics shared by all widgets.
+
+        Returns:
+            Dict[str, Any]: Hit count, miss count and hit rate.
+
+        Examples:
+            >>> stats = BaseWidget.get_render_cache_stats()
+            >>> print(f"Hit rate: {stats['hit_rate']:.1%}")
+        """
+        hits = _render_cache_stats["hits"]
+        misses = _render_cache_stats["misses"]
+        total = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / total if total > 0 else 0,
+        }
+
+    @staticmethod
+    def reset_render_cache_stats() -> None:
+        """Reset the shared render cache hit and miss counters."""
+        _render_cache_stats["hits"] = 0
+        _render_cache_stats["misses"] = 0
 
     @abstractmethod
     def get_template_context(self) -> dict[str, Any]:
@@ -195,6 +428,7 @@ class BaseWidget(ABC):
         </div>
         """
 
+    @mutator
     def set_widget_id(self, widget_id: str) -> "BaseWidget":
         """Set the widget ID.
 
@@ -1,36 +1,271 @@
 """EmailWidget caching system
 
-Provides image cache management functionality with LRU strategy and filesystem storage.
+Provides image cache management functionality with pluggable eviction policies
+(LRU, LFU, GDSF), count/byte/age limits, an in-memory hot tier and filesystem storage.
 """
 
+import atexit
+import base64
 import hashlib
+import heapq
+import itertools
 import json
+import logging
+import os
 import time
+import weakref
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
 from contextlib import suppress
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 
 from email_widget.core.logger import get_project_logger
 
+# Environment variables providing ImageCache defaults
+IMAGE_CACHE_MAX_SIZE_ENV = "EMAILWIDGET_IMAGE_CACHE_MAX_SIZE"
+IMAGE_CACHE_MAX_BYTES_ENV = "EMAILWIDGET_IMAGE_CACHE_MAX_BYTES"
+IMAGE_CACHE_TTL_ENV = "EMAILWIDGET_IMAGE_CACHE_TTL"
+IMAGE_CACHE_POLICY_ENV = "EMAILWIDGET_IMAGE_CACHE_POLICY"
+IMAGE_CACHE_MEMORY_BYTES_ENV = "EMAILWIDGET_IMAGE_CACHE_MEMORY_BYTES"
+
+DEFAULT_MAX_SIZE = 100
+DEFAULT_MEMORY_BYTES = 16 * 1024 * 1024
+
+# The journal is compacted into the index file once it holds more entries than this
+# or than the index itself, so compaction cost stays amortized O(1) per operation
+_JOURNAL_MIN_ENTRIES = 256
+
+# Live caches, their unsaved access times are flushed when the interpreter exits
+_live_caches: "weakref.WeakSet[ImageCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_caches() -> None:
+    """Write pending access times of all live caches at interpreter exit"""
+    for cache in list(_live_caches):
+        if cache._dirty:
+            cache.flush()
+
+
+_N = TypeVar("_N", int, float)
+
+
+def _env_number(name: str, cast: Callable[[str], _N]) -> _N | None:
+    """Read a numeric environment variable, None if it is unset or empty"""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return cast(value)
+    except ValueError:
+        raise ValueError(f"Invalid value for {name}: {value!r}") from None
+
+
+class EvictionPolicy(ABC):
+    """Eviction policy abstract base class.
+
+    An eviction policy chooses which item `ImageCache` removes when the cache exceeds
+    its item count or byte limit. The cache reports every insert, access and removal,
+    and the index it passes to `select_victim` is ordered from least to most recently
+    used. A policy instance belongs to a single cache.
+
+    Examples:
+        ```python
+        class LargestFirstPolicy(EvictionPolicy):
+            def select_victim(self, index):
+                return max(index, key=lambda key: index[key].get("size", 0))
+
+            @property
+            def policy_name(self) -> str:
+                return "largest"
+
+        cache = ImageCache(policy=LargestFirstPolicy())
+        ```
+    """
+
+    def reset(self, index: "OrderedDict[str, dict[str, Any]]") -> None:
+        """Rebuild policy state after the index was loaded or cleared.
+
+        Args:
+            index: Cache index, least recently used item first.
+        """
+        for cache_key, cache_info in index.items():
+            self.on_insert(cache_key, cache_info)
+
+    def on_insert(self, cache_key: str, cache_info: dict[str, Any]) -> None:  # noqa: B027
+        """Called after an item was stored."""
+
+    def on_access(self, cache_key: str, cache_info: dict[str, Any]) -> None:  # noqa: B027
+        """Called after a cache hit updated the item's access time and hit count."""
+
+    def on_remove(self, cache_key: str) -> None:  # noqa: B027
+        """Called after an item was removed for any reason."""
+
+    @abstractmethod
+    def select_victim(self, index: "OrderedDict[str, dict[str, Any]]") -> str:
+        """Choose the next item to evict.
+
+        Args:
+            index: Non-empty cache index, least recently used item first.
+
+        Returns:
+            str: Cache key of the item to evict.
+        """
+        pass
+
+    @property
+    @abstractmethod
+    def policy_name(self) -> str:
+        """Policy name.
+
+        Returns:
+            str: Unique name identifier for the policy.
+        """
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Least recently used eviction, O(1) because the index is kept in LRU order."""
+
+    def select_victim(self, index: "OrderedDict[str, dict[str, Any]]") -> str:
+        """Return the least recently used item"""
+        return next(iter(index))
+
+    @property
+    def policy_name(self) -> str:
+        return "lru"
+
+
+class _PriorityPolicy(EvictionPolicy):
+    """Evicts the item with the lowest priority, using a heap with lazy deletion.
+
+    Updated and removed items leave stale heap entries behind that are skipped when
+    they reach the top; the heap is rebuilt once stale entries outnumber live ones.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[float, int, str]] = []
+        self._entries: dict[str, tuple[float, int, str]] = {}
+        self._counter = itertools.count()
+
+    @abstractmethod
+    def _priority(self, cache_info: dict[str, Any]) -> float:
+        """Priority of an item, lower priorities are evicted first"""
+
+    def reset(self, index: "OrderedDict[str, dict[str, Any]]") -> None:
+        self._heap = []
+        self._entries = {}
+        super().reset(index)
+
+    def on_insert(self, cache_key: str, cache_info: dict[str, Any]) -> None:
+        # The counter breaks ties in favour of evicting the less recently used item
+        entry = (self._priority(cache_info), next(self._counter), cache_key)
+        self._entries[cache_key] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    on_access = on_insert
+
+    def on_remove(self, cache_key: str) -> None:
+        self._entries.pop(cache_key, None)
+
+    def select_victim(self, index: "OrderedDict[str, dict[str, Any]]") -> str:
+        """Return the item with the lowest priority"""
+        while self._heap:
+            entry = self._heap[0]
+            if self._entries.get(entry[2]) is entry and entry[2] in index:
+                return entry[2]
+            heapq.heappop(self._heap)
+        # Items added to the index without going through the cache
+        return next(iter(index))
+
+
+class LFUPolicy(_PriorityPolicy):
+    """Least frequently used eviction, ties evict the least recently used item."""
+
+    def _priority(self, cache_info: dict[str, Any]) -> float:
+        return float(cache_info.get("hits", 1))
+
+    @property
+    def policy_name(self) -> str:
+        return "lfu"
+
+
+class GDSFPolicy(_PriorityPolicy):
+    """Greedy-Dual-Size-Frequency eviction.
+
+    Priority is `L + hits / size`, so large, rarely used images are evicted before
+    small, popular ones. `L` is raised to the priority of every evicted item, which
+    ages out items that were popular long ago.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._inflation = 0.0
+
+    def _priority(self, cache_info: dict[str, Any]) -> float:
+        hits: int = cache_info.get("hits", 1)
+        size: int = cache_info.get("size", 0)
+        return self._inflation + hits / max(size, 1)
+
+    def select_victim(self, index: "OrderedDict[str, dict[str, Any]]") -> str:
+        cache_key = super().select_victim(index)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            self._inflation = entry[0]
+        return cache_key
+
+    @property
+    def policy_name(self) -> str:
+        return "gdsf"
+
+
+# Built-in eviction policies by name
+EVICTION_POLICIES: dict[str, type[EvictionPolicy]] = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "gdsf": GDSFPolicy,
+}
+
 
 class ImageCache:
-    """LRU cache system for improving image processing performance.
+    """Image cache system for improving image processing performance.
 
-    This cache manager uses the Least Recently Used (LRU) strategy to manage image data,
-    supports storing images to the filesystem, and maintains an in-memory index for fast lookup.
-    This significantly improves performance when embedding large amounts of images in emails by
-    avoiding redundant downloading and processing.
+    This cache manager evicts image data with a configurable policy, Least Recently
+    Used (LRU) by default, supports storing images to the filesystem, and maintains an
+    in-memory index for fast lookup. This significantly improves performance when
+    embedding large amounts of images in emails by avoiding redundant downloading and
+    processing.
 
     Core Features:
-        - **LRU Strategy**: Automatically evicts least recently used cache items.
+        - **Eviction Policies**: LRU, LFU, size-aware GDSF or a custom
+          `EvictionPolicy`.
+        - **Limits**: Item count (`max_size`), total bytes (`max_bytes`) and item age
+          (`ttl`).
         - **Filesystem Storage**: Persists image data to local files, reducing memory usage.
-        - **Memory Index**: Fast cache item lookup, improving access speed.
-        - **Performance Monitoring**: Provides cache hit rate and size statistics.
+        - **Memory Tier**: Recently used images are also kept in memory up to
+          `memory_bytes`, repeated hits within a process never touch the filesystem.
+          Their encoded data URIs are kept as well, see `get_data_uri`.
+        - **Memory Index**: Fast cache item lookup, kept in least to most recently used
+          order so lookup, access updates and eviction are all O(1).
+        - **Journaled Index**: New and removed items are appended to a journal file, the
+          full index is only rewritten when the journal is compacted, and access times
+          are flushed every `flush_interval` seconds and at interpreter exit.
+        - **Performance Monitoring**: Provides cache size statistics and eviction
+          counts by reason.
 
     Attributes:
         _cache_dir (Path): Directory for storing cache files.
         _max_size (int): Maximum number of items allowed in cache.
-        _cache_index (Dict[str, Dict[str, Any]]): In-memory cache index.
+        _max_bytes (Optional[int]): Maximum total size of cached images in bytes.
+        _ttl (Optional[float]): Default maximum age of cached items in seconds.
+        _policy (EvictionPolicy): Policy choosing which items to evict.
+        _cache_index (OrderedDict[str, Dict[str, Any]]): In-memory cache index, least
+            recently used item first.
 
     Examples:
         ```python
@@ -57,15 +292,71 @@ class ImageCache:
         ```
     """
 
-    def __init__(self, cache_dir: Path | None = None, max_size: int = 100):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_size: int | None = None,
+        flush_interval: float = 30.0,
+        max_bytes: int | None = None,
+        ttl: float | None = None,
+        policy: str | EvictionPolicy | None = None,
+        memory_bytes: int | None = None,
+    ) -> None:
         """Initialize the cache manager.
 
         Args:
             cache_dir (Optional[Path]): Cache directory path, defaults to `emailwidget_cache` in system temp directory.
-            max_size (int): Maximum number of items allowed in cache, defaults to 100.
+            max_size (Optional[int]): Maximum number of items allowed in cache.
+                Defaults to the `EMAILWIDGET_IMAGE_CACHE_MAX_SIZE` environment variable,
+                then 100.
+            flush_interval (float): Seconds between index writes caused only by updated
+                access times, defaults to 30. A crash loses at most this much access
+                time history, cached items themselves are journaled immediately.
+            max_bytes (Optional[int]): Maximum total size of cached images in bytes.
+                Defaults to the `EMAILWIDGET_IMAGE_CACHE_MAX_BYTES` environment
+                variable; unlimited if neither is set.
+            ttl (Optional[float]): Maximum age of cached items in seconds, can be
+                overridden per item in `set`. Defaults to the
+                `EMAILWIDGET_IMAGE_CACHE_TTL` environment variable; items never expire
+                if neither is set.
+            policy (Optional[Union[str, EvictionPolicy]]): "lru", "lfu", "gdsf" or an
+                `EvictionPolicy` instance. Defaults to the
+                `EMAILWIDGET_IMAGE_CACHE_POLICY` environment variable, then "lru".
+            memory_bytes (Optional[int]): Byte budget of the in-memory tier in front of
+                the filesystem. Defaults to the `EMAILWIDGET_IMAGE_CACHE_MEMORY_BYTES`
+                environment variable, then 16 MiB; 0 disables the memory tier.
+
+        Raises:
+            ValueError: If the policy name or an environment variable value is invalid.
         """
         self._logger = get_project_logger()
-        self._max_size = max_size
+
+        if max_size is None:
+            max_size = _env_number(IMAGE_CACHE_MAX_SIZE_ENV, int)
+        self._max_size = DEFAULT_MAX_SIZE if max_size is None else max_size
+        self._max_bytes = (
+            _env_number(IMAGE_CACHE_MAX_BYTES_ENV, int)
+            if max_bytes is None
+            else max_bytes
+        )
+        self._ttl = _env_number(IMAGE_CACHE_TTL_ENV, float) if ttl is None else ttl
+        if memory_bytes is None:
+            memory_bytes = _env_number(IMAGE_CACHE_MEMORY_BYTES_ENV, int)
+        self._max_memory_bytes = (
+            DEFAULT_MEMORY_BYTES if memory_bytes is None else memory_bytes
+        )
+        self._flush_interval = flush_interval
+
+        if policy is None:
+            policy = os.getenv(IMAGE_CACHE_POLICY_ENV) or "lru"
+        if isinstance(policy, str):
+            if policy.lower() not in EVICTION_POLICIES:
+                raise ValueError(
+                    f"Invalid eviction policy: {policy}, "
+                    f"must be one of {', '.join(EVICTION_POLICIES)}"
+                )
+            policy = EVICTION_POLICIES[policy.lower()]()
+        self._policy = policy
 
         # Set cache directory
         if cache_dir is None:
@@ -76,30 +367,139 @@ class ImageCache:
         self._cache_dir = Path(cache_dir)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
-        # Cache index file
+        # Cache index file and the journal of changes made since it was written
         self._index_file = self._cache_dir / "cache_index.json"
-
-        # In-memory cache index {cache_key: {"file_path": str, "access_time": float, "size": int}}
-        self._cache_index: dict[str, dict[str, Any]] = {}
+        self._journal_file = self._cache_dir / "cache_index.journal"
+
+        # In-memory cache index, least recently used first
+        # {cache_key: {"file_path": str, "access_time": float, "size": int}}
+        self._cache_index: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+        # Total size of cached items, expiry heap [(expires_at, cache_key)] and
+        # eviction counts
+        self._total_bytes = 0
+        self._expiry_heap: list[tuple[float, str]] = []
+        self._evictions = {"max_size": 0, "max_bytes": 0, "expired": 0}
+
+        # Memory tier {cache_key: data}, least recently used first, encoded data URIs of
+        # items in the memory tier {cache_key: data_uri}, and hit counts per tier
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._data_uris: dict[str, str] = {}
+        self._memory_bytes = 0
+        self._tier_hits = {"memory": 0, "disk": 0}
+        self._misses = 0
+
+        # Journal entries not yet compacted, and whether access times changed since
+        # the last write
+        self._journal_entries = 0
+        self._dirty = False
+        self._last_flush = time.monotonic()
 
         # Load existing cache index
         self._load_cache_index()
+        _live_caches.add(self)
 
-        self._logger.debug(f"Image cache initialization complete, cache directory: {self._cache_dir}")
+        self._logger.debug(
+            "Image cache initialization complete, cache directory: %s", self._cache_dir
+        )
 
     def _load_cache_index(self) -> None:
-        """Load cache index from file"""
+        """Load cache index from file and replay the journal on top of it"""
         if self._index_file.exists():
             with suppress(Exception):
                 with open(self._index_file, encoding="utf-8") as f:
-                    self._cache_index = json.load(f)
-                self._logger.debug(f"Loaded cache index, {len(self._cache_index)} items")
+                    index = json.load(f)
+                # Index files of older versions are not stored in LRU order
+                self._cache_index = OrderedDict(
+                    sorted(index.items(), key=lambda x: x[1].get("access_time", 0))
+                )
+                self._logger.debug(
+                    "Loaded cache index, %d items", len(self._cache_index)
+                )
+
+        self._journal_entries = 0
+        if self._journal_file.exists():
+            with suppress(Exception):
+                with open(self._journal_file, encoding="utf-8") as f:
+                    for line in f:
+                        self._journal_entries += 1
+                        try:
+                            entry = json.loads(line)
+                        except ValueError:
+                            # Torn last line of a crashed write
+                            continue
+                        if "v" in entry:
+                            self._cache_index[entry["k"]] = entry["v"]
+                            self._cache_index.move_to_end(entry["k"])
+                        else:
+                            self._cache_index.pop(entry["k"], None)
+                self._logger.debug(
+                    "Replayed %d cache journal entries", self._journal_entries
+                )
+
+        self._total_bytes = sum(
+            info.get("size", 0) for info in self._cache_index.values()
+        )
+        self._expiry_heap = []
+        for cache_key, cache_info in self._cache_index.items():
+            # Items stored without an expiry time follow the current ttl
+            if "expires_at" not in cache_info and self._ttl is not None:
+                created = cache_info.get(
+                    "created_time", cache_info.get("access_time", 0)
+                )
+                cache_info["expires_at"] = created + self._ttl
+            if cache_info.get("expires_at") is not None:
+                self._expiry_heap.append((cache_info["expires_at"], cache_key))
+        heapq.heapify(self._expiry_heap)
+        self._policy.reset(self._cache_index)
 
     def _save_cache_index(self) -> None:
-        """Save cache index to file"""
+        """Save the full cache index to file and truncate the journal
+
+        The index is written to a temporary file and moved into place, so a crash
+        never leaves a partially written index behind.
+        """
+        with suppress(Exception):
+            tmp_file = self._index_file.with_suffix(".tmp")
+            with open(tmp_file, "w", encoding="utf-8") as f:
+                json.dump(self._cache_index, f, ensure_ascii=False)
+            os.replace(tmp_file, self._index_file)
+            with open(self._journal_file, "w", encoding="utf-8"):
+                pass
+            self._journal_entries = 0
+            self._dirty = False
+            self._last_flush = time.monotonic()
+
+    def _append_journal(
+        self, cache_key: str, cache_info: dict[str, Any] | None
+    ) -> None:
+        """Record a stored (cache_info) or removed (None) item in the journal
+
+        Args:
+            cache_key: Cache key
+            cache_info: Cache information, None when the item was removed
+        """
+        entry = (
+            {"k": cache_key}
+            if cache_info is None
+            else {"k": cache_key, "v": cache_info}
+        )
         with suppress(Exception):
-            with open(self._index_file, "w", encoding="utf-8") as f:
-                json.dump(self._cache_index, f, ensure_ascii=False, indent=2)
+            with open(self._journal_file, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._journal_entries += 1
+
+        if self._journal_entries > max(len(self._cache_index), _JOURNAL_MIN_ENTRIES):
+            self._save_cache_index()
+
+    def flush(self) -> None:
+        """Write pending access time updates to the index file.
+
+        Called automatically every `flush_interval` seconds and at interpreter exit;
+        call it directly before handing the cache directory to another process.
+        """
+        if self._dirty or self._journal_entries:
+            self._save_cache_index()
 
     def _generate_cache_key(self, source: str) -> str:
         """Generate cache key
@@ -112,30 +512,45 @@ class ImageCache:
         """
         return hashlib.md5(source.encode("utf-8")).hexdigest()
 
-    def _cleanup_old_cache(self) -> None:
-        """Clean up expired cache items"""
-        if len(self._cache_index) <= self._max_size:
-            return
-
-        # Sort by access time, delete least recently accessed items
-        sorted_items = sorted(
-            self._cache_index.items(), key=lambda x: x[1].get("access_time", 0)
-        )
-
-        # Delete items exceeding the limit
-        items_to_remove = sorted_items[: len(self._cache_index) - self._max_size]
-
-        for cache_key, cache_info in items_to_remove:
-            self._remove_cache_item(cache_key, cache_info)
+    def _purge_expired(self) -> None:
+        """Remove items whose expiry time has passed"""
+        now = time.time()
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, cache_key = heapq.heappop(self._expiry_heap)
+            cache_info = self._cache_index.get(cache_key)
+            # Skip heap entries of items that were removed or stored again since
+            if cache_info is not None and cache_info.get("expires_at") == expires_at:
+                self._remove_cache_item(cache_key, cache_info, "expired")
 
-        self._logger.debug(f"Cleaned {len(items_to_remove)} expired cache items")
-
-    def _remove_cache_item(self, cache_key: str, cache_info: dict[str, Any]) -> None:
+    def _cleanup_old_cache(self) -> None:
+        """Clean up expired cache items and evict items over the size limits"""
+        self._purge_expired()
+        removed = 0
+
+        while self._cache_index:
+            if len(self._cache_index) > self._max_size:
+                reason = "max_size"
+            elif self._max_bytes is not None and self._total_bytes > self._max_bytes:
+                reason = "max_bytes"
+            else:
+                break
+            cache_key = self._policy.select_victim(self._cache_index)
+            self._remove_cache_item(cache_key, self._cache_index[cache_key], reason)
+            removed += 1
+
+        if removed:
+            self._logger.debug("Cleaned %d expired cache items", removed)
+
+    def _remove_cache_item(
+        self, cache_key: str, cache_info: dict[str, Any], reason: str | None = None
+    ) -> None:
         """Delete a single cache item
 
         Args:
             cache_key: Cache key
             cache_info: Cache information
+            reason: Eviction reason counted in the statistics, "max_size", "max_bytes"
+                or "expired"; None for removals that are not evictions
         """
         # Delete file
         file_path = Path(cache_info.get("file_path", ""))
@@ -143,8 +558,14 @@ class ImageCache:
             with suppress(Exception):
                 file_path.unlink()
 
-        # Remove from index
-        self._cache_index.pop(cache_key, None)
+        # Remove from memory tier and index
+        self._demote(cache_key)
+        if self._cache_index.pop(cache_key, None) is not None:
+            self._total_bytes -= cache_info.get("size", 0)
+            self._policy.on_remove(cache_key)
+            if reason is not None:
+                self._evictions[reason] += 1
+            self._append_journal(cache_key, None)
 
     def get(self, source: str) -> tuple[bytes, str] | None:
         """Get image data from cache.
@@ -156,52 +577,210 @@ class ImageCache:
             Optional[Tuple[bytes, str]]: If cache found, returns (image binary data, MIME type) tuple;
                                          otherwise returns None.
         """
+        item = self._get_item(source)
+        if item is None:
+            return None
+        _, cache_info, data = item
+        return data, cache_info.get("mime_type", "image/png")
+
+    def get_data_uri(self, source: str) -> str | None:
+        """Get a cached image as a ready-to-embed `data:<mime>;base64,...` URI.
+
+        The encoded URI is kept in the memory tier next to the image data, so repeated
+        embeds of the same image skip base64 encoding as well as the filesystem.
+
+        Args:
+            source (str): Image source (URL or file path), used to generate cache key.
+
+        Returns:
+            Optional[str]: Data URI if cache found, otherwise None.
+        """
+        item = self._get_item(source)
+        if item is None:
+            return None
+        cache_key, cache_info, data = item
+
+        data_uri = self._data_uris.get(cache_key)
+        if data_uri is None:
+            mime_type = cache_info.get("mime_type", "image/png")
+            data_uri = (
+                f"data:{mime_type};base64,{base64.b64encode(data).decode('ascii')}"
+            )
+            self._store_data_uri(cache_key, data_uri)
+        return data_uri
+
+    def _get_item(self, source: str) -> tuple[str, dict[str, Any], bytes] | None:
+        """Look up an item in the memory tier, then the filesystem tier, record the hit
+
+        Args:
+            source: Image source (URL or file path)
+
+        Returns:
+            (cache key, cache information, image data) tuple, or None on a miss
+        """
         cache_key = self._generate_cache_key(source)
 
         if cache_key not in self._cache_index:
+            self._misses += 1
             return None
 
         cache_info = self._cache_index[cache_key]
+
+        # Check if the item has expired
+        expires_at = cache_info.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self._remove_cache_item(cache_key, cache_info, "expired")
+            self._misses += 1
+            return None
+
+        # Memory tier hits never touch the filesystem
+        data = self._memory.get(cache_key)
+        if data is not None:
+            self._memory.move_to_end(cache_key)
+            self._tier_hits["memory"] += 1
+        else:
+            data = self._read_from_disk(cache_key, cache_info)
+            if data is None:
+                self._misses += 1
+                return None
+            self._tier_hits["disk"] += 1
+            self._promote(cache_key, data)
+
+        # Update access time and hit count, written to disk with the next flush
+        cache_info["access_time"] = time.time()
+        cache_info["hits"] = cache_info.get("hits", 1) + 1
+        self._cache_index.move_to_end(cache_key)
+        self._policy.on_access(cache_key, cache_info)
+        self._dirty = True
+        if time.monotonic() - self._last_flush >= self._flush_interval:
+            self._save_cache_index()
+
+        if self._logger.is_enabled_for(logging.DEBUG):
+            self._logger.debug("Retrieved image from cache: %s... ", source[:50])
+        return cache_key, cache_info, data
+
+    def _read_from_disk(
+        self, cache_key: str, cache_info: dict[str, Any]
+    ) -> bytes | None:
+        """Read an item's data from the filesystem tier
+
+        Args:
+            cache_key: Cache key
+            cache_info: Cache information
+
+        Returns:
+            Image data, or None if the file is missing or unreadable (the item is
+            removed)
+        """
         file_path = Path(cache_info["file_path"])
 
         # Check if file exists
         if not file_path.exists():
-            self._cache_index.pop(cache_key, None)
-            self._logger.warning(f"Cache file does not exist: {file_path}")
+            self._remove_cache_item(cache_key, cache_info)
+            self._logger.warning("Cache file does not exist: %s", file_path)
             return None
 
         try:
             # Read file content
             with open(file_path, "rb") as f:
-                data = f.read()
+                return f.read()
+        except Exception as e:
+            self._logger.error("Failed to read cache file: %s", e)
+            self._remove_cache_item(cache_key, cache_info)
+            return None
 
-            # Get MIME type
-            mime_type = cache_info.get("mime_type", "image/png")
+    def _promote(
+        self, cache_key: str, data: bytes, data_uri: str | None = None
+    ) -> None:
+        """Keep an item's data, and optionally its data URI, in the memory tier
 
-            # Update access time
-            cache_info["access_time"] = time.time()
-            self._save_cache_index()
+        Args:
+            cache_key: Cache key
+            data: Image data
+            data_uri: Encoded data URI of the image
+        """
+        self._demote(cache_key)
+        if len(data) > self._max_memory_bytes:
+            return
 
-            self._logger.debug(f"Retrieved image from cache: {source[:50]}... ")
-            return data, mime_type
+        self._memory[cache_key] = data
+        self._memory_bytes += len(data)
+        if data_uri is not None:
+            self._store_data_uri(cache_key, data_uri)
+        self._fit_memory()
 
-        except Exception as e:
-            self._logger.error(f"Failed to read cache file: {e}")
-            self._remove_cache_item(cache_key, cache_info)
-            return None
+    def _store_data_uri(self, cache_key: str, data_uri: str) -> None:
+        """Keep the data URI of an item that is in the memory tier
 
-    def set(self, source: str, data: bytes, mime_type: str = "image/png") -> bool:
+        Args:
+            cache_key: Cache key
+            data_uri: Encoded data URI of the image
+        """
+        data = self._memory.get(cache_key)
+        if (
+            data is None
+            or cache_key in self._data_uris
+            or len(data) + len(data_uri) > self._max_memory_bytes
+        ):
+            return
+
+        self._data_uris[cache_key] = data_uri
+        self._memory_bytes += len(data_uri)
+        self._fit_memory()
+
+    def _fit_memory(self) -> None:
+        """Demote least recently used items until the memory tier fits its byte budget
+
+        Demoted items are only dropped from memory, their files are always written.
+        """
+        while self._memory_bytes > self._max_memory_bytes:
+            self._demote(next(iter(self._memory)))
+
+    def _demote(self, cache_key: str) -> None:
+        """Drop an item's data and data URI from the memory tier
+
+        Args:
+            cache_key: Cache key
+        """
+        data = self._memory.pop(cache_key, None)
+        if data is not None:
+            self._memory_bytes -= len(data)
+        data_uri = self._data_uris.pop(cache_key, None)
+        if data_uri is not None:
+            self._memory_bytes -= len(data_uri)
+
+    def set(
+        self,
+        source: str,
+        data: bytes,
+        mime_type: str = "image/png",
+        ttl: float | None = None,
+        data_uri: str | None = None,
+    ) -> bool:
         """Store image data in cache.
 
         Args:
             source (str): Image source (URL or file path), used as cache key.
             data (bytes): Image binary data.
             mime_type (str): Image MIME type, defaults to "image/png".
+            ttl (Optional[float]): Maximum age of this item in seconds, defaults to the
+                cache's `ttl`.
+            data_uri (Optional[str]): Already encoded data URI of `data`, kept in the
+                memory tier for `get_data_uri`.
 
         Returns:
-            bool: Whether successfully stored in cache.
+            bool: Whether successfully stored in cache. Images larger than `max_bytes`
+                are not stored.
         """
         try:
+            if self._max_bytes is not None and len(data) > self._max_bytes:
+                self._logger.debug(
+                    "Image of %d bytes exceeds the cache limit of %d bytes",
+                    len(data),
+                    self._max_bytes,
+                )
+                return False
+
             cache_key = self._generate_cache_key(source)
 
             # Generate cache file path
@@ -212,26 +791,56 @@ class ImageCache:
             with open(cache_file, "wb") as f:
                 f.write(data)
 
+            # Replace an existing item with the same key
+            old_info = self._cache_index.get(cache_key)
+            if old_info is not None:
+                self._total_bytes -= old_info.get("size", 0)
+                self._policy.on_remove(cache_key)
+                if old_info.get("file_path") != str(cache_file):
+                    with suppress(Exception):
+                        Path(old_info["file_path"]).unlink()
+
             # Update index
-            self._cache_index[cache_key] = {
+            now = time.time()
+            cache_info = {
                 "file_path": str(cache_file),
-                "access_time": time.time(),
+                "access_time": now,
+                "created_time": now,
                 "size": len(data),
                 "mime_type": mime_type,
-                "source": source[:100],  # Save first 100 characters of source for debugging
+                "source": source[
+                    :100
+                ],  # Save first 100 characters of source for debugging
             }
-
-            # Clean up expired cache
+            ttl = self._ttl if ttl is None else ttl
+            if ttl is not None:
+                expires_at = now + ttl
+                cache_info["expires_at"] = expires_at
+                heapq.heappush(self._expiry_heap, (expires_at, cache_key))
+            self._cache_index[cache_key] = cache_info
+            self._cache_index.move_to_end(cache_key)
+            self._total_bytes += len(data)
+
+            # Journal the item, the data file is already complete
+            self._append_journal(cache_key, cache_info)
+
+            # Clean up expired cache, the policy only learns about the new item
+            # afterwards so it is not chosen to make room for itself
             self._cleanup_old_cache()
-
-            # Save index
-            self._save_cache_index()
-
-            self._logger.debug(f"Successfully cached image: {source[:50]}... -> {cache_file.name}")
+            if cache_key in self._cache_index:
+                self._policy.on_insert(cache_key, cache_info)
+                self._promote(cache_key, bytes(data), data_uri)
+
+            if self._logger.is_enabled_for(logging.DEBUG):
+                self._logger.debug(
+                    "Successfully cached image: %s... -> %s",
+                    source[:50],
+                    cache_file.name,
+                )
             return True
 
         except Exception as e:
-            self._logger.error(f"Failed to cache image: {e}")
+            self._logger.error("Failed to cache image: %s", e)
             return False
 
     def clear(self) -> None:
@@ -247,30 +856,49 @@ class ImageCache:
                     with suppress(Exception):
                         file_path.unlink()
 
-            # Clear index
+            # Clear memory tier and index
+            self._memory.clear()
+            self._data_uris.clear()
+            self._memory_bytes = 0
             self._cache_index.clear()
+            self._total_bytes = 0
+            self._expiry_heap = []
+            self._policy.reset(self._cache_index)
+            self._journal_entries = 0
+            self._dirty = False
 
-            # Delete index file
-            if self._index_file.exists():
-                self._index_file.unlink()
+            # Delete index and journal files
+            for index_file in (self._index_file, self._journal_file):
+                if index_file.exists():
+                    index_file.unlink()
 
             self._logger.info("Cleared all image cache")
 
         except Exception as e:
-            self._logger.error(f"Failed to clear cache: {e}")
+            self._logger.error("Failed to clear cache: %s", e)
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics
 
         Returns:
-            Cache statistics dictionary
+            Cache statistics dictionary, `evictions` counts evicted items by reason
+            ("max_size", "max_bytes", "expired") and `hits` counts hits per tier
+            ("memory", "disk")
         """
-        total_size = sum(info.get("size", 0) for info in self._cache_index.values())
-
         return {
             "total_items": len(self._cache_index),
             "max_size": self._max_size,
-            "total_size_bytes": total_size,
+            "total_size_bytes": self._total_bytes,
+            "max_bytes": self._max_bytes,
+            "ttl": self._ttl,
+            "policy": self._policy.policy_name,
+            "evictions": dict(self._evictions),
+            "hits": dict(self._tier_hits),
+            "misses": self._misses,
+            "memory_items": len(self._memory),
+            "memory_data_uris": len(self._data_uris),
+            "memory_bytes": self._memory_bytes,
+            "max_memory_bytes": self._max_memory_bytes,
             "cache_dir": str(self._cache_dir),
             "cache_usage_ratio": len(self._cache_index) / self._max_size
             if self._max_size > 0
@@ -282,14 +910,32 @@ class ImageCache:
 _global_cache: ImageCache | None = None
 
 
-def get_image_cache() -> ImageCache:
+def get_image_cache(
+    cache_dir: Path | None = None,
+    max_size: int | None = None,
+    max_bytes: int | None = None,
+    ttl: float | None = None,
+    policy: str | EvictionPolicy | None = None,
+    memory_bytes: int | None = None,
+) -> ImageCache:
     """Get global image cache instance.
 
-    This function implements singleton pattern, ensuring only one `ImageCache` instance exists
-    throughout the entire application.
+    This function implements singleton pattern, ensuring only one `ImageCache` instance
+    exists throughout the entire application. Options left as None use the
+    `EMAILWIDGET_IMAGE_CACHE_*` environment variables, see `ImageCache`.
+
+    Args:
+        cache_dir (Optional[Path]): Cache directory path.
+        max_size (Optional[int]): Maximum number of cached items.
+        max_bytes (Optional[int]): Maximum total size of cached images in bytes.
+        ttl (Optional[float]): Maximum age of cached items in seconds.
+        policy (Optional[Union[str, EvictionPolicy]]): "lru", "lfu", "gdsf" or an
+            `EvictionPolicy`.
+        memory_bytes (Optional[int]): Byte budget of the in-memory tier.
 
     Returns:
-        ImageCache: Global unique `ImageCache` instance.
+        ImageCache: Global unique `ImageCache` instance. Passing any option replaces it
+            with a new instance using those options.
 
     Examples:
         ```python
@@ -298,9 +944,23 @@ def get_image_cache() -> ImageCache:
         cache1 = get_image_cache()
         cache2 = get_image_cache()
         assert cache1 is cache2 # True, both are the same instance
+
+        cache = get_image_cache(max_bytes=200 * 1024 * 1024, ttl=86400, policy="gdsf")
         ```
     """
     global _global_cache
-    if _global_cache is None:
+    options = (cache_dir, max_size, max_bytes, ttl, policy, memory_bytes)
+    if any(value is not None for value in options):
+        if _global_cache is not None:
+            _global_cache.flush()
+        _global_cache = ImageCache(
+            cache_dir=cache_dir,
+            max_size=max_size,
+            max_bytes=max_bytes,
+            ttl=ttl,
+            policy=policy,
+            memory_bytes=memory_bytes,
+        )
+    elif _global_cache is None:
         _global_cache = ImageCache()
     return _global_cache
@@ -5,7 +5,7 @@ Provides unified logging management functionality with environment variable cont
 
 import logging
 import os
-from typing import Optional
+from typing import Any, Optional
 
 
 class EmailWidgetLogger:
@@ -37,6 +37,13 @@ class EmailWidgetLogger:
         logger.warning("Used deprecated method")
         logger.error("Widget rendering failed")
         logger.critical("System memory insufficient")
+
+        # Defer formatting until the record is actually emitted
+        logger.debug("Rendered %d widgets", widget_count)
+
+        # Guard expensive arguments on hot paths
+        if logger.is_enabled_for(logging.DEBUG):
+            logger.debug("Cached image: %s", source[:50])
         ```
 
         You can also use convenience functions directly:
@@ -105,50 +112,68 @@ class EmailWidgetLogger:
         # Add handler
         self._logger.addHandler(console_handler)
 
-    def debug(self, message: str) -> None:
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a log level would be emitted.
+
+        Use this to skip building expensive log arguments on hot paths.
+
+        Args:
+            level (int): Log level, e.g. `logging.DEBUG`.
+
+        Returns:
+            bool: Whether records of this level are emitted.
+        """
+        return self._logger is not None and self._logger.isEnabledFor(level)
+
+    def debug(self, message: str, *args: Any) -> None:
         """Output debug log.
 
         Args:
-            message (str): Log message.
+            message (str): Log message, optionally with %-style placeholders.
+            *args (Any): Arguments merged into the message only if the record is emitted.
         """
         if self._logger:
-            self._logger.debug(message)
+            self._logger.debug(message, *args)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any) -> None:
         """Output info log.
 
         Args:
-            message (str): Log message.
+            message (str): Log message, optionally with %-style placeholders.
+            *args (Any): Arguments merged into the message only if the record is emitted.
         """
         if self._logger:
-            self._logger.info(message)
+            self._logger.info(message, *args)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any) -> None:
         """Output warning log.
 
         Args:
-            message (str): Log message.
+            message (str): Log message, optionally with %-style placeholders.
+            *args (Any): Arguments merged into the message only if the record is emitted.
         """
         if self._logger:
-            self._logger.warning(message)
+            self._logger.warning(message, *args)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any) -> None:
         """Output error log.
 
         Args:
-            message (str): Log message.
+            message (str): Log message, optionally with %-style placeholders.
+            *args (Any): Arguments merged into the message only if the record is emitted.
         """
         if self._logger:
-            self._logger.error(message)
+            self._logger.error(message, *args)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any) -> None:
         """Output critical error log.
 
         Args:
-            message (str): Log message.
+            message (str): Log message, optionally with %-style placeholders.
+            *args (Any): Arguments merged into the message only if the record is emitted.
         """
         if self._logger:
-            self._logger.critical(message)
+            self._logger.critical(message, *args)
 
 
 # Global logger instance
@@ -180,46 +205,51 @@ def get_project_logger() -> EmailWidgetLogger:
 
 
 # Convenience functions
-def debug(message: str) -> None:
+def debug(message: str, *args: Any) -> None:
     """Output debug log.
 
     Args:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders.
+        *args (Any): Arguments merged into the message only if the record is emitted.
     """
-    get_project_logger().debug(message)
+    get_project_logger().debug(message, *args)
 
 
-def info(message: str) -> None:
+def info(message: str, *args: Any) -> None:
     """Output info log.
 
     Args:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders.
+        *args (Any): Arguments merged into the message only if the record is emitted.
     """
-    get_project_logger().info(message)
+    get_project_logger().info(message, *args)
 
 
-def warning(message: str) -> None:
+def warning(message: str, *args: Any) -> None:
     """Output warning log.
 
     Args:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders.
+        *args (Any): Arguments merged into the message only if the record is emitted.
     """
-    get_project_logger().warning(message)
+    get_project_logger().warning(message, *args)
 
 
-def error(message: str) -> None:
+def error(message: str, *args: Any) -> None:
     """Output error log.
 
     Args:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders.
+        *args (Any): Arguments merged into the message only if the record is emitted.
     """
-    get_project_logger().error(message)
+    get_project_logger().error(message, *args)
 
 
-def critical(message: str) -> None:
+def critical(message: str, *args: Any) -> None:
     """Output critical error log.
 
     Args:
-        message (str): Log message.
+        message (str): Log message, optionally with %-style placeholders.
+        *args (Any): Arguments merged into the message only if the record is emitted.
     """
-    get_project_logger().critical(message)
+    get_project_logger().critical(message, *args)
@@ -0,0 +1,396 @@
+"""EmailWidget native render backend
+
+Translates widget templates into plain Python string-building functions so that
+rendering bypasses the Jinja2 runtime (context objects, undefined handling,
+generators). Templates are parsed with the same Jinja2 environment settings as
+the Jinja backend and the generated code reproduces Jinja2's output exactly for
+the subset of template syntax used by the built-in widgets. Templates using
+anything outside that subset raise `UnsupportedTemplateError`, and the template
+engine falls back to Jinja2 for them.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+from jinja2 import Environment, nodes
+from jinja2.exceptions import UndefinedError
+
+
+class UnsupportedTemplateError(Exception):
+    """Raised when a template uses syntax the native backend cannot translate."""
+
+
+class _Undefined:
+    """Stand-in for missing variables and attributes, mirroring `jinja2.Undefined`."""
+
+    __slots__ = ()
+
+    def __str__(self) -> str:
+        return ""
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __len__(self) -> int:
+        return 0
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(())
+
+    def __repr__(self) -> str:
+        return "Undefined"
+
+    def _fail(self, *args: Any, **kwargs: Any) -> Any:
+        raise UndefinedError("Undefined value used in template expression")
+
+    __getattr__ = _fail
+    __getitem__ = _fail
+    __call__ = _fail
+    __lt__ = __le__ = __gt__ = __ge__ = _fail
+
+
+UNDEFINED = _Undefined()
+
+_DICT_ATTRIBUTES = frozenset(dir(dict))
+
+
+class LoopContext:
+    """Minimal `loop` variable for native `for` loops."""
+
+    __slots__ = ("index0", "length")
+
+    def __init__(self, index0: int, length: int):
+        self.index0 = index0
+        self.length = length
+
+    @property
+    def index(self) -> int:
+        return self.index0 + 1
+
+    @property
+    def revindex(self) -> int:
+        return self.length - self.index0
+
+    @property
+    def revindex0(self) -> int:
+        return self.length - self.index0 - 1
+
+    @property
+    def first(self) -> bool:
+        return self.index0 == 0
+
+    @property
+    def last(self) -> bool:
+        return self.index0 == self.length - 1
+
+
+def _to_str(value: Any) -> str:
+    """Convert an output value to string the way Jinja2 does without autoescaping."""
+    if value.__class__ is str:
+        return value
+    return str(value)
+
+
+def _getattr(obj: Any, attribute: str) -> Any:
+    """Attribute lookup with item fallback, like `Environment.getattr`."""
+    # Widget contexts are mostly plain dicts; skip the failing getattr for them
+    if obj.__class__ is dict and attribute not in _DICT_ATTRIBUTES:
+        return obj.get(attribute, UNDEFINED)
+    if obj is UNDEFINED:
+        obj._fail()
+    try:
+        return getattr(obj, attribute)
+    except AttributeError:
+        pass
+    try:
+        return obj[attribute]
+    except (TypeError, LookupError):
+        return UNDEFINED
+
+
+def _getitem(obj: Any, argument: Any) -> Any:
+    """Item lookup with attribute fallback, like `Environment.getitem`."""
+    if obj is UNDEFINED:
+        obj._fail()
+    try:
+        return obj[argument]
+    except (AttributeError, TypeError, LookupError):
+        if isinstance(argument, str):
+            try:
+                return getattr(obj, argument)
+            except AttributeError:
+                pass
+        return UNDEFINED
+
+
+def _loop(iterable: Iterable[Any]) -> Iterator[tuple[LoopContext, Any]]:
+    """Iterate with a `loop` variable."""
+    items = list(iterable)
+    length = len(items)
+    for index0, item in enumerate(items):
+        yield LoopContext(index0, length), item
+
+
+_RUNTIME = {
+    "UNDEFINED": UNDEFINED,
+    "to_str": _to_str,
+    "getattr_": _getattr,
+    "getitem_": _getitem,
+    "loop_": _loop,
+    "len": len,
+}
+
+_COMPARE_OPERATORS = {
+    "eq": "==",
+    "ne": "!=",
+    "gt": ">",
+    "gteq": ">=",
+    "lt": "<",
+    "lteq": "<=",
+    "in": "in",
+    "notin": "not in",
+}
+
+_BINARY_OPERATORS = {
+    nodes.Add: "+",
+    nodes.Sub: "-",
+    nodes.Mul: "*",
+    nodes.Div: "/",
+    nodes.FloorDiv: "//",
+    nodes.Mod: "%",
+}
+
+
+class _CodeGenerator:
+    """Generate the source of a `render(ctx)` function from a Jinja2 AST."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self._indent = 1
+        self._scopes: list[dict[str, str]] = []
+        self._template_names: dict[str, str] = {}
+        self._counter = 0
+
+    def generate(self, template: nodes.Template) -> str:
+        """Generate function source for a parsed template.
+
+        Args:
+            template (nodes.Template): Parsed template.
+
+        Returns:
+            str: Python source defining `render(ctx)`.
+        """
+        self._visit_body(template.body)
+        header = ["def render(ctx):", "    buf = []", "    w = buf.append"]
+        for name, local in self._template_names.items():
+            header.append(
+                f"    {local} = ctx[{name!r}] if {name!r} in ctx "
+                f"else globals_.get({name!r}, UNDEFINED)"
+            )
+        return "\n".join(header + self._lines + ['    return "".join(buf)'])
+
+    def _write(self, code: str) -> None:
+        self._lines.append("    " * self._indent + code)
+
+    def _next_id(self) -> int:
+        self._counter += 1
+        return self._counter
+
+    def _visit_body(self, body: list[nodes.Node]) -> None:
+        start = len(self._lines)
+        for node in body:
+            if isinstance(node, nodes.Output):
+                self._visit_output(node)
+            elif isinstance(node, nodes.If):
+                self._visit_if(node)
+            elif isinstance(node, nodes.For):
+                self._visit_for(node)
+            else:
+                raise UnsupportedTemplateError(type(node).__name__)
+        if len(self._lines) == start:
+            self._write("pass")
+
+    def _visit_output(self, node: nodes.Output) -> None:
+        for child in node.nodes:
+            if isinstance(child, nodes.TemplateData):
+                if child.data:
+                    self._write(f"w({child.data!r})")
+            elif isinstance(child, nodes.Const):
+                self._write(f"w({str(child.value)!r})")
+            else:
+                self._write(f"w(to_str({self._expr(child)}))")
+
+    def _visit_if(self, node: nodes.If) -> None:
+        self._write(f"if {self._expr(node.test)}:")
+        self._indented(node.body)
+        for elif_node in node.elif_:
+            self._write(f"elif {self._expr(elif_node.test)}:")
+            self._indented(elif_node.body)
+        if node.else_:
+            self._write("else:")
+            self._indented(node.else_)
+
+    def _indented(self, body: list[nodes.Node]) -> None:
+        self._indent += 1
+        self._visit_body(body)
+        self._indent -= 1
+
+    def _visit_for(self, node: nodes.For) -> None:
+        if node.test is not None or node.recursive:
+            raise UnsupportedTemplateError("filtered or recursive for loop")
+
+        loop_id = self._next_id()
+        iter_expr = self._expr(node.iter)
+        scope: dict[str, str] = {}
+        target = self._target(node.target, scope, loop_id)
+        uses_loop = any(
+            name.name == "loop"
+            for child in node.body
+            for name in child.find_all(nodes.Name)
+        )
+
+        iterated = f"l_{loop_id}_iterated"
+        if node.else_:
+            self._write(f"{iterated} = False")
+
+        if uses_loop:
+            scope["loop"] = f"l_{loop_id}_loop"
+            self._write(f"for l_{loop_id}_loop, {target} in loop_({iter_expr}):")
+        else:
+            self._write(f"for {target} in {iter_expr}:")
+
+        self._scopes.append(scope)
+        self._indent += 1
+        if node.else_:
+            self._write(f"{iterated} = True")
+        self._visit_body(node.body)
+        self._indent -= 1
+        self._scopes.pop()
+
+        if node.else_:
+            self._write(f"if not {iterated}:")
+            self._indented(node.else_)
+
+    def _target(self, node: nodes.Node, scope: dict[str, str], loop_id: int) -> str:
+        if isinstance(node, nodes.Name):
+            local = f"l_{loop_id}_{node.name}"
+            scope[node.name] = local
+            return local
+        if isinstance(node, nodes.Tuple):
+            items = [self._target(item, scope, loop_id) for item in node.items]
+            return "(" + ", ".join(items) + ",)"
+        raise UnsupportedTemplateError(f"loop target {type(node).__name__}")
+
+    def _name(self, name: str) -> str:
+        for scope in reversed(self._scopes):
+            if name in scope:
+                return scope[name]
+        if name == "loop":
+            raise UnsupportedTemplateError("loop variable outside for loop")
+        if name not in self._template_names:
+            self._template_names[name] = f"t_{len(self._template_names)}"
+        return self._template_names[name]
+
+    def _expr(self, node: nodes.Node) -> str:
+        if isinstance(node, nodes.Name):
+            return self._name(node.name)
+        if isinstance(node, nodes.Const):
+            return repr(node.value)
+        if isinstance(node, nodes.Getattr):
+            return f"getattr_({self._expr(node.node)}, {node.attr!r})"
+        if isinstance(node, nodes.Getitem):
+            return f"getitem_({self._expr(node.node)}, {self._expr(node.arg)})"
+        if isinstance(node, nodes.Filter):
+            return self._filter(node)
+        if isinstance(node, nodes.Call):
+            if node.kwargs or node.dyn_args or node.dyn_kwargs:
+                raise UnsupportedTemplateError("call with keyword or dynamic arguments")
+            args = ", ".join(self._expr(arg) for arg in node.args)
+            return f"{self._expr(node.node)}({args})"
+        if isinstance(node, nodes.Compare):
+            parts = [self._expr(node.expr)]
+            for operand in node.ops:
+                parts.append(_COMPARE_OPERATORS[operand.op])
+                parts.append(self._expr(operand.expr))
+            return "(" + " ".join(parts) + ")"
+        if isinstance(node, nodes.And):
+            return f"({self._expr(node.left)} and {self._expr(node.right)})"
+        if isinstance(node, nodes.Or):
+            return f"({self._expr(node.left)} or {self._expr(node.right)})"
+        if isinstance(node, nodes.Not):
+            return f"(not {self._expr(node.node)})"
+        if isinstance(node, nodes.CondExpr):
+            else_expr = "UNDEFINED" if node.expr2 is None else self._expr(node.expr2)
+            return f"({self._expr(node.expr1)} if {self._expr(node.test)} else {else_expr})"
+        if isinstance(node, nodes.Tuple):
+            return "(" + "".join(f"{self._expr(item)}, " for item in node.items) + ")"
+        if isinstance(node, nodes.BinExpr) and type(node) in _BINARY_OPERATORS:
+            operator = _BINARY_OPERATORS[type(node)]
+            return f"({self._expr(node.left)} {operator} {self._expr(node.right)})"
+        raise UnsupportedTemplateError(type(node).__name__)
+
+    def _filter(self, node: nodes.Filter) -> str:
+        if node.args or node.kwargs or node.dyn_args or node.dyn_kwargs:
+            raise UnsupportedTemplateError(f"filter {node.name} with arguments")
+        if node.node is None:
+            raise UnsupportedTemplateError("filter block")
+        if node.name == "safe":
+            return f"to_str({self._expr(node.node)})"
+        if node.name == "length":
+            return f"len({self._expr(node.node)})"
+        raise UnsupportedTemplateError(f"filter {node.name}")
+
+
+class NativeTemplate:
+    """Compiled native template with the same `render`/`generate` interface as `jinja2.Template`."""
+
+    def __init__(self, render_func: Callable[[dict[str, Any]], str], source: str):
+        """Initialize native template.
+
+        Args:
+            render_func (Callable[[Dict[str, Any]], str]): Generated render function.
+            source (str): Generated Python source, kept for debugging.
+        """
+        self._render_func = render_func
+        self.source = source
+
+    def render(self, *args: Any, **kwargs: Any) -> str:
+        """Render the template.
+
+        Returns:
+            str: Rendered HTML string.
+        """
+        return self._render_func(dict(*args, **kwargs))
+
+    def generate(self, *args: Any, **kwargs: Any) -> Iterator[str]:
+        """Render the template as an iterator.
+
+        Native templates produce their output in one piece, so this yields a single chunk.
+
+        Returns:
+            Iterator[str]: Iterator over rendered HTML.
+        """
+        yield self.render(*args, **kwargs)
+
+
+def compile_native(environment: Environment, template_string: str) -> NativeTemplate:
+    """Compile a template string into a native Python render function.
+
+    Args:
+        environment (Environment): Jinja2 environment used for parsing, so whitespace
+            control matches the Jinja2 backend.
+        template_string (str): Template string.
+
+    Returns:
+        NativeTemplate: Compiled native template.
+
+    Raises:
+        TemplateSyntaxError: If the template has invalid syntax.
+        UnsupportedTemplateError: If the template uses syntax outside the native subset.
+    """
+    tree = environment.parse(template_string)
+    source = _CodeGenerator().generate(tree)
+
+    namespace: dict[str, Any] = dict(_RUNTIME, globals_=environment.globals)
+    exec(compile(source, "<emailwidget native template>", "exec"), namespace)  # noqa: S102
+    return NativeTemplate(namespace["render"], source)
@@ -0,0 +1,192 @@
+"""EmailWidget render profiling
+
+Report types produced by `Email.render_profile()`, breaking down where render time
+goes for each widget in an email.
+"""
+
+from typing import Any
+
+# Columns of the profile report, in display order
+_COLUMNS = (
+    ("#", "index", "{}"),
+    ("Widget", "widget_type", "{}"),
+    ("ID", "widget_id", "{}"),
+    ("Context ms", "context_time", "{:.3f}"),
+    ("Template ms", "template_time", "{:.3f}"),
+    ("Render ms", "render_time", "{:.3f}"),
+    ("Total ms", "total_time", "{:.3f}"),
+    ("Bytes", "output_bytes", "{:,}"),
+)
+
+# Fields the report can be sorted by
+SORT_FIELDS = (
+    "total_time",
+    "context_time",
+    "template_time",
+    "render_time",
+    "output_bytes",
+    "index",
+)
+
+
+class WidgetRenderProfile:
+    """Render measurements for a single widget.
+
+    Times are in seconds. Child widgets of containers such as `ColumnWidget` are
+    rendered while building the container's context, so their cost is counted in
+    the container's `context_time`.
+
+    Attributes:
+        index (int): Position of the widget in the email.
+        widget_type (str): Widget class name.
+        widget_id (str): Widget ID.
+        context_time (float): Time spent in `get_template_context()`.
+        template_time (float): Time spent looking up or compiling the template.
+        render_time (float): Time spent rendering the template.
+        total_time (float): Wall time of the whole widget render, including overhead.
+        output_bytes (int): Size of the rendered HTML in UTF-8 bytes.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        widget_type: str,
+        widget_id: str,
+        timings: dict[str, float],
+        total_time: float,
+        output_bytes: int,
+    ):
+        """Initialize widget profile.
+
+        Args:
+            index (int): Position of the widget in the email.
+            widget_type (str): Widget class name.
+            widget_id (str): Widget ID.
+            timings (Dict[str, float]): Stage timings with keys "context", "template" and "render".
+            total_time (float): Wall time of the whole widget render.
+            output_bytes (int): Size of the rendered HTML in UTF-8 bytes.
+        """
+        self.index = index
+        self.widget_type = widget_type
+        self.widget_id = widget_id
+        self.context_time = timings.get("context", 0.0)
+        self.template_time = timings.get("template", 0.0)
+        self.render_time = timings.get("render", 0.0)
+        self.total_time = total_time
+        self.output_bytes = output_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary.
+
+        Returns:
+            Dict[str, Any]: Measurements keyed by field name.
+        """
+        return {field: getattr(self, field) for _, field, _ in _COLUMNS}
+
+    def __repr__(self) -> str:
+        return (
+            f"WidgetRenderProfile(index={self.index}, widget_type={self.widget_type!r}, "
+            f"total_time={self.total_time:.6f}, output_bytes={self.output_bytes})"
+        )
+
+
+class RenderProfile:
+    """Per-widget render profile of an email.
+
+    Attributes:
+        widgets (List[WidgetRenderProfile]): Widget profiles, sorted by cost.
+        email_time (float): Time spent rendering the email shell around the widgets.
+        total_time (float): Wall time of the whole email render.
+        output_bytes (int): Size of the complete email HTML in UTF-8 bytes.
+
+    Examples:
+        ```python
+        profile = email.render_profile()
+        print(profile)  # Pretty table, most expensive widget first
+        slowest = profile.widgets[0]
+        data = profile.to_dict()
+        ```
+    """
+
+    def __init__(
+        self,
+        widgets: list[WidgetRenderProfile],
+        email_time: float,
+        total_time: float,
+        output_bytes: int,
+        sort_by: str = "total_time",
+    ):
+        """Initialize render profile.
+
+        Args:
+            widgets (List[WidgetRenderProfile]): Widget profiles.
+            email_time (float): Time spent rendering the email shell.
+            total_time (float): Wall time of the whole email render.
+            output_bytes (int): Size of the complete email HTML in UTF-8 bytes.
+            sort_by (str): Field to sort widgets by, descending; "index" sorts in email order.
+
+        Raises:
+            ValueError: If `sort_by` is not a known field.
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(
+                f"Invalid sort field: {sort_by}, must be one of {', '.join(SORT_FIELDS)}"
+            )
+        self.widgets = sorted(
+            widgets,
+            key=lambda profile: getattr(profile, sort_by),
+            reverse=sort_by != "index",
+        )
+        self.email_time = email_time
+        self.total_time = total_time
+        self.output_bytes = output_bytes
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary.
+
+        Returns:
+            Dict[str, Any]: Email totals and the list of widget profiles.
+        """
+        return {
+            "total_time": self.total_time,
+            "email_time": self.email_time,
+            "output_bytes": self.output_bytes,
+            "widgets": [profile.to_dict() for profile in self.widgets],
+        }
+
+    def format_table(self) -> str:
+        """Format the profile as a plain-text table.
+
+        Returns:
+            str: Table with one row per widget followed by a summary line.
+        """
+        rows = [[header for header, _, _ in _COLUMNS]]
+        for profile in self.widgets:
+            rows.append(
+                [
+                    fmt.format(getattr(profile, field) * 1000)
+                    if field.endswith("_time")
+                    else fmt.format(getattr(profile, field))
+                    for _, field, fmt in _COLUMNS
+                ]
+            )
+
+        widths = [max(len(row[i]) for row in rows) for i in range(len(_COLUMNS))]
+        lines = []
+        for row_index, row in enumerate(rows):
+            cells = [
+                cell.ljust(width) if i in (1, 2) else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+            ]
+            lines.append("  ".join(cells))
+            if row_index == 0:
+                lines.append("  ".join("-" * width for width in widths))
+
+        lines.append(
+            f"{len(self.widgets)} widgets, total {self.total_time * 1000:.3f} ms "
+            f"(email shell {self.email_time * 1000:.3f} ms), {self.output_bytes:,} bytes"
+        )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format_table()
@@ -3,11 +3,105 @@
 Lightweight template rendering engine based on Jinja2, supports template string rendering and error handling.
 """
 
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from pathlib import Path
 from typing import Any
 
-from jinja2 import BaseLoader, Environment, Template, TemplateError
+import jinja2
+from jinja2 import BaseLoader, Environment, ModuleLoader, Template, TemplateError
+from jinja2.bccache import Bucket, BytecodeCache, FileSystemBytecodeCache
 
 from email_widget.core.logger import get_project_logger
+from email_widget.core.native_renderer import (
+    NativeTemplate,
+    UnsupportedTemplateError,
+    compile_native,
+)
+
+# Environment variable that enables the on-disk template bytecode cache
+BYTECODE_CACHE_DIR_ENV = "EMAILWIDGET_TEMPLATE_CACHE_DIR"
+
+# Environment variable pointing at templates generated by
+# `python -m email_widget.precompile`
+PRECOMPILED_DIR_ENV = "EMAILWIDGET_PRECOMPILED_TEMPLATES"
+
+# Manifest written next to precompiled template modules
+PRECOMPILED_MANIFEST = "manifest.json"
+
+# Environment variable selecting the render backend
+RENDER_BACKEND_ENV = "EMAILWIDGET_RENDER_BACKEND"
+
+# Available render backends
+RENDER_BACKENDS = ("jinja", "native")
+
+# Default number of ad-hoc (unnamed) templates kept compiled
+DEFAULT_MAX_CACHED_TEMPLATES = 128
+
+# Compiled template of either render backend, both provide render() and generate()
+CompiledTemplate = Template | NativeTemplate
+
+
+def create_environment(
+    loader: BaseLoader, bytecode_cache: BytecodeCache | None = None
+) -> Environment:
+    """Create a Jinja2 environment with the settings used for all EmailWidget templates.
+
+    Args:
+        loader (BaseLoader): Template loader.
+        bytecode_cache (Optional[BytecodeCache]): Optional bytecode cache.
+
+    Returns:
+        Environment: Configured Jinja2 environment.
+    """
+    return Environment(
+        loader=loader,
+        autoescape=False,  # Email HTML doesn't need auto-escaping
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+    )
+
+
+# Template keys by class, see get_template_key
+_template_keys: dict[type, str] = {}
+
+
+def get_template_key(cls: type) -> str:
+    """Get the name identifying the `TEMPLATE` a class renders with.
+
+    The key is the fully qualified name of the class in the MRO that defines
+    `TEMPLATE`, so subclasses that inherit a template share its key.
+
+    Args:
+        cls (type): Widget or Email class.
+
+    Returns:
+        str: Template key, e.g. `email_widget.widgets.text_widget.TextWidget`.
+    """
+    key = _template_keys.get(cls)
+    if key is None:
+        owner = next((klass for klass in cls.__mro__ if "TEMPLATE" in vars(klass)), cls)
+        key = _template_keys[cls] = f"{owner.__module__}.{owner.__qualname__}"
+    return key
+
+
+def get_source_hash(template_string: str) -> str:
+    """Get the hash used to check that a precompiled template matches its source.
+
+    Args:
+        template_string (str): Template source.
+
+    Returns:
+        str: SHA-256 hex digest of the source.
+    """
+    return hashlib.sha256(template_string.encode("utf-8")).hexdigest()
 
 
 class StringTemplateLoader(BaseLoader):
@@ -17,7 +111,9 @@ class StringTemplateLoader(BaseLoader):
     the template engine to handle dynamically generated or in-memory template strings.
     """
 
-    def get_source(self, environment: Environment, template: str) -> tuple:
+    def get_source(
+        self, environment: Environment, template: str
+    ) -> tuple[str, None, Callable[[], bool]]:
         """Get template source code.
 
         Args:
@@ -30,6 +126,63 @@ class StringTemplateLoader(BaseLoader):
         return template, None, lambda: True
 
 
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """On-disk Jinja2 bytecode cache for widget templates.
+
+    Stores compiled template code so short-lived processes can skip Jinja2's
+    lexer, parser and code generator on first render. Cache files are keyed by a
+    hash of the template source and the installed Jinja2 version, so upgrading
+    Jinja2 never loads stale bytecode. Filesystem errors are logged and ignored,
+    falling back to normal compilation.
+
+    Examples:
+        ```python
+        from email_widget.core.template_engine import TemplateEngine
+
+        engine = TemplateEngine(bytecode_cache_dir="/var/cache/emailwidget")
+        ```
+    """
+
+    def __init__(self, directory: str | Path):
+        """Initialize bytecode cache.
+
+        Args:
+            directory (Union[str, Path]): Directory for cache files, created if missing.
+        """
+        self._logger = get_project_logger()
+        cache_dir = Path(directory)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(cache_dir), pattern="emailwidget_%s.cache")
+
+    def get_cache_key(self, name: str, filename: str | None = None) -> str:
+        """Build cache key from Jinja2 version and template source.
+
+        Args:
+            name (str): Template name, which is the template source for string
+                templates.
+            filename (Optional[str]): Template filename, unused.
+
+        Returns:
+            str: Hex digest identifying the cache file.
+        """
+        key = f"{jinja2.__version__}\0{name}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load bytecode from disk, ignoring filesystem errors."""
+        try:
+            super().load_bytecode(bucket)
+        except OSError as e:
+            self._logger.warning("Failed to read template bytecode cache: %s", e)
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Write bytecode to disk, ignoring filesystem errors."""
+        try:
+            super().dump_bytecode(bucket)
+        except OSError as e:
+            self._logger.warning("Failed to write template bytecode cache: %s", e)
+
+
 class TemplateEngine:
     """Template rendering engine.
 
@@ -37,7 +190,14 @@ class TemplateEngine:
 
     Core Features:
         - **Template Rendering**: Uses Jinja2 to render Widget templates.
-        - **Cache Management**: Template compilation caching improves performance.
+        - **Template Registry**: Widget templates are compiled once, looked up by class.
+        - **Cache Management**: Ad-hoc template strings are kept in a bounded LRU cache.
+        - **Bytecode Cache**: Optional on-disk cache of compiled templates, shared
+          across processes.
+        - **Precompiled Templates**: Optional ahead-of-time compiled modules, looked
+          up by widget class.
+        - **Native Backend**: Optional Jinja-free rendering through generated Python
+          functions.
         - **Error Handling**: Safe template rendering and error recovery.
         - **Context Processing**: Automatic handling of template context data.
 
@@ -62,61 +222,325 @@ class TemplateEngine:
         )
         print(error_html) # Output: <div>Rendering failed, please contact administrator.</div>
         ```
+
+        Enable the on-disk bytecode cache for short-lived processes, either
+        explicitly or via the `EMAILWIDGET_TEMPLATE_CACHE_DIR` environment variable:
+
+        ```python
+        engine = TemplateEngine(bytecode_cache_dir="/tmp/emailwidget_templates")
+        ```
+
+        Load built-in widget templates generated by
+        `python -m email_widget.precompile`, either explicitly or via the
+        `EMAILWIDGET_PRECOMPILED_TEMPLATES` environment variable:
+
+        ```python
+        engine = TemplateEngine(precompiled_dir="./emailwidget_precompiled")
+        ```
+
+        Render through generated Python functions instead of the Jinja2 runtime,
+        either explicitly or via the `EMAILWIDGET_RENDER_BACKEND` environment variable.
+        Templates the native backend cannot translate are rendered with Jinja2:
+
+        ```python
+        engine = TemplateEngine(render_backend="native")
+        ```
+
+        Widgets and `Email` always render through the shared engine returned by
+        `get_template_engine()`, which reads its settings from the environment
+        variables above when it is first created. Constructor arguments only
+        affect engines used directly, so to switch widget rendering to the native
+        backend set the variable before the first widget is created:
+
+        ```bash
+        EMAILWIDGET_RENDER_BACKEND=native python build_report.py
+        ```
     """
 
-    def __init__(self):
-        """Initialize template engine."""
+    def __init__(
+        self,
+        bytecode_cache_dir: str | Path | None = None,
+        precompiled_dir: str | Path | None = None,
+        max_cached_templates: int = DEFAULT_MAX_CACHED_TEMPLATES,
+        render_backend: str | None = None,
+    ):
+        """Initialize template engine.
+
+        Args:
+            bytecode_cache_dir (Optional[Union[str, Path]]): Directory for the on-disk
+                template bytecode cache. Defaults to the
+                `EMAILWIDGET_TEMPLATE_CACHE_DIR` environment variable; the cache is
+                disabled if neither is set.
+            precompiled_dir (Optional[Union[str, Path]]): Directory of precompiled
+                template modules. Defaults to the `EMAILWIDGET_PRECOMPILED_TEMPLATES`
+                environment variable; templates are compiled at runtime if neither is
+                set.
+            max_cached_templates (int): Maximum number of ad-hoc template strings kept
+                compiled; least recently used ones are evicted. Named templates in the
+                registry are not counted.
+            render_backend (Optional[str]): "jinja" or "native". Defaults to the
+                `EMAILWIDGET_RENDER_BACKEND` environment variable, then "jinja". The
+                environment variable is the only way to choose the backend used by
+                widgets, see `get_template_engine()`.
+
+        Raises:
+            ValueError: If the render backend is unknown.
+        """
         self._logger = get_project_logger()
 
+        if render_backend is None:
+            render_backend = os.getenv(RENDER_BACKEND_ENV) or "jinja"
+        if render_backend not in RENDER_BACKENDS:
+            raise ValueError(
+                f"Invalid render backend: {render_backend}, "
+                f"must be one of {', '.join(RENDER_BACKENDS)}"
+            )
+        self._render_backend = render_backend
+
+        if bytecode_cache_dir is None:
+            bytecode_cache_dir = os.getenv(BYTECODE_CACHE_DIR_ENV) or None
+
+        bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            try:
+                bytecode_cache = TemplateBytecodeCache(bytecode_cache_dir)
+            except OSError as e:
+                self._logger.warning("Template bytecode cache disabled: %s", e)
+
         # Create Jinja2 environment
-        self._env = Environment(
-            loader=StringTemplateLoader(),
-            autoescape=False,  # Email HTML doesn't need auto-escaping
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
+        self._env = create_environment(StringTemplateLoader(), bytecode_cache)
+
+        # Template registry {template_key: (template_string, Template)}
+        self._template_registry: dict[str, tuple[str, CompiledTemplate]] = {}
+
+        # LRU cache for ad-hoc templates {template_string: Template}
+        self._template_cache: OrderedDict[str, CompiledTemplate] = OrderedDict()
+        self._max_cached_templates = max_cached_templates
+        self._cache_evictions = 0
+        self._cache_lock = threading.Lock()
+
+        # Precompiled templates {template_key: source_hash}
+        self._precompiled_dir: Path | None = None
+        self._precompiled_loader: ModuleLoader | None = None
+        self._precompiled_manifest: dict[str, str] = {}
 
-        # Template cache {template_string: Template}
-        self._template_cache: dict[str, Template] = {}
+        if precompiled_dir is None:
+            precompiled_dir = os.getenv(PRECOMPILED_DIR_ENV) or None
+        if precompiled_dir is not None:
+            self._load_precompiled(Path(precompiled_dir))
 
         self._logger.debug("Template engine initialization complete")
 
-    def _get_template(self, template_string: str) -> Template:
-        """Get compiled template object.
+    def _load_precompiled(self, precompiled_dir: Path) -> None:
+        """Load the manifest of precompiled template modules.
+
+        Precompiled templates are ignored (with a warning) if the manifest is missing,
+        unreadable, or was generated by a different Jinja2 version.
+
+        Args:
+            precompiled_dir (Path): Directory written by
+                `python -m email_widget.precompile`.
+        """
+        try:
+            with open(precompiled_dir / PRECOMPILED_MANIFEST, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError) as e:
+            self._logger.warning("Precompiled templates unavailable: %s", e)
+            return
+
+        if manifest.get("jinja2_version") != jinja2.__version__:
+            self._logger.warning(
+                "Precompiled templates built with Jinja2 %s, running %s; "
+                "compiling templates at runtime",
+                manifest.get("jinja2_version"),
+                jinja2.__version__,
+            )
+            return
+
+        self._precompiled_dir = precompiled_dir
+        self._precompiled_loader = ModuleLoader(str(precompiled_dir))
+        self._precompiled_manifest = dict(manifest.get("templates", {}))
+        self._logger.debug(
+            "Loaded %d precompiled templates from %s",
+            len(self._precompiled_manifest),
+            precompiled_dir,
+        )
+
+    def _load_precompiled_template(
+        self, name: str, template_string: str
+    ) -> Template | None:
+        """Load a precompiled template by name.
+
+        The template source is checked against the manifest hash, so a widget whose
+        `TEMPLATE` changed after precompilation falls back to runtime compilation
+        instead of rendering stale output.
+
+        Args:
+            name (str): Template key, see `get_template_key`.
+            template_string (str): Current template source.
+
+        Returns:
+            Optional[Template]: Precompiled template, or None if unavailable or stale.
+        """
+        if self._precompiled_loader is None:
+            return None
+        if self._precompiled_manifest.get(name) != get_source_hash(template_string):
+            self._logger.debug(
+                "Precompiled template %s is stale, compiling at runtime", name
+            )
+            return None
+
+        try:
+            return self._precompiled_loader.load(
+                self._env, name, self._env.make_globals(None)
+            )
+        except Exception as e:
+            self._logger.warning("Failed to load precompiled template %s: %s", name, e)
+            return None
+
+    @property
+    def render_backend(self) -> str:
+        """Get the render backend, "jinja" or "native"."""
+        return self._render_backend
+
+    def _compile_template(self, template_string: str) -> CompiledTemplate:
+        """Compile a template string.
+
+        With the native backend, templates are translated into Python functions;
+        templates using syntax the native backend does not support are compiled
+        with Jinja2 instead.
 
         Args:
             template_string (str): Template string.
 
         Returns:
-            Template: Compiled Template object.
+            Union[Template, NativeTemplate]: Compiled template object.
 
         Raises:
             TemplateError: Thrown when template compilation fails.
         """
-        # Check cache
-        if template_string in self._template_cache:
-            return self._template_cache[template_string]
-
+        template: CompiledTemplate
         try:
-            # Compile template
-            template = self._env.from_string(template_string)
-
-            # Cache template
-            self._template_cache[template_string] = template
-
-            self._logger.debug(f"Compiled and cached template, length: {len(template_string)} characters")
+            if self._render_backend == "native":
+                try:
+                    template = compile_native(self._env, template_string)
+                    self._logger.debug(
+                        "Compiled native template, length: %d characters",
+                        len(template_string),
+                    )
+                    return template
+                except UnsupportedTemplateError as e:
+                    self._logger.debug(
+                        "Native backend unsupported (%s), using Jinja2", e
+                    )
+
+            # Go through the loader when bytecode caching is enabled
+            if self._env.bytecode_cache is not None and self._env.loader is not None:
+                template = self._env.loader.load(
+                    self._env, template_string, self._env.make_globals(None)
+                )
+            else:
+                template = self._env.from_string(template_string)
+
+            self._logger.debug(
+                "Compiled template, length: %d characters", len(template_string)
+            )
             return template
 
         except TemplateError as e:
-            self._logger.error(f"Template compilation failed: {e}")
+            self._logger.error("Template compilation failed: %s", e)
             raise
 
-    def render(self, template_string: str, context: dict[str, Any]) -> str:
+    def register_template(self, name: str, template_string: str) -> CompiledTemplate:
+        """Register a named template.
+
+        Registered templates are looked up by name, without hashing their source,
+        and are never evicted. Widgets register their `TEMPLATE` automatically on
+        first render under `get_template_key(widget_class)`. Registering a name
+        again replaces the previous template.
+
+        Args:
+            name (str): Template key.
+            template_string (str): Template string.
+
+        Returns:
+            Union[Template, NativeTemplate]: Compiled template object.
+
+        Raises:
+            TemplateError: Thrown when template compilation fails.
+
+        Examples:
+            >>> engine = get_template_engine()
+            >>> engine.register_template("greeting", "<p>Hello {{ name }}</p>")
+            >>> engine.render("<p>Hello {{ name }}</p>", {"name": "Ann"}, name="greeting")
+        """
+        template: CompiledTemplate | None = None
+        if self._render_backend != "native" and name in self._precompiled_manifest:
+            template = self._load_precompiled_template(name, template_string)
+        if template is None:
+            template = self._compile_template(template_string)
+
+        self._template_registry[name] = (template_string, template)
+        return template
+
+    def _get_template(
+        self, template_string: str, name: str | None = None
+    ) -> CompiledTemplate:
+        """Get compiled template object.
+
+        Named templates come from the registry; the source comparison is an
+        identity check in the common case where the same class attribute is
+        passed every time. Unnamed templates go through the bounded LRU cache.
+
+        Args:
+            template_string (str): Template string.
+            name (Optional[str]): Template key for registry lookup.
+
+        Returns:
+            Union[Template, NativeTemplate]: Compiled template object.
+
+        Raises:
+            TemplateError: Thrown when template compilation fails.
+        """
+        if name is not None:
+            entry = self._template_registry.get(name)
+            if entry is not None and entry[0] == template_string:
+                return entry[1]
+            return self.register_template(name, template_string)
+
+        # Check cache
+        with self._cache_lock:
+            template = self._template_cache.get(template_string)
+            if template is not None:
+                self._template_cache.move_to_end(template_string)
+                return template
+
+        template = self._compile_template(template_string)
+
+        # Cache template, evicting the least recently used ones beyond the limit
+        with self._cache_lock:
+            self._template_cache[template_string] = template
+            while len(self._template_cache) > max(self._max_cached_templates, 0):
+                self._template_cache.popitem(last=False)
+                self._cache_evictions += 1
+        return template
+
+    def render(
+        self,
+        template_string: str,
+        context: dict[str, Any],
+        name: str | None = None,
+        timings: dict[str, float] | None = None,
+    ) -> str:
         """Render template.
 
         Args:
             template_string (str): Template string.
             context (Dict[str, Any]): Template context data.
+            name (Optional[str]): Template key for registry lookup, see
+                `register_template`.
+            timings (Optional[Dict[str, float]]): If given, receives the seconds spent
+                on template lookup/compilation ("template") and rendering ("render").
 
         Returns:
             str: Rendered HTML string.
@@ -125,21 +549,61 @@ class TemplateEngine:
             TemplateError: Thrown when template rendering fails.
         """
         try:
-            template = self._get_template(template_string)
-            result = template.render(**context)
-
-            self._logger.debug(f"Template rendering successful, output length: {len(result)} characters")
+            if timings is None:
+                template = self._get_template(template_string, name)
+                result = template.render(**context)
+            else:
+                start = time.perf_counter()
+                template = self._get_template(template_string, name)
+                rendered = time.perf_counter()
+                result = template.render(**context)
+                timings["template"] = rendered - start
+                timings["render"] = time.perf_counter() - rendered
+
+            if self._logger.is_enabled_for(logging.DEBUG):
+                self._logger.debug(
+                    "Template rendering successful, output length: %d characters",
+                    len(result),
+                )
             return result
 
         except TemplateError as e:
-            self._logger.error(f"Template rendering failed: {e}")
+            self._logger.error("Template rendering failed: %s", e)
             raise
         except Exception as e:
-            self._logger.error(f"Template rendering encountered unknown error: {e}")
+            self._logger.error("Template rendering encountered unknown error: %s", e)
             raise TemplateError(f"Template rendering failed: {e}")
 
+    def render_stream(
+        self, template_string: str, context: dict[str, Any], name: str | None = None
+    ) -> Iterator[str]:
+        """Render template incrementally.
+
+        Uses Jinja2's `Template.generate()` so output is produced chunk by chunk
+        instead of being joined into a single string.
+
+        Args:
+            template_string (str): Template string.
+            context (Dict[str, Any]): Template context data.
+            name (Optional[str]): Template key for registry lookup, see
+                `register_template`.
+
+        Returns:
+            Iterator[str]: Iterator over rendered HTML chunks.
+
+        Raises:
+            TemplateError: Thrown when template compilation fails.
+        """
+        template = self._get_template(template_string, name)
+        return template.generate(**context)
+
     def render_safe(
-        self, template_string: str, context: dict[str, Any], fallback: str = ""
+        self,
+        template_string: str,
+        context: dict[str, Any],
+        fallback: str = "",
+        name: str | None = None,
+        timings: dict[str, float] | None = None,
     ) -> str:
         """Safely render template.
 
@@ -149,14 +613,20 @@ class TemplateEngine:
             template_string (str): Template string.
             context (Dict[str, Any]): Template context data.
             fallback (str): Fallback content on rendering failure.
+            name (Optional[str]): Template key for registry lookup, see
+                `register_template`.
+            timings (Optional[Dict[str, float]]): If given, receives stage timings, see
+                `render`.
 
         Returns:
             str: Rendered HTML string or fallback content.
         """
         try:
-            return self.render(template_string, context)
+            return self.render(template_string, context, name, timings)
         except Exception as e:
-            self._logger.warning(f"Template safe rendering failed, using fallback content: {e}")
+            self._logger.warning(
+                "Template safe rendering failed, using fallback content: %s", e
+            )
             return fallback
 
     def validate_template(self, template_string: str) -> bool:
@@ -178,20 +648,38 @@ class TemplateEngine:
 
     def clear_cache(self) -> None:
         """Clear template cache."""
-        self._template_cache.clear()
+        with self._cache_lock:
+            self._template_cache.clear()
+        self._template_registry.clear()
         self._logger.debug("Cleared template cache")
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics.
 
         Returns:
-            Dict[str, Any]: Cache statistics dictionary, including cached template count and total size (bytes).
+            Dict[str, Any]: Cache statistics dictionary, including registered
+                template count, ad-hoc cached template count, limit, eviction count and
+                total size (bytes), the bytecode cache and precompiled template
+                directories (None when disabled), the number of available precompiled
+                templates and the render backend.
         """
+        bytecode_cache = self._env.bytecode_cache
         return {
+            "registered_templates": len(self._template_registry),
             "cached_templates": len(self._template_cache),
+            "max_cached_templates": self._max_cached_templates,
+            "cache_evictions": self._cache_evictions,
             "cache_size_bytes": sum(
-                len(template_str) for template_str in self._template_cache.keys()
+                len(template_str) for template_str in list(self._template_cache)
             ),
+            "bytecode_cache_dir": bytecode_cache.directory
+            if isinstance(bytecode_cache, TemplateBytecodeCache)
+            else None,
+            "precompiled_dir": str(self._precompiled_dir)
+            if self._precompiled_dir is not None
+            else None,
+            "precompiled_templates": len(self._precompiled_manifest),
+            "render_backend": self._render_backend,
         }
 
 
@@ -203,7 +691,11 @@ def get_template_engine() -> TemplateEngine:
     """Get global template engine instance.
 
     This function implements singleton pattern, ensuring only one `TemplateEngine` instance
-    exists throughout the entire application.
+    exists throughout the entire application. All widgets and `Email` render through
+    this instance. It is created with default arguments on first use, so the
+    `EMAILWIDGET_TEMPLATE_CACHE_DIR`, `EMAILWIDGET_PRECOMPILED_TEMPLATES` and
+    `EMAILWIDGET_RENDER_BACKEND` environment variables are how widget rendering is
+    configured.
 
     Returns:
         TemplateEngine: Globally unique `TemplateEngine` instance.
@@ -3,15 +3,31 @@ This module provides the core functionality of the EmailWidget library, responsi
 """
 
 import datetime
+import time
+from collections.abc import Iterator
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from email_widget.core.base import BaseWidget
 from email_widget.core.config import EmailConfig
 from email_widget.core.logger import get_project_logger
-from email_widget.core.template_engine import TemplateEngine
+from email_widget.core.render_profile import (
+    SORT_FIELDS,
+    RenderProfile,
+    WidgetRenderProfile,
+)
+from email_widget.core.template_engine import get_template_engine, get_template_key
 
 if TYPE_CHECKING:
+    import pandas as pd
+    import polars as pl
+
     from email_widget.core.enums import (
         AlertType,
         LayoutType,
@@ -23,6 +39,21 @@ if TYPE_CHECKING:
     )
 
 
+def _render_widget(widget: BaseWidget) -> tuple[str, bool]:
+    """Render a single widget, used as the task submitted to worker pools.
+
+    Defined at module level so it can be pickled for process pools. Bypasses the
+    render cache; the caller stores the result on its own copy of the widget.
+
+    Args:
+        widget: Widget to render
+
+    Returns:
+        Rendered widget HTML and whether rendering succeeded
+    """
+    return widget._render_template()
+
+
 class Email:
     """Main email class responsible for managing and rendering email content.
 
@@ -103,6 +134,9 @@ class Email:
 </body>
 </html>"""
 
+    # Placeholder substituted with widget output when streaming the template
+    _STREAM_PLACEHOLDER = "<!--emailwidget:widget-content-->"
+
     def __init__(self, title: str = "Email Report") -> None:
         """Initialize Email object.
 
@@ -115,7 +149,7 @@ class Email:
         self.widgets: list[BaseWidget] = []
         self.config = EmailConfig()
         self._created_at = datetime.datetime.now()
-        self._template_engine = TemplateEngine()
+        self._template_engine = get_template_engine()
         self._logger = get_project_logger()
 
     def add_widget(self, widget: BaseWidget) -> "Email":
@@ -353,22 +387,29 @@ class Email:
 
     def add_table_from_df(
         self,
-        df: "pd.DataFrame",
+        df: "pd.DataFrame | pl.DataFrame | pl.LazyFrame",
         title: str | None = None,
         show_index: bool = False,
         striped: bool = True,
         bordered: bool = True,
         hoverable: bool = True,
+        max_rows: int | None = None,
+        max_rows_strategy: str = "head",
     ) -> "Email":
         """Quickly add a table widget from DataFrame.
 
         Args:
-            df: pandas DataFrame object
+            df: pandas DataFrame, or Polars DataFrame/LazyFrame (needs neither pandas
+                nor pyarrow)
             title: Table title, optional
             show_index: Whether to show row index
             striped: Whether to use striped style
             bordered: Whether to show borders
             hoverable: Whether to support hover effects
+            max_rows: Maximum number of rows to render, rows over the limit are
+                dropped before conversion and summarized in a "… N more rows" row
+            max_rows_strategy: Rows kept under max_rows: "head", "tail", "head_tail"
+                or "sample", see `TableWidget.set_max_rows`
 
         Returns:
             Returns self to support method chaining
@@ -378,18 +419,25 @@ class Email:
             >>> df = pd.DataFrame({"Name": ["Alice", "Bob"], "Score": [100, 95]})
             >>> email = Email()
             >>> email.add_table_from_df(df, "Grade Statistics")
+            >>> email.add_table_from_df(big_df, "Orders", max_rows=1000, max_rows_strategy="head_tail")
         """
-        from email_widget.utils.optional_deps import check_optional_dependency
+        from email_widget.utils.optional_deps import (
+            check_optional_dependency,
+            is_polars_frame,
+        )
         from email_widget.widgets.table_widget import TableWidget
 
-        # Check pandas dependency
-        check_optional_dependency("pandas", "pandas")
+        # Check pandas dependency, Polars frames are read without pandas
+        if not is_polars_frame(df):
+            check_optional_dependency("pandas", "pandas")
 
         widget = TableWidget()
 
         if title:
             widget.set_title(title)
 
+        if max_rows is not None:
+            widget.set_max_rows(max_rows, max_rows_strategy)
         widget.set_dataframe(df)
         widget.show_index(show_index)
         widget.set_striped(striped)
@@ -1224,31 +1272,108 @@ class Email:
 
         return main_styles + mso_styles
 
-    def _render_email(self) -> str:
-        """Render complete email HTML content.
+    def _iter_widget_html(
+        self, workers: int | None = None, executor: str = "thread"
+    ) -> Iterator[str]:
+        """Render widgets and yield their HTML in order.
 
-        Render all widgets into complete HTML email, including header, body and footer.
+        Widgets that fail to render are logged and skipped, so one broken widget
+        does not prevent the rest of the email from being produced. Sequential
+        rendering goes through `render_html_stream()`, passing on the chunks of
+        widgets that render incrementally (e.g. tables with a row source).
 
-        Returns:
-            Complete HTML email string
+        Args:
+            workers: Number of concurrent workers, renders sequentially when None or 1
+            executor: Pool type used when workers > 1, "thread" or "process"
+
+        Yields:
+            HTML fragment of each widget followed by a newline
         """
-        try:
-            # Generate widget content
-            widget_content = ""
+        if workers is not None and workers > 1 and len(self.widgets) > 1:
+            yield from self._iter_widget_html_parallel(workers, executor)
+            return
+
+        for widget in self.widgets:
+            rendered = False
+            try:
+                for chunk in widget.render_html_stream():
+                    if chunk:
+                        rendered = True
+                        yield chunk
+            except Exception as e:
+                self._logger.error(f"Widget rendering failed: {e}")
+            if rendered:
+                yield "\n"
+
+    def _iter_widget_html_parallel(self, workers: int, executor: str) -> Iterator[str]:
+        """Render widgets concurrently and yield their HTML in the original order.
+
+        Widgets whose cached HTML is still valid are not sent to the pool. The
+        results of the others are stored back in each widget's render cache, so
+        the next export only renders widgets that changed.
+
+        Args:
+            workers: Number of concurrent workers
+            executor: Pool type, "thread" or "process"
+
+        Yields:
+            HTML fragment of each widget followed by a newline
+        """
+        pool: Executor
+        if executor == "process":
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            pool = ThreadPoolExecutor(max_workers=workers)
+
+        with pool:
+            tasks: list[tuple[BaseWidget, Any, Future[tuple[str, bool]] | str]] = []
             for widget in self.widgets:
+                cached_html, render_version = widget._lookup_cached_html()
+                if cached_html is not None:
+                    tasks.append((widget, render_version, cached_html))
+                else:
+                    future = pool.submit(_render_widget, widget)
+                    tasks.append((widget, render_version, future))
+
+            for widget, render_version, result in tasks:
                 try:
-                    widget_html = widget.render_html()
+                    if isinstance(result, Future):
+                        widget_html, succeeded = result.result()
+                        if succeeded:
+                            widget._store_cached_html(widget_html, render_version)
+                    else:
+                        widget_html = result
                     if widget_html:
-                        widget_content += widget_html + "\n"
+                        yield widget_html + "\n"
                 except Exception as e:
                     self._logger.error(f"Widget rendering failed: {e}")
                     continue
 
+    def _render_email(
+        self, workers: int | None = None, executor: str = "thread"
+    ) -> str:
+        """Render complete email HTML content.
+
+        Render all widgets into complete HTML email, including header, body and footer.
+
+        Args:
+            workers: Number of concurrent workers used to render widgets
+            executor: Pool type used when workers > 1, "thread" or "process"
+
+        Returns:
+            Complete HTML email string
+        """
+        try:
+            # Generate widget content
+            widget_content = "".join(self._iter_widget_html(workers, executor))
+
             # Prepare template data
             context = self._get_template_context(widget_content)
 
             # Use template engine to render
-            return self._template_engine.render_safe(self.TEMPLATE, context)
+            return self._template_engine.render_safe(
+                self.TEMPLATE, context, name=get_template_key(type(self))
+            )
 
         except Exception as e:
             self._logger.error(f"Email rendering failed: {e}")
@@ -1288,13 +1413,18 @@ class Email:
         }
 
     def export_html(
-        self, filename: str | None = None, output_dir: str | None = None
+        self,
+        filename: str | None = None,
+        output_dir: str | None = None,
+        streaming: bool = False,
     ) -> Path:
         """Export email as HTML file.
 
         Args:
             filename: Optional filename, auto-generated if not provided
             output_dir: Optional output directory, uses default directory from config if not provided
+            streaming: Whether to write the email chunk by chunk via `export_stream()`
+                instead of rendering the whole document in memory first
 
         Returns:
             Complete path of exported file
@@ -1306,6 +1436,9 @@ class Email:
             >>>
             >>> # Specify filename and directory
             >>> path = email.export_html("my_report.html", "./reports")
+            >>>
+            >>> # Write a very large report without holding it in memory
+            >>> path = email.export_html("big_report.html", streaming=True)
         """
         try:
             output_dir = output_dir or self.config.get_output_dir()
@@ -1321,10 +1454,15 @@ class Email:
             output_path = Path(output_dir) / filename
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            html_content = self.export_str()
+            if streaming:
+                with open(output_path, "w", encoding="utf-8") as f:
+                    for chunk in self.export_stream():
+                        f.write(chunk)
+            else:
+                html_content = self.export_str()
 
-            with open(output_path, "w", encoding="utf-8") as f:
-                f.write(html_content)
+                with open(output_path, "w", encoding="utf-8") as f:
+                    f.write(html_content)
 
             self._logger.info(f"Email exported to: {output_path}")
             return output_path
@@ -1333,18 +1471,149 @@ class Email:
             self._logger.error(f"Failed to export HTML file: {e}")
             raise
 
-    def export_str(self) -> str:
+    def export_str(self, workers: int | None = None, executor: str = "thread") -> str:
         """Export email as HTML text.
 
+        Widgets are rendered one after another by default. Passing `workers`
+        renders them concurrently and reassembles the output in widget order;
+        a widget that fails to render is skipped exactly as in sequential mode.
+        Use `executor="process"` for CPU-heavy emails, since threads share the GIL.
+
+        Args:
+            workers: Number of concurrent workers, renders sequentially when None or 1
+            executor: Pool type, "thread" or "process"
+
         Returns:
             Complete HTML email string
 
+        Raises:
+            ValueError: If executor is not "thread" or "process"
+
         Examples:
             >>> email = Email("Preview Test")
             >>> html = email.export_str()
             >>> print(html[:100])  # Print first 100 characters
+            >>>
+            >>> # Render a large email with 4 worker processes
+            >>> html = email.export_str(workers=4, executor="process")
         """
-        return self._render_email()
+        if executor not in ("thread", "process"):
+            raise ValueError(
+                f"Invalid executor: {executor}, must be 'thread' or 'process'"
+            )
+        return self._render_email(workers, executor)
+
+    def export_stream(self) -> Iterator[str]:
+        """Export email as a stream of HTML chunks.
+
+        The email shell (header, styles, footer) is rendered with Jinja2's
+        `Template.generate()` and each widget is rendered only when the stream
+        reaches it, so peak memory is bounded by the largest single widget rather
+        than the whole document. Joining the chunks gives the same result as
+        `export_str()`.
+
+        Yields:
+            HTML chunks in document order
+
+        Raises:
+            TemplateError: If the email template cannot be rendered
+
+        Examples:
+            >>> email = Email("Nightly Report")
+            >>> with open("report.html", "w", encoding="utf-8") as f:
+            ...     for chunk in email.export_stream():
+            ...         f.write(chunk)
+        """
+        context = self._get_template_context(self._STREAM_PLACEHOLDER)
+
+        try:
+            chunks = self._template_engine.render_stream(
+                self.TEMPLATE, context, name=get_template_key(type(self))
+            )
+            for chunk in chunks:
+                if self._STREAM_PLACEHOLDER not in chunk:
+                    yield chunk
+                    continue
+
+                before, _, after = chunk.partition(self._STREAM_PLACEHOLDER)
+                if before:
+                    yield before
+                yield from self._iter_widget_html()
+                if after:
+                    yield after
+        except Exception as e:
+            self._logger.error(f"Email streaming failed: {e}")
+            raise
+
+    def render_profile(self, sort_by: str = "total_time") -> RenderProfile:
+        """Render the email while timing every widget.
+
+        Each widget is rendered once, bypassing the render cache, and timed in
+        `get_template_context()`, template lookup/compilation and template rendering.
+        Profiling only happens when this method is called; normal exports are not
+        instrumented.
+
+        Args:
+            sort_by: Field to sort widgets by, most expensive first: "total_time",
+                "context_time", "template_time", "render_time", "output_bytes",
+                or "index" for email order
+
+        Returns:
+            RenderProfile with one entry per widget, printable as a table
+
+        Raises:
+            ValueError: If sort_by is not a known field
+
+        Examples:
+            >>> profile = email.render_profile()
+            >>> print(profile)
+            >>> slowest = profile.widgets[0]
+            >>> print(slowest.widget_type, slowest.total_time)
+        """
+        if sort_by not in SORT_FIELDS:
+            raise ValueError(
+                f"Invalid sort field: {sort_by}, must be one of {', '.join(SORT_FIELDS)}"
+            )
+
+        start = time.perf_counter()
+        profiles = []
+        widget_html = []
+        for index, widget in enumerate(self.widgets):
+            widget_start = time.perf_counter()
+            try:
+                html, timings = widget.render_profiled()
+            except Exception as e:
+                self._logger.error(f"Widget rendering failed: {e}")
+                continue
+            elapsed = time.perf_counter() - widget_start
+
+            if html:
+                widget_html.append(html + "\n")
+            profiles.append(
+                WidgetRenderProfile(
+                    index=index,
+                    widget_type=type(widget).__name__,
+                    widget_id=widget.widget_id,
+                    timings=timings,
+                    total_time=elapsed,
+                    output_bytes=len(html.encode("utf-8")),
+                )
+            )
+
+        email_start = time.perf_counter()
+        context = self._get_template_context("".join(widget_html))
+        email_html = self._template_engine.render_safe(
+            self.TEMPLATE, context, name=get_template_key(type(self))
+        )
+        end = time.perf_counter()
+
+        return RenderProfile(
+            profiles,
+            email_time=end - email_start,
+            total_time=end - start,
+            output_bytes=len(email_html.encode("utf-8")),
+            sort_by=sort_by,
+        )
 
     def get_widget_count(self) -> int:
         """Get the number of widgets in the current email.
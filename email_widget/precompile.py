@@ -0,0 +1,132 @@
+"""Ahead-of-time template compilation
+
+Compiles the `TEMPLATE` of every built-in widget and of `Email` into Python modules
+with Jinja2's `compile_templates`, so rendering no longer has to lex, parse and
+compile template strings at runtime.
+
+Usage:
+    python -m email_widget.precompile ./emailwidget_precompiled
+    EMAILWIDGET_PRECOMPILED_TEMPLATES=./emailwidget_precompiled python report.py
+"""
+
+import argparse
+import compileall
+import importlib
+import inspect
+import json
+import pkgutil
+from pathlib import Path
+
+import jinja2
+from jinja2 import DictLoader
+
+from email_widget.core.base import BaseWidget
+from email_widget.core.logger import get_project_logger
+from email_widget.core.template_engine import (
+    PRECOMPILED_MANIFEST,
+    create_environment,
+    get_source_hash,
+    get_template_key,
+)
+
+# Default output directory, relative to the current working directory
+DEFAULT_OUTPUT_DIR = "emailwidget_precompiled"
+
+
+def collect_templates() -> dict[str, str]:
+    """Collect the templates of all built-in widgets and the Email class.
+
+    Returns:
+        Dict[str, str]: Mapping of template key to template source.
+    """
+    import email_widget.widgets
+    from email_widget.email import Email
+
+    templates = {get_template_key(Email): Email.TEMPLATE}
+
+    for module_info in pkgutil.iter_modules(email_widget.widgets.__path__):
+        module = importlib.import_module(f"email_widget.widgets.{module_info.name}")
+        for _, cls in inspect.getmembers(module, inspect.isclass):
+            template = getattr(cls, "TEMPLATE", None)
+            if (
+                issubclass(cls, BaseWidget)
+                and cls.__module__ == module.__name__
+                and template
+            ):
+                templates[get_template_key(cls)] = template
+
+    return dict(sorted(templates.items()))
+
+
+def precompile_templates(output_dir: str | Path = DEFAULT_OUTPUT_DIR) -> Path:
+    """Compile all built-in templates into Python modules.
+
+    Writes one byte-compiled module per template plus a manifest recording each
+    template's source hash and the Jinja2 version, which `TemplateEngine` uses to reject
+    stale or incompatible modules.
+
+    Args:
+        output_dir (Union[str, Path]): Directory to write the modules to.
+
+    Returns:
+        Path: The output directory.
+
+    Raises:
+        TemplateError: If a template fails to compile.
+
+    Examples:
+        >>> from email_widget.precompile import precompile_templates
+        >>> path = precompile_templates("./emailwidget_precompiled")
+        >>> engine = TemplateEngine(precompiled_dir=path)
+    """
+    logger = get_project_logger()
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    templates = collect_templates()
+    env = create_environment(DictLoader(templates))
+    env.compile_templates(str(output_path), zip=None, ignore_errors=False)
+
+    # Byte-compile the generated modules so importing them skips Python's compiler too
+    compileall.compile_dir(str(output_path), quiet=1)
+
+    manifest = {
+        "jinja2_version": jinja2.__version__,
+        "templates": {
+            name: get_source_hash(source) for name, source in templates.items()
+        },
+    }
+    with open(output_path / PRECOMPILED_MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    logger.info("Precompiled %d templates into %s", len(templates), output_path)
+    return output_path
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments, defaults to `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m email_widget.precompile",
+        description="Precompile EmailWidget templates into Python modules.",
+    )
+    parser.add_argument(
+        "output_dir",
+        nargs="?",
+        default=DEFAULT_OUTPUT_DIR,
+        help=f"output directory (default: {DEFAULT_OUTPUT_DIR})",
+    )
+    args = parser.parse_args(argv)
+
+    output_path = precompile_templates(args.output_dir)
+    print(
+        f"Precompiled templates written to {output_path}. "
+        f"Set EMAILWIDGET_PRECOMPILED_TEMPLATES={output_path} to use them."
+    )
+
+
+if __name__ == "__main__":
+    main()
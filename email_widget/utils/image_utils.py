@@ -55,11 +55,10 @@ class ImageUtils:
 
             # Check cache (used in embed mode or forced embed for local files)
             if cache_manager:
-                cached_result = cache_manager.get(source_str)
-                if cached_result:
-                    # Data retrieved from cache needs to be converted to base64 again
-                    cached_data, cached_mime_type = cached_result
-                    return ImageUtils.base64_img(cached_data, cached_mime_type)
+                cached_data_uri = cache_manager.get_data_uri(source_str)
+                if cached_data_uri:
+                    # The cache keeps the encoded data URI, no need to encode again
+                    return cached_data_uri
 
             # Get image data
             img_data, mime_type = None, None
@@ -103,12 +102,14 @@ class ImageUtils:
                 logger.error(f"Invalid image data: {source}")
                 return None
 
-            # Cache image data (in embed mode or forced embed for local files)
+            # Convert to base64
+            data_uri = ImageUtils.base64_img(img_data, mime_type)
+
+            # Cache image data and its data URI (in embed mode or forced embed for local files)
             if cache_manager and (embed or is_local_file):
-                cache_manager.set(source_str, img_data, mime_type)
+                cache_manager.set(source_str, img_data, mime_type, data_uri=data_uri)
 
-            # Convert to base64
-            return ImageUtils.base64_img(img_data, mime_type)
+            return data_uri
 
         except Exception as e:
             logger.error(f"Failed to process image source: {e}")
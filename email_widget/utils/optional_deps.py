@@ -3,7 +3,11 @@
 This module provides utility functions for checking and importing optional dependencies, to support progressive feature enablement.
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import polars as pl
+    from typing_extensions import TypeIs
 
 
 def check_optional_dependency(module_name: str, extra_name: str | None = None) -> None:
@@ -70,6 +74,29 @@ def import_optional_dependency(module_name: str, extra_name: str | None = None)
     return __import__(module_name, fromlist=[""])
 
 
+def is_polars_frame(obj: Any) -> "TypeIs[pl.DataFrame | pl.LazyFrame]":
+    """Check if an object is a Polars DataFrame or LazyFrame
+
+    The check uses the module of the object's type, so polars is never imported
+    just to find out that a pandas DataFrame was passed.
+
+    Args:
+        obj: Object to check
+
+    Returns:
+        True for polars DataFrame and LazyFrame objects
+
+    Examples:
+        >>> is_polars_frame(pl.DataFrame({"a": [1]}))
+        True
+    """
+    cls = type(obj)
+    return cls.__module__.split(".")[0] == "polars" and cls.__name__ in (
+        "DataFrame",
+        "LazyFrame",
+    )
+
+
 def requires_pandas(func):
     """Decorator: requires pandas dependency to be available
 
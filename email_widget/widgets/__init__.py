@@ -1,22 +1,79 @@
 """EmailWidget Components Module"""
 
-from email_widget.widgets.alert_widget import AlertWidget
-from email_widget.widgets.button_widget import ButtonWidget
-from email_widget.widgets.card_widget import CardWidget
-from email_widget.widgets.chart_widget import ChartWidget
-from email_widget.widgets.checklist_widget import ChecklistWidget
-from email_widget.widgets.circular_progress_widget import CircularProgressWidget
-from email_widget.widgets.column_widget import ColumnWidget
-from email_widget.widgets.image_widget import ImageWidget
-from email_widget.widgets.log_widget import LogEntry, LogWidget
-from email_widget.widgets.metric_widget import MetricWidget
-from email_widget.widgets.progress_widget import ProgressWidget
-from email_widget.widgets.quote_widget import QuoteWidget
-from email_widget.widgets.separator_widget import SeparatorWidget
-from email_widget.widgets.status_widget import StatusWidget
-from email_widget.widgets.table_widget import TableCell, TableWidget
-from email_widget.widgets.text_widget import TextWidget
-from email_widget.widgets.timeline_widget import TimelineWidget
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from email_widget.widgets.alert_widget import AlertWidget
+    from email_widget.widgets.button_widget import ButtonWidget
+    from email_widget.widgets.card_widget import CardWidget
+    from email_widget.widgets.chart_widget import ChartWidget
+    from email_widget.widgets.checklist_widget import ChecklistWidget
+    from email_widget.widgets.circular_progress_widget import CircularProgressWidget
+    from email_widget.widgets.column_widget import ColumnWidget
+    from email_widget.widgets.image_widget import ImageWidget
+    from email_widget.widgets.log_widget import LogEntry, LogWidget
+    from email_widget.widgets.metric_widget import MetricWidget
+    from email_widget.widgets.progress_widget import ProgressWidget
+    from email_widget.widgets.quote_widget import QuoteWidget
+    from email_widget.widgets.separator_widget import SeparatorWidget
+    from email_widget.widgets.status_widget import StatusWidget
+    from email_widget.widgets.table_widget import TableCell, TableWidget
+    from email_widget.widgets.text_widget import TextWidget
+    from email_widget.widgets.timeline_widget import TimelineWidget
+
+# Public name -> defining module, imported on first attribute access (PEP 562)
+_LAZY_IMPORTS = {
+    "TableWidget": "email_widget.widgets.table_widget",
+    "TableCell": "email_widget.widgets.table_widget",
+    "ImageWidget": "email_widget.widgets.image_widget",
+    "LogWidget": "email_widget.widgets.log_widget",
+    "LogEntry": "email_widget.widgets.log_widget",
+    "AlertWidget": "email_widget.widgets.alert_widget",
+    "TextWidget": "email_widget.widgets.text_widget",
+    "ProgressWidget": "email_widget.widgets.progress_widget",
+    "CircularProgressWidget": "email_widget.widgets.circular_progress_widget",
+    "CardWidget": "email_widget.widgets.card_widget",
+    "StatusWidget": "email_widget.widgets.status_widget",
+    "QuoteWidget": "email_widget.widgets.quote_widget",
+    "ColumnWidget": "email_widget.widgets.column_widget",
+    "ChartWidget": "email_widget.widgets.chart_widget",
+    "ButtonWidget": "email_widget.widgets.button_widget",
+    "SeparatorWidget": "email_widget.widgets.separator_widget",
+    "ChecklistWidget": "email_widget.widgets.checklist_widget",
+    "TimelineWidget": "email_widget.widgets.timeline_widget",
+    "MetricWidget": "email_widget.widgets.metric_widget",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import widget classes on first access.
+
+    Args:
+        name: Attribute name
+
+    Returns:
+        The requested widget class
+
+    Raises:
+        AttributeError: If name is not an exported widget
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes, including public names not imported yet.
+
+    Returns:
+        Sorted attribute names, used by `dir()` and tab completion
+    """
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 __all__ = [
     "TableWidget",
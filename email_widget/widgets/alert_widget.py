@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import AlertType
 from email_widget.core.validators import NonEmptyStringValidator, SizeValidator
 
@@ -39,6 +39,9 @@ class AlertWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if content %}
@@ -78,6 +81,7 @@ class AlertWidget(BaseWidget):
         self._content_validator = NonEmptyStringValidator()
         self._size_validator = SizeValidator()
 
+    @mutator
     def set_content(self, content: str) -> "AlertWidget":
         """Set the main text content displayed in the alert box.
 
@@ -101,6 +105,7 @@ class AlertWidget(BaseWidget):
         self._content = content
         return self
 
+    @mutator
     def set_alert_type(self, alert_type: AlertType) -> "AlertWidget":
         """Set the alert type.
 
@@ -118,6 +123,7 @@ class AlertWidget(BaseWidget):
         self._alert_type = alert_type
         return self
 
+    @mutator
     def set_title(self, title: str) -> "AlertWidget":
         """Set the alert box custom title.
 
@@ -135,6 +141,7 @@ class AlertWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_full_alert(
         self, content: str, alert_type: AlertType, title: str = None
     ) -> "AlertWidget":
@@ -159,6 +166,7 @@ class AlertWidget(BaseWidget):
             self._title = title
         return self
 
+    @mutator
     def clear_title(self) -> "AlertWidget":
         """Clear the alert box custom title.
 
@@ -173,6 +181,7 @@ class AlertWidget(BaseWidget):
         self._title = None
         return self
 
+    @mutator
     def set_icon(self, icon: str) -> "AlertWidget":
         """Set the alert box custom icon.
 
@@ -188,6 +197,7 @@ class AlertWidget(BaseWidget):
         self._icon = icon
         return self
 
+    @mutator
     def show_icon(self, show: bool = True) -> "AlertWidget":
         """Set whether to display the alert box icon.
 
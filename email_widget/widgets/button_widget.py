@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.validators import NonEmptyStringValidator, UrlValidator
 
 
@@ -49,6 +49,9 @@ class ButtonWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if text and href %}
@@ -83,6 +86,7 @@ class ButtonWidget(BaseWidget):
         self._text_validator = NonEmptyStringValidator()
         self._url_validator = UrlValidator()
 
+    @mutator
     def set_text(self, text: str) -> "ButtonWidget":
         """Set the text displayed on the button.
 
@@ -105,6 +109,7 @@ class ButtonWidget(BaseWidget):
         self._text = text
         return self
 
+    @mutator
     def set_href(self, href: str) -> "ButtonWidget":
         """Set the button's link address.
 
@@ -127,6 +132,7 @@ class ButtonWidget(BaseWidget):
         self._href = href
         return self
 
+    @mutator
     def set_background_color(self, color: str) -> "ButtonWidget":
         """Set the button's background color.
 
@@ -142,6 +148,7 @@ class ButtonWidget(BaseWidget):
         self._background_color = color
         return self
 
+    @mutator
     def set_text_color(self, color: str) -> "ButtonWidget":
         """Set the button text color.
 
@@ -157,6 +164,7 @@ class ButtonWidget(BaseWidget):
         self._text_color = color
         return self
 
+    @mutator
     def set_width(self, width: str | None) -> "ButtonWidget":
         """Set the button width.
 
@@ -174,6 +182,7 @@ class ButtonWidget(BaseWidget):
         self._width = width
         return self
 
+    @mutator
     def set_align(self, align: str) -> "ButtonWidget":
         """Set the button alignment.
 
@@ -195,6 +204,7 @@ class ButtonWidget(BaseWidget):
         self._align = align
         return self
 
+    @mutator
     def set_padding(self, padding: str) -> "ButtonWidget":
         """Set the button padding.
 
@@ -210,6 +220,7 @@ class ButtonWidget(BaseWidget):
         self._padding = padding
         return self
 
+    @mutator
     def set_border_radius(self, radius: str) -> "ButtonWidget":
         """Set the button border radius.
 
@@ -225,6 +236,7 @@ class ButtonWidget(BaseWidget):
         self._border_radius = radius
         return self
 
+    @mutator
     def set_font_size(self, size: str) -> "ButtonWidget":
         """Set the button text font size.
 
@@ -240,6 +252,7 @@ class ButtonWidget(BaseWidget):
         self._font_size = size
         return self
 
+    @mutator
     def set_font_weight(self, weight: str) -> "ButtonWidget":
         """Set the button text font weight.
 
@@ -255,6 +268,7 @@ class ButtonWidget(BaseWidget):
         self._font_weight = weight
         return self
 
+    @mutator
     def set_border(self, border: str | None) -> "ButtonWidget":
         """Set the button border style.
 
@@ -270,6 +284,7 @@ class ButtonWidget(BaseWidget):
         self._border = border
         return self
 
+    @mutator
     def set_full_button(
         self, text: str, href: str, background_color: str | None = None
     ) -> "ButtonWidget":
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import IconType, StatusType
 from email_widget.core.validators import NonEmptyStringValidator, SizeValidator
 
@@ -44,6 +44,9 @@ class CardWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if title or content %}
@@ -89,6 +92,7 @@ class CardWidget(BaseWidget):
         self._text_validator = NonEmptyStringValidator()
         self._size_validator = SizeValidator()
 
+    @mutator
     def set_title(self, title: str) -> "CardWidget":
         """Set the card's title.
 
@@ -112,6 +116,7 @@ class CardWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_content(self, content: str) -> "CardWidget":
         """Set the card's main content text.
 
@@ -135,6 +140,7 @@ class CardWidget(BaseWidget):
         self._content = content
         return self
 
+    @mutator
     def set_status(self, status: StatusType) -> "CardWidget":
         """Set the card's status.
 
@@ -152,6 +158,7 @@ class CardWidget(BaseWidget):
         self._status = status
         return self
 
+    @mutator
     def set_icon(self, icon: str | IconType) -> "CardWidget":
         """Set the icon displayed before the title.
 
@@ -173,6 +180,7 @@ class CardWidget(BaseWidget):
             self._icon = icon
         return self
 
+    @mutator
     def add_metadata(self, key: str, value: str) -> "CardWidget":
         """Add a metadata entry to the card.
 
@@ -191,6 +199,7 @@ class CardWidget(BaseWidget):
         self._metadata[key] = value
         return self
 
+    @mutator
     def set_metadata(self, metadata: dict[str, str]) -> "CardWidget":
         """Set all metadata for the card.
 
@@ -208,6 +217,7 @@ class CardWidget(BaseWidget):
         self._metadata = metadata.copy()
         return self
 
+    @mutator
     def clear_metadata(self) -> "CardWidget":
         """Clear all metadata from the card.
 
@@ -8,7 +8,7 @@ import io
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.config import EmailConfig
 from email_widget.utils.image_utils import ImageUtils
 from email_widget.utils.optional_deps import (
@@ -69,6 +69,9 @@ class ChartWidget(BaseWidget, ChartMixin):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if image_url %}
@@ -116,6 +119,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._data_summary: str | None = None
         self._max_width: str = "100%"
 
+    @mutator
     def set_image_url(self, image_url: str | Path, cache: bool = True) -> "ChartWidget":
         """Set chart image URL or file path.
 
@@ -158,6 +162,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._image_url = ImageUtils.process_image_source(image_url, cache=cache)
         return self
 
+    @mutator
     def set_title(self, title: str) -> "ChartWidget":
         """Set chart title.
 
@@ -173,6 +178,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._title = title
         return self
 
+    @mutator
     def set_description(self, description: str) -> "ChartWidget":
         """Set chart description.
 
@@ -188,6 +194,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._description = description
         return self
 
+    @mutator
     def set_alt_text(self, alt: str) -> "ChartWidget":
         """Set image alternative text.
 
@@ -205,6 +212,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._alt_text = alt
         return self
 
+    @mutator
     def set_data_summary(self, summary: str) -> "ChartWidget":
         """Set data summary.
 
@@ -222,6 +230,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._data_summary = summary
         return self
 
+    @mutator
     def set_max_width(self, max_width: str) -> "ChartWidget":
         """Set maximum width of chart container.
 
@@ -238,6 +247,7 @@ class ChartWidget(BaseWidget, ChartMixin):
         self._max_width = max_width
         return self
 
+    @mutator
     def set_chart(self, plt_obj: Any) -> "ChartWidget":
         """Set matplotlib/seaborn chart object.
 
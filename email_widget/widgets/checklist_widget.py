@@ -6,7 +6,7 @@ Supports multiple states, theme colors, and style configurations.
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import StatusType
 from email_widget.core.validators import TypeValidator
 
@@ -51,6 +51,9 @@ class ChecklistWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     TEMPLATE = """
     <div style="
         background: #ffffff;
@@ -185,6 +188,7 @@ class ChecklistWidget(BaseWidget):
         """Get template name."""
         return "checklist_widget.html"
 
+    @mutator
     def add_item(
         self,
         text: str,
@@ -262,6 +266,7 @@ class ChecklistWidget(BaseWidget):
         self._items.append(item)
         return self
 
+    @mutator
     def set_title(self, title: str) -> "ChecklistWidget":
         """设置清单标题。
 
@@ -278,6 +283,7 @@ class ChecklistWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def show_progress_stats(self, show: bool = True) -> "ChecklistWidget":
         """设置是否显示进度统计。
 
@@ -294,6 +300,7 @@ class ChecklistWidget(BaseWidget):
         self._show_progress = show
         return self
 
+    @mutator
     def set_compact_mode(self, compact: bool = True) -> "ChecklistWidget":
         """设置紧凑模式。
 
@@ -310,6 +317,7 @@ class ChecklistWidget(BaseWidget):
         self._compact_mode = compact
         return self
 
+    @mutator
     def clear_items(self) -> "ChecklistWidget":
         """清空所有清单项目。
 
@@ -319,6 +327,7 @@ class ChecklistWidget(BaseWidget):
         self._items.clear()
         return self
 
+    @mutator
     def remove_item(self, index: int) -> "ChecklistWidget":
         """根据索引移除清单项目。
 
@@ -341,6 +350,7 @@ class ChecklistWidget(BaseWidget):
             raise IndexError(f"索引 {index} 超出范围，当前有 {len(self._items)} 个项目")
         return self
 
+    @mutator
     def update_item_status(
         self,
         index: int,
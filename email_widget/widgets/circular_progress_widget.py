@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import ProgressTheme
 from email_widget.core.validators import RangeValidator, SizeValidator
 
@@ -48,6 +48,9 @@ class CircularProgressWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     <div style="{{ wrapper_style }}">
@@ -78,6 +81,7 @@ class CircularProgressWidget(BaseWidget):
         self._value_validator = RangeValidator(0, 1000000)
         self._size_validator = SizeValidator()
 
+    @mutator
     def set_value(self, value: float) -> "CircularProgressWidget":
         """Set current progress value.
 
@@ -101,6 +105,7 @@ class CircularProgressWidget(BaseWidget):
         self._value = max(0, min(value, self._max_value))
         return self
 
+    @mutator
     def set_max_value(self, max_val: float) -> "CircularProgressWidget":
         """Set maximum value for progress.
 
@@ -116,6 +121,7 @@ class CircularProgressWidget(BaseWidget):
         self._max_value = max_val
         return self
 
+    @mutator
     def set_label(self, label: str) -> "CircularProgressWidget":
         """Set descriptive label displayed below the progress ring.
 
@@ -131,6 +137,7 @@ class CircularProgressWidget(BaseWidget):
         self._label = label
         return self
 
+    @mutator
     def set_theme(self, theme: ProgressTheme) -> "CircularProgressWidget":
         """Set color theme for the progress ring.
 
@@ -146,6 +153,7 @@ class CircularProgressWidget(BaseWidget):
         self._theme = theme
         return self
 
+    @mutator
     def set_size(self, size: str) -> "CircularProgressWidget":
         """Set overall size of the circular progress bar.
 
@@ -169,6 +177,7 @@ class CircularProgressWidget(BaseWidget):
         self._size = size
         return self
 
+    @mutator
     def set_stroke_width(self, width: str) -> "CircularProgressWidget":
         """Set line thickness of the circular progress bar.
 
@@ -184,6 +193,7 @@ class CircularProgressWidget(BaseWidget):
         self._stroke_width = width
         return self
 
+    @mutator
     def increment(self, amount: float = 1.0) -> "CircularProgressWidget":
         """Increase progress value.
 
@@ -199,6 +209,7 @@ class CircularProgressWidget(BaseWidget):
         self._value = min(self._max_value, self._value + amount)
         return self
 
+    @mutator
     def decrement(self, amount: float = 1.0) -> "CircularProgressWidget":
         """Decrease progress value.
 
@@ -214,6 +225,7 @@ class CircularProgressWidget(BaseWidget):
         self._value = max(0.0, self._value - amount)
         return self
 
+    @mutator
     def reset(self) -> "CircularProgressWidget":
         """Reset progress to 0.
 
@@ -226,6 +238,7 @@ class CircularProgressWidget(BaseWidget):
         self._value = 0.0
         return self
 
+    @mutator
     def complete(self) -> "CircularProgressWidget":
         """Set progress to maximum value (100%).
 
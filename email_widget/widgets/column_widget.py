@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 
 
 class ColumnWidget(BaseWidget):
@@ -57,6 +57,9 @@ class ColumnWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # 模板定义
     TEMPLATE = """
     {% if widget_groups %}
@@ -96,6 +99,7 @@ class ColumnWidget(BaseWidget):
         self._columns: int = -1  # -1表示自动模式
         self._gap: str = "20px"
 
+    @mutator
     def add_widget(self, widget: BaseWidget) -> "ColumnWidget":
         """Add a widget to the column layout.
 
@@ -111,6 +115,7 @@ class ColumnWidget(BaseWidget):
         self._widgets.append(widget)
         return self
 
+    @mutator
     def add_widgets(self, widgets: list[BaseWidget]) -> "ColumnWidget":
         """Add multiple widgets to the column layout.
 
@@ -126,6 +131,7 @@ class ColumnWidget(BaseWidget):
         self._widgets.extend(widgets)
         return self
 
+    @mutator
     def set_columns(self, columns: int) -> "ColumnWidget":
         """Set the number of columns in the layout.
 
@@ -145,6 +151,7 @@ class ColumnWidget(BaseWidget):
             self._columns = max(1, min(columns, 4))  # Limit to 1-4 columns
         return self
 
+    @mutator
     def set_gap(self, gap: str) -> "ColumnWidget":
         """Set horizontal spacing between columns.
 
@@ -160,6 +167,7 @@ class ColumnWidget(BaseWidget):
         self._gap = gap
         return self
 
+    @mutator
     def clear_widgets(self) -> "ColumnWidget":
         """Clear all widgets in the column layout.
 
@@ -172,6 +180,7 @@ class ColumnWidget(BaseWidget):
         self._widgets.clear()
         return self
 
+    @mutator
     def remove_widget(self, widget_id: str) -> "ColumnWidget":
         """Remove specified widget by widget ID.
 
@@ -187,6 +196,7 @@ class ColumnWidget(BaseWidget):
         self._widgets = [w for w in self._widgets if w.widget_id != widget_id]
         return self
 
+    @mutator
     def remove_widget_by_index(self, index: int) -> "ColumnWidget":
         """Remove widget at specified index.
 
@@ -243,6 +253,7 @@ class ColumnWidget(BaseWidget):
         """
         return self.get_effective_columns()
 
+    @mutator
     def set_equal_width(self, equal: bool = True) -> "ColumnWidget":
         """Set whether columns have equal width.
 
@@ -303,6 +314,23 @@ class ColumnWidget(BaseWidget):
     def _get_template_name(self) -> str:
         return "column.html"
 
+    def _get_render_version(self) -> Any:
+        """Get the state version including all child widgets.
+
+        The cached column HTML stays valid only while neither the column nor any
+        child widget has changed. Returns None (no caching) if any child opts out
+        of the render cache.
+        """
+        child_versions = []
+        for widget in self._widgets:
+            if not widget.RENDER_CACHE:
+                return None
+            child_version = widget._get_render_version()
+            if child_version is None:
+                return None
+            child_versions.append(child_version)
+        return self._render_version, tuple(child_versions)
+
     def get_template_context(self) -> dict[str, Any]:
         """Get template context data required for rendering"""
         if not self._widgets:
@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.validators import (
     NonEmptyStringValidator,
     SizeValidator,
@@ -60,6 +60,9 @@ class ImageWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # 模板定义
     TEMPLATE = """
     {% if image_url %}
@@ -114,6 +117,7 @@ class ImageWidget(BaseWidget):
         self._url_validator = UrlValidator()
         self._text_validator = NonEmptyStringValidator()
 
+    @mutator
     def set_image_url(
         self, image_url: str | Path, cache: bool = True, embed: bool = True
     ) -> "ImageWidget":
@@ -159,6 +163,7 @@ class ImageWidget(BaseWidget):
         }
         return mime_types.get(ext, "image/png")
 
+    @mutator
     def set_title(self, title: str) -> "ImageWidget":
         """设置图片标题。
 
@@ -174,6 +179,7 @@ class ImageWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_description(self, description: str) -> "ImageWidget":
         """设置图片描述。
 
@@ -189,6 +195,7 @@ class ImageWidget(BaseWidget):
         self._description = description
         return self
 
+    @mutator
     def set_alt_text(self, alt: str) -> "ImageWidget":
         """设置图片的替代文本。
 
@@ -206,6 +213,7 @@ class ImageWidget(BaseWidget):
         self._alt_text = alt
         return self
 
+    @mutator
     def set_size(
         self, width: str | None = None, height: str | None = None
     ) -> "ImageWidget":
@@ -238,6 +246,7 @@ class ImageWidget(BaseWidget):
         self._height = height
         return self
 
+    @mutator
     def set_border_radius(self, radius: str) -> "ImageWidget":
         """设置图片的边框圆角。
 
@@ -254,6 +263,7 @@ class ImageWidget(BaseWidget):
         self._border_radius = radius
         return self
 
+    @mutator
     def set_max_width(self, max_width: str) -> "ImageWidget":
         """设置图片的最大宽度。
 
@@ -269,6 +279,7 @@ class ImageWidget(BaseWidget):
         self._max_width = max_width
         return self
 
+    @mutator
     def show_caption(self, show: bool = True) -> "ImageWidget":
         """设置是否显示图片标题和描述。
 
@@ -5,7 +5,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import LogLevel
 
 if TYPE_CHECKING:
@@ -100,6 +100,8 @@ class LogEntry:
         ```
     """
 
+    __slots__ = ("message", "level", "timestamp", "module", "function", "line_number")
+
     def __init__(
         self,
         message: str,
@@ -341,6 +343,9 @@ class LogWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if logs %}
@@ -391,6 +396,7 @@ class LogWidget(BaseWidget):
             PlainTextParser(),  # Fallback parser, must be placed last
         ]
 
+    @mutator
     def set_log_level(self, level: LogLevel) -> "LogWidget":
         """Set log filter level.
 
@@ -408,6 +414,7 @@ class LogWidget(BaseWidget):
         self._filter_level = level
         return self
 
+    @mutator
     def append_log(self, log: str) -> "LogWidget":
         """Append a single log string.
 
@@ -427,6 +434,7 @@ class LogWidget(BaseWidget):
             self._logs.append(parsed_entry)
         return self
 
+    @mutator
     def set_logs(self, logs: list[str]) -> "LogWidget":
         """Set log list.
 
@@ -447,6 +455,7 @@ class LogWidget(BaseWidget):
             self.append_log(log)
         return self
 
+    @mutator
     def clear(self) -> "LogWidget":
         """Clear all logs.
 
@@ -459,6 +468,7 @@ class LogWidget(BaseWidget):
         self._logs.clear()
         return self
 
+    @mutator
     def set_title(self, title: str) -> "LogWidget":
         """设置日志组件的标题。
 
@@ -474,6 +484,7 @@ class LogWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_max_height(self, height: str) -> "LogWidget":
         """Set maximum height of the log display area.
 
@@ -491,6 +502,7 @@ class LogWidget(BaseWidget):
         self._max_height = height
         return self
 
+    @mutator
     def filter_by_level(self, level: LogLevel) -> "LogWidget":
         """Filter display by log level.
 
@@ -508,6 +520,7 @@ class LogWidget(BaseWidget):
         self._filter_level = level
         return self
 
+    @mutator
     def show_timestamp(self, show: bool = True) -> "LogWidget":
         """Set whether to display timestamps for log entries.
 
@@ -523,6 +536,7 @@ class LogWidget(BaseWidget):
         self._show_timestamp = show
         return self
 
+    @mutator
     def show_level(self, show: bool = True) -> "LogWidget":
         """设置是否显示日志条目的级别。
 
@@ -538,6 +552,7 @@ class LogWidget(BaseWidget):
         self._show_level = show
         return self
 
+    @mutator
     def show_source(self, show: bool = True) -> "LogWidget":
         """设置是否显示日志条目的来源信息（模块、函数、行号）。
 
@@ -553,6 +568,7 @@ class LogWidget(BaseWidget):
         self._show_source = show
         return self
 
+    @mutator
     def add_log_entry(
         self,
         message: str,
@@ -585,6 +601,7 @@ class LogWidget(BaseWidget):
         self._logs.append(entry)
         return self
 
+    @mutator
     def add_log_parser(self, log_parser: LogParser) -> "LogWidget":
         """添加自定义日志解析器到解析器链中。
 
@@ -641,7 +658,7 @@ class LogWidget(BaseWidget):
                         return result
             except Exception as e:
                 # 记录解析器异常，但继续尝试下一个解析器
-                self._logger.debug(f"解析器 {parser.parser_name} 解析失败: {e}")
+                self._logger.debug("解析器 %s 解析失败: %s", parser.parser_name, e)
                 continue
 
         return None
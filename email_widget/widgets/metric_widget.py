@@ -6,7 +6,7 @@ Supports multiple metric types, trend display, and style configurations.
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import StatusType
 from email_widget.core.validators import TypeValidator
 
@@ -51,6 +51,9 @@ class MetricWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     TEMPLATE = """
     <div style="
         background: #ffffff;
@@ -205,6 +208,7 @@ class MetricWidget(BaseWidget):
         """获取模板名称。"""
         return "metric_widget.html"
 
+    @mutator
     def add_metric(
         self,
         label: str,
@@ -298,6 +302,7 @@ class MetricWidget(BaseWidget):
         self._metrics.append(metric)
         return self
 
+    @mutator
     def set_title(self, title: str) -> "MetricWidget":
         """设置指标组标题。
 
@@ -314,6 +319,7 @@ class MetricWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_layout(self, layout: str) -> "MetricWidget":
         """设置布局方式。
 
@@ -334,6 +340,7 @@ class MetricWidget(BaseWidget):
         self._layout = layout
         return self
 
+    @mutator
     def show_trends(self, show: bool = True) -> "MetricWidget":
         """设置是否显示趋势。
 
@@ -350,6 +357,7 @@ class MetricWidget(BaseWidget):
         self._show_trend = show
         return self
 
+    @mutator
     def clear_metrics(self) -> "MetricWidget":
         """清空所有指标。
 
@@ -359,6 +367,7 @@ class MetricWidget(BaseWidget):
         self._metrics.clear()
         return self
 
+    @mutator
     def remove_metric(self, index: int) -> "MetricWidget":
         """根据索引移除指标。
 
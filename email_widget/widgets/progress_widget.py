@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import ProgressTheme
 from email_widget.core.validators import ColorValidator, RangeValidator, SizeValidator
 
@@ -54,6 +54,9 @@ class ProgressWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     <div style="{{ container_style }}">
@@ -91,6 +94,7 @@ class ProgressWidget(BaseWidget):
         self._size_validator = SizeValidator()
         self._color_validator = ColorValidator()
 
+    @mutator
     def set_value(self, value: float) -> "ProgressWidget":
         """Set the current progress value.
 
@@ -114,6 +118,7 @@ class ProgressWidget(BaseWidget):
         self._value = max(0, min(value, self._max_value))
         return self
 
+    @mutator
     def set_max_value(self, max_val: float) -> "ProgressWidget":
         """Set the maximum progress value.
 
@@ -131,6 +136,7 @@ class ProgressWidget(BaseWidget):
             self._value = max_val
         return self
 
+    @mutator
     def set_label(self, label: str) -> "ProgressWidget":
         """Set the descriptive label displayed above the progress bar.
 
@@ -146,6 +152,7 @@ class ProgressWidget(BaseWidget):
         self._label = label
         return self
 
+    @mutator
     def set_theme(self, theme: ProgressTheme) -> "ProgressWidget":
         """Set the color theme of the progress bar.
 
@@ -161,6 +168,7 @@ class ProgressWidget(BaseWidget):
         self._theme = theme
         return self
 
+    @mutator
     def show_percentage(self, show: bool = True) -> "ProgressWidget":
         """Set whether to display percentage text inside the progress bar.
 
@@ -176,6 +184,7 @@ class ProgressWidget(BaseWidget):
         self._show_percentage = show
         return self
 
+    @mutator
     def set_width(self, width: str) -> "ProgressWidget":
         """Set the width of the progress bar.
 
@@ -199,6 +208,7 @@ class ProgressWidget(BaseWidget):
         self._width = width
         return self
 
+    @mutator
     def set_height(self, height: str) -> "ProgressWidget":
         """Set the height of the progress bar.
 
@@ -214,6 +224,7 @@ class ProgressWidget(BaseWidget):
         self._height = height
         return self
 
+    @mutator
     def set_border_radius(self, radius: str) -> "ProgressWidget":
         """Set the border radius of the progress bar.
 
@@ -229,6 +240,7 @@ class ProgressWidget(BaseWidget):
         self._border_radius = radius
         return self
 
+    @mutator
     def set_background_color(self, color: str) -> "ProgressWidget":
         """Set the background color of the progress bar.
 
@@ -252,6 +264,7 @@ class ProgressWidget(BaseWidget):
         self._background_color = color
         return self
 
+    @mutator
     def increment(self, amount: float = 1.0) -> "ProgressWidget":
         """Increase the progress value.
 
@@ -267,6 +280,7 @@ class ProgressWidget(BaseWidget):
         self._value = min(self._max_value, self._value + amount)
         return self
 
+    @mutator
     def decrement(self, amount: float = 1.0) -> "ProgressWidget":
         """Decrease the progress value.
 
@@ -282,6 +296,7 @@ class ProgressWidget(BaseWidget):
         self._value = max(0.0, self._value - amount)
         return self
 
+    @mutator
     def reset(self) -> "ProgressWidget":
         """Reset progress to 0.
 
@@ -294,6 +309,7 @@ class ProgressWidget(BaseWidget):
         self._value = 0.0
         return self
 
+    @mutator
     def complete(self) -> "ProgressWidget":
         """Set progress to maximum value (100%).
 
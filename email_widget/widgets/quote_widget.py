@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import StatusType
 
 
@@ -49,6 +49,9 @@ class QuoteWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if content %}
@@ -83,6 +86,7 @@ class QuoteWidget(BaseWidget):
         self._source: str | None = None
         self._quote_type: StatusType = StatusType.INFO
 
+    @mutator
     def set_content(self, content: str) -> "QuoteWidget":
         """Set the main text content of the quote.
 
@@ -98,6 +102,7 @@ class QuoteWidget(BaseWidget):
         self._content = content
         return self
 
+    @mutator
     def set_author(self, author: str) -> "QuoteWidget":
         """Set the author of the quote.
 
@@ -113,6 +118,7 @@ class QuoteWidget(BaseWidget):
         self._author = author
         return self
 
+    @mutator
     def set_source(self, source: str) -> "QuoteWidget":
         """Set the source of the quote.
 
@@ -128,6 +134,7 @@ class QuoteWidget(BaseWidget):
         self._source = source
         return self
 
+    @mutator
     def set_quote_type(self, quote_type: StatusType) -> "QuoteWidget":
         """Set the type of the quote.
 
@@ -145,6 +152,7 @@ class QuoteWidget(BaseWidget):
         self._quote_type = quote_type
         return self
 
+    @mutator
     def set_full_quote(
         self, content: str, author: str = None, source: str = None
     ) -> "QuoteWidget":
@@ -170,6 +178,7 @@ class QuoteWidget(BaseWidget):
             self._source = source
         return self
 
+    @mutator
     def clear_attribution(self) -> "QuoteWidget":
         """Clear author and source information.
 
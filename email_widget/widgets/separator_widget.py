@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import SeparatorType, StatusType
 
 
@@ -57,6 +57,9 @@ class SeparatorWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # 模板定义
     TEMPLATE = """
     {% if show_separator %}
@@ -89,6 +92,7 @@ class SeparatorWidget(BaseWidget):
         self._width: str = "100%"
         self._margin: str = "16px"
 
+    @mutator
     def set_type(self, separator_type: SeparatorType) -> "SeparatorWidget":
         """设置分隔符类型.
 
@@ -104,6 +108,7 @@ class SeparatorWidget(BaseWidget):
         self._separator_type = separator_type
         return self
 
+    @mutator
     def set_color(self, color: str) -> "SeparatorWidget":
         """设置分隔符颜色.
 
@@ -121,6 +126,7 @@ class SeparatorWidget(BaseWidget):
         self._color = color
         return self
 
+    @mutator
     def set_thickness(self, thickness: str) -> "SeparatorWidget":
         """设置分隔符粗细.
 
@@ -136,6 +142,7 @@ class SeparatorWidget(BaseWidget):
         self._thickness = thickness
         return self
 
+    @mutator
     def set_width(self, width: str) -> "SeparatorWidget":
         """设置分隔符宽度.
 
@@ -152,6 +159,7 @@ class SeparatorWidget(BaseWidget):
         self._width = width
         return self
 
+    @mutator
     def set_margin(self, margin: str) -> "SeparatorWidget":
         """设置分隔符上下边距.
 
@@ -167,6 +175,7 @@ class SeparatorWidget(BaseWidget):
         self._margin = margin
         return self
 
+    @mutator
     def set_theme_color(self, status_type: StatusType) -> "SeparatorWidget":
         """根据状态类型设置主题颜色.
 
@@ -189,6 +198,7 @@ class SeparatorWidget(BaseWidget):
         self._color = colors[status_type]
         return self
 
+    @mutator
     def set_style(
         self,
         separator_type: SeparatorType = None,
@@ -230,6 +240,7 @@ class SeparatorWidget(BaseWidget):
             self._margin = margin
         return self
 
+    @mutator
     def reset_to_default(self) -> "SeparatorWidget":
         """重置所有样式为默认值.
 
@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import LayoutType, StatusType
 
 
@@ -30,6 +30,8 @@ class StatusItem:
         ```
     """
 
+    __slots__ = ("label", "value", "status")
+
     def __init__(self, label: str, value: str, status: StatusType | None = None):
         """Initialize StatusItem.
 
@@ -90,6 +92,9 @@ class StatusWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     {% if items %}
@@ -133,6 +138,7 @@ class StatusWidget(BaseWidget):
         self._title: str | None = None
         self._layout: LayoutType = LayoutType.VERTICAL
 
+    @mutator
     def add_status_item(
         self, label: str, value: str, status: StatusType | None = None
     ) -> "StatusWidget":
@@ -152,6 +158,7 @@ class StatusWidget(BaseWidget):
         self._items.append(StatusItem(label, value, status))
         return self
 
+    @mutator
     def set_title(self, title: str) -> "StatusWidget":
         """Set the title of the status list.
 
@@ -167,6 +174,7 @@ class StatusWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_layout(self, layout: LayoutType) -> "StatusWidget":
         """Set the layout mode of status items.
 
@@ -182,6 +190,7 @@ class StatusWidget(BaseWidget):
         self._layout = layout
         return self
 
+    @mutator
     def clear_items(self) -> "StatusWidget":
         """Clear all status items.
 
@@ -194,6 +203,7 @@ class StatusWidget(BaseWidget):
         self._items.clear()
         return self
 
+    @mutator
     def remove_item(self, label: str) -> "StatusWidget":
         """Remove specified status item by label.
 
@@ -209,6 +219,7 @@ class StatusWidget(BaseWidget):
         self._items = [item for item in self._items if item.label != label]
         return self
 
+    @mutator
     def update_item(
         self, label: str, value: str, status: StatusType = None
     ) -> "StatusWidget":
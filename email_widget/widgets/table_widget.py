@@ -1,16 +1,196 @@
 """Table Widget Implementation"""
 
-from typing import TYPE_CHECKING, Any, Optional
-
-from email_widget.core.base import BaseWidget
+import bisect
+import csv
+import functools
+import operator
+import random
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from itertools import accumulate, chain, islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Protocol, TypeVar, runtime_checkable
+
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import StatusType
+from email_widget.core.template_engine import get_template_key
 from email_widget.utils.optional_deps import (
     check_optional_dependency,
     import_optional_dependency,
+    is_polars_frame,
 )
 
 if TYPE_CHECKING:
     import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+# Text and background colors applied to cells with a status
+_STATUS_STYLES = {
+    StatusType.SUCCESS: {"color": "#107c10", "background": "#dff6dd"},
+    StatusType.WARNING: {"color": "#ff8c00", "background": "#fff4e6"},
+    StatusType.ERROR: {"color": "#d13438", "background": "#ffebee"},
+    StatusType.INFO: {"color": "#0078d4", "background": "#e6f3ff"},
+    StatusType.PRIMARY: {"color": "#0078d4", "background": "#e6f3ff"},
+}
+_DEFAULT_STATUS_STYLE = {"color": "#323130", "background": "#ffffff"}
+
+
+@functools.lru_cache(maxsize=1024)
+def _cell_style(
+    status: StatusType | None,
+    color: str | None,
+    bold: bool,
+    align: str,
+    bordered: bool,
+    border_color: str,
+) -> str:
+    """Build the style of a TableCell.
+
+    Tables only use a handful of distinct cell styles, so the strings are built
+    once and shared by every cell with the same settings.
+    """
+    td_style = "padding: 8px; vertical-align: top;"
+    if status:
+        status_style = _STATUS_STYLES.get(status, _DEFAULT_STATUS_STYLE)
+        td_style += (
+            f" color: {status_style['color']};"
+            f" background: {status_style['background']};"
+        )
+    if color:
+        td_style += f" color: {color};"
+    if bold:
+        td_style += " font-weight: bold;"
+    td_style += f" text-align: {align};"
+    if bordered:
+        td_style += f" border-right: 1px solid {border_color};"
+    return td_style
+
+
+# Strategies accepted by TableWidget.set_max_rows
+_MAX_ROWS_STRATEGIES = ("head", "tail", "head_tail", "sample")
+
+_T = TypeVar("_T")
+
+# A row paired with its position in the added rows and row source
+_PositionedRow = tuple[int, Sequence[Any]]
+
+
+@runtime_checkable
+class _Cursor(Protocol):
+    """DB-API cursor, whose description names the columns of the last query"""
+
+    description: Sequence[Sequence[Any]] | None
+
+
+def _truncate_rows(
+    rows: Iterable[_T], max_rows: int, strategy: str, seed: int = 0
+) -> tuple[list[_T], int, list[_T]]:
+    """Keep at most `max_rows` rows.
+
+    Sequences are sliced directly; other iterables are consumed once while holding
+    at most `max_rows` rows, so a large row source never has to fit in memory.
+
+    Returns:
+        Tuple[list, int, list]: Rows before the omitted ones, number of omitted rows,
+        rows after the omitted ones.
+    """
+    if strategy == "sample":
+        rng = random.Random(seed)
+        if isinstance(rows, Sequence):
+            total = len(rows)
+            if total <= max_rows:
+                return list(rows), 0, []
+            positions = sorted(rng.sample(range(total), max_rows))
+            return [rows[p] for p in positions], total - max_rows, []
+
+        # Reservoir sampling, keeping source order
+        reservoir: list[tuple[int, _T]] = []
+        total = 0
+        for total, row in enumerate(rows, 1):
+            if total <= max_rows:
+                reservoir.append((total, row))
+            else:
+                slot = rng.randrange(total)
+                if slot < max_rows:
+                    reservoir[slot] = (total, row)
+        reservoir.sort(key=lambda item: item[0])
+        return [row for _, row in reservoir], max(0, total - max_rows), []
+
+    head_size = {"head": max_rows, "tail": 0, "head_tail": (max_rows + 1) // 2}[
+        strategy
+    ]
+    tail_size = max_rows - head_size
+
+    if isinstance(rows, Sequence):
+        total = len(rows)
+        if total <= max_rows:
+            return list(rows), 0, []
+        return list(rows[:head_size]), total - max_rows, list(rows[total - tail_size :])
+
+    iterator = iter(rows)
+    head = list(islice(iterator, head_size))
+    tail: deque[_T] = deque(maxlen=tail_size)
+    remaining = 0
+    for row in iterator:
+        tail.append(row)
+        remaining += 1
+    return head, remaining - len(tail), list(tail)
+
+
+def _between(column: Any, bounds: tuple[Any, Any]) -> Any:
+    """Inclusive range mask for a pandas or Polars Series"""
+    if hasattr(column, "is_between"):
+        return column.is_between(*bounds)
+    return column.between(*bounds)
+
+
+def _isin(column: Any, values: Iterable[Any]) -> Any:
+    """Membership mask for a pandas or Polars Series"""
+    if hasattr(column, "is_in"):
+        return column.is_in(list(values))
+    return column.isin(values)
+
+
+def _contains(column: Any, text: str) -> Any:
+    """Substring mask for a pandas or Polars Series"""
+    if hasattr(column, "is_in"):
+        return column.cast(str).str.contains(text, literal=True)
+    return column.astype(str).str.contains(text, regex=False)
+
+
+# Operators accepted by TableWidget.add_rule, applied to a whole column at once
+_RULE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "between": _between,
+    "in": _isin,
+    "contains": _contains,
+}
+
+
+class _FormatRule:
+    """Conditional formatting rule added with TableWidget.add_rule"""
+
+    __slots__ = ("column", "predicate", "status", "color", "bold")
+
+    def __init__(
+        self,
+        column: str,
+        predicate: Callable[[Any], Any],
+        status: StatusType | None,
+        color: str | None,
+        bold: bool,
+    ):
+        self.column = column
+        self.predicate = predicate
+        self.status = status
+        self.color = color
+        self.bold = bold
 
 
 class TableCell:
@@ -39,6 +219,8 @@ class TableCell:
         ```
     """
 
+    __slots__ = ("value", "status", "color", "bold", "align")
+
     def __init__(
         self,
         value: Any,
@@ -132,8 +314,11 @@ class TableWidget(BaseWidget):
         ```
     """
 
-    # Template definition
-    TEMPLATE = """
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
+    # Template definition, split around the row loop so rows can be rendered in chunks
+    _TEMPLATE_HEAD = """
     <!--[if mso]>
     <table width="100%" cellpadding="0" cellspacing="0" border="0">
         <tr>
@@ -161,17 +346,19 @@ class TableWidget(BaseWidget):
                             </thead>
                         {% endif %}
                         <tbody>
-                            {% for row_data in rows_data %}
+"""
+    _TEMPLATE_ROWS = """                            {% for row_data in rows_data %}
                                 <tr style="{{ row_data.row_style }}">
                                     {% if show_index %}
                                         <td style="{{ index_td_style }}">{{ row_data.index }}</td>
                                     {% endif %}
                                     {% for cell_data in row_data.cells %}
-                                        <td style="{{ cell_data.style }}">{{ cell_data.value }}</td>
+                                        <td style="{{ cell_data.style }}"{% if cell_data.colspan %} colspan="{{ cell_data.colspan }}"{% endif %}>{{ cell_data.value }}</td>
                                     {% endfor %}
                                 </tr>
                             {% endfor %}
-                        </tbody>
+"""
+    _TEMPLATE_TAIL = """                        </tbody>
                     </table>
                 </td>
             </tr>
@@ -183,6 +370,7 @@ class TableWidget(BaseWidget):
     </table>
     <![endif]-->
     """
+    TEMPLATE = _TEMPLATE_HEAD + _TEMPLATE_ROWS + _TEMPLATE_TAIL
 
     def __init__(self, widget_id: str | None = None):
         """Initialize TableWidget instance.
@@ -196,9 +384,29 @@ class TableWidget(BaseWidget):
         """
         super().__init__(widget_id)
         self._dataframe: pd.DataFrame | None = None
+        # Rows from add_data_row(s) not yet merged into _dataframe
+        self._pending_rows: list[list[Any]] = []
         self._title: str | None = None
         self._headers: list[str] = []
         self._rows: list[list[str | TableCell]] = []
+        # Iterator set via set_row_source, rendered after _rows in chunks
+        self._row_source: Iterable[Sequence[Any]] | None = None
+        self._row_chunk_size: int = 1000
+        # Row limit from set_max_rows; rows dropped by set_dataframe are counted
+        # in _omitted_rows and shown after the first _omitted_at rows
+        self._max_rows: int | None = None
+        self._max_rows_strategy: str = "head"
+        self._max_rows_seed: int = 0
+        self._omitted_rows: int = 0
+        self._omitted_at: int = 0
+        # Rules from add_rule, evaluated against the DataFrame rows shown in _rows.
+        # _row_formats holds, for each of those rows, an index into _format_patterns:
+        # the 1-based rule number of every cell (0 = unformatted), or None if no
+        # cell of the row is formatted
+        self._rules: list[_FormatRule] = []
+        self._rules_frame: pd.DataFrame | None = None
+        self._row_formats: Any = None
+        self._format_patterns: list[list[int] | None] = []
         self._show_index: bool = False
         self._striped: bool = True
         self._bordered: bool = True
@@ -207,48 +415,433 @@ class TableWidget(BaseWidget):
         self._header_bg_color: str = "#f3f2f1"
         self._border_color: str = "#e1dfdd"
 
-    def set_dataframe(self, df: "pd.DataFrame") -> "TableWidget":
+    @mutator
+    def set_dataframe(
+        self, df: "pd.DataFrame | pl.DataFrame | pl.LazyFrame"
+    ) -> "TableWidget":
         """Set DataFrame data.
 
+        Polars DataFrames and LazyFrames are read column by column without
+        converting them to pandas or Arrow. A LazyFrame is collected once, and with a
+        `set_max_rows` limit only the rows that will be shown are collected.
+
+        Missing values are rendered differently by the two sources: pandas cells are
+        converted with `str()` as `DataFrame.iterrows()` returns them, so they show
+        as "nan", "None", "NaT" or "<NA>", while Polars nulls become empty cells as
+        in `from_arrow`.
+
         Args:
-            df (pd.DataFrame): pandas DataFrame object.
+            df (Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]): pandas or Polars
+                DataFrame.
 
         Returns:
             TableWidget: Returns self to support method chaining.
 
         Raises:
-            ImportError: If pandas library is not installed.
+            ImportError: If pandas (or polars for Polars frames) is not installed.
+            ValueError: If a rule from `add_rule` refers to a column not in df; the
+                table is left unchanged.
 
         Examples:
             ```python
             import pandas as pd
             df = pd.DataFrame({'Name': ['Project A', 'Project B'], 'Status': ['Completed', 'In Progress']})
             table = TableWidget().set_dataframe(df)
+
+            import polars as pl
+            lf = pl.scan_parquet("orders.parquet").filter(pl.col("total") > 100)
+            table = TableWidget().set_max_rows(500).set_dataframe(lf)
             ```
         """
+        if is_polars_frame(df):
+            return self._set_polars_frame(df)
+
         check_optional_dependency("pandas")
+        self._check_rule_columns(df.columns)
         self._dataframe = df.copy()
+        self._pending_rows = []
+        self._row_source = None
         self._headers = list(df.columns)
-        self._rows = []
-
-        for _, row in df.iterrows():
-            row_data = []
-            for col in df.columns:
-                value = row[col]
-                if isinstance(value, dict) and "status" in value:
-                    # Handle status type data
-                    cell = TableCell(
-                        value=value.get("text", str(value)),
-                        status=StatusType(value["status"])
-                        if "status" in value
-                        else None,
+        self._omitted_rows = 0
+        self._omitted_at = 0
+        self._rules_frame = None
+        self._row_formats = None
+
+        # Drop rows over the set_max_rows limit before converting any cells
+        shown = self._dataframe
+        if self._max_rows is not None and len(df) > self._max_rows:
+            head, omitted, tail = _truncate_rows(
+                range(len(df)),
+                self._max_rows,
+                self._max_rows_strategy,
+                self._max_rows_seed,
+            )
+            df = shown = df.iloc[head + tail]
+            self._omitted_rows = omitted
+            self._omitted_at = len(head)
+
+        self._rows = self._convert_dataframe_rows(df)
+        self._rules_frame = shown
+        self._evaluate_rules()
+        return self
+
+    def _set_polars_frame(self, df: "pl.DataFrame | pl.LazyFrame") -> "TableWidget":
+        """Set a Polars DataFrame or LazyFrame, converting only the shown rows"""
+        # The frame was created by polars, so it is installed
+        import polars as pl
+
+        if isinstance(df, pl.LazyFrame):
+            self._check_rule_columns(df.collect_schema().names())
+        else:
+            self._check_rule_columns(df.columns)
+
+        # Polars frames are immutable, so no defensive copy is needed
+        self._dataframe = df
+        self._pending_rows = []
+        self._row_source = None
+        self._omitted_rows = 0
+        self._omitted_at = 0
+        self._row_formats = None
+
+        shown: pl.DataFrame | pl.LazyFrame = df
+        if self._max_rows is not None:
+            if isinstance(df, pl.LazyFrame):
+                total = df.select(pl.len()).collect().item()
+            else:
+                total = df.height
+            if total > self._max_rows:
+                # Slicing a DataFrame through its lazy view does not copy it
+                frame = df.lazy()
+                head, omitted, tail = _truncate_rows(
+                    range(total),
+                    self._max_rows,
+                    self._max_rows_strategy,
+                    self._max_rows_seed,
+                )
+                if self._max_rows_strategy == "sample":
+                    row_number = "__email_widget_row"
+                    shown = (
+                        frame.with_row_index(row_number)
+                        .filter(pl.col(row_number).is_in(head))
+                        .drop(row_number)
                     )
-                    row_data.append(cell)
                 else:
-                    row_data.append(str(value))
-            self._rows.append(row_data)
+                    shown = pl.concat(
+                        [
+                            frame.slice(0, len(head)),
+                            frame.slice(total - len(tail), len(tail)),
+                        ]
+                    )
+                self._omitted_rows = omitted
+                self._omitted_at = len(head)
+
+        if isinstance(shown, pl.LazyFrame):
+            shown = shown.collect()
+        self._headers = list(shown.columns)
+        columns = [
+            self._convert_polars_column(series) for series in shown.get_columns()
+        ]
+        self._rows = (
+            [list(row) for row in zip(*columns, strict=True)]
+            if columns
+            else [[] for _ in range(shown.height)]
+        )
+        self._rules_frame = shown
+        self._evaluate_rules()
         return self
 
+    def _convert_dataframe_rows(
+        self, df: "pd.DataFrame"
+    ) -> list[list[str | TableCell]]:
+        """Convert DataFrame rows to table rows"""
+        # Convert column by column from the interleaved array that iterrows() would
+        # expose, so numeric upcasting (e.g. int shown as "1.0" next to floats) is
+        # unchanged
+        values = df.to_numpy()
+        if values.dtype.kind in ("b", "i", "u", "f"):
+            rows: list[list[str | TableCell]] = values.astype(str).tolist()
+            return rows
+
+        # Only datetime-only frames stay datetime64; iterate the Series there to get
+        # Timestamp/Timedelta text instead of numpy's
+        is_datetime = values.dtype.kind in ("m", "M")
+        columns: list[list[str | TableCell]] = []
+        for position, dtype in enumerate(df.dtypes):
+            if is_datetime:
+                columns.append(list(map(str, df.iloc[:, position])))
+            elif dtype == "object":
+                columns.append(
+                    [self._convert_dataframe_value(v) for v in values[:, position]]
+                )
+            else:
+                columns.append(list(map(str, values[:, position])))
+        if not columns:
+            return [[] for _ in df.index]
+        rows = [list(row) for row in zip(*columns, strict=True)]
+
+        # iterrows() builds a Series per row, which re-infers the dtype of mixed rows
+        # (e.g. pandas' string inference turns pd.NA/None into NaN); rebuild rows with
+        # missing values the same way so they render as before
+        pd = import_optional_dependency("pandas")
+        if not is_datetime:
+            for position in pd.isna(values).any(axis=1).nonzero()[0]:
+                rows[position] = [
+                    self._convert_dataframe_value(value)
+                    for value in pd.Series(values[position])
+                ]
+        return rows
+
+    @staticmethod
+    def _convert_dataframe_value(value: Any) -> str | TableCell:
+        """Convert a value from an object column, turning status dicts into TableCell"""
+        if isinstance(value, dict) and "status" in value:
+            return TableCell(
+                value=value.get("text", str(value)),
+                status=StatusType(value["status"]),
+            )
+        return str(value)
+
+    @classmethod
+    def from_csv(
+        cls,
+        path: str | Path,
+        columns: list[str] | None = None,
+        max_rows: int | None = None,
+        max_rows_strategy: str = "head",
+        encoding: str = "utf-8",
+        **fmtparams: Any,
+    ) -> "TableWidget":
+        """Create a table from a CSV file without pandas.
+
+        Rows are streamed with the standard library `csv` module and the first row is
+        used as headers. With `max_rows`, at most that many rows are held while the
+        file is read and the others are only counted for the "… N more rows" row.
+
+        Args:
+            path (Union[str, Path]): CSV file path.
+            columns (Optional[List[str]]): Columns to keep, in this order. Defaults to
+                all.
+            max_rows (Optional[int]): Maximum number of rows, see `set_max_rows`.
+            max_rows_strategy (str): Rows kept under max_rows, see `set_max_rows`.
+            encoding (str): File encoding, defaults to "utf-8".
+            **fmtparams: Format parameters passed to `csv.reader`, e.g. `delimiter=";"`.
+
+        Returns:
+            TableWidget: New table with the CSV rows.
+
+        Raises:
+            ValueError: If a column is not in the CSV header, or max_rows or
+                max_rows_strategy is invalid.
+
+        Examples:
+            >>> table = TableWidget.from_csv("sales.csv", columns=["Region", "Total"], max_rows=500)
+        """
+        widget = cls()
+        if max_rows is not None:
+            widget.set_max_rows(max_rows, max_rows_strategy)
+
+        with open(path, newline="", encoding=encoding) as f:
+            reader = csv.reader(f, **fmtparams)
+            headers = next(reader, [])
+            head: list[list[Any]]
+            tail: list[list[Any]]
+            if widget._max_rows is None:
+                head, omitted, tail = list(reader), 0, []
+            else:
+                head, omitted, tail = _truncate_rows(
+                    reader,
+                    widget._max_rows,
+                    widget._max_rows_strategy,
+                    widget._max_rows_seed,
+                )
+
+        rows = head + tail
+        if columns is not None:
+            missing = [column for column in columns if column not in headers]
+            if missing:
+                raise ValueError(f"Columns not found in CSV header: {missing}")
+            positions = [headers.index(column) for column in columns]
+            rows = [[row[p] if p < len(row) else "" for p in positions] for row in rows]
+            headers = list(columns)
+
+        widget._headers = headers
+        widget._rows = rows
+        widget._omitted_rows = omitted
+        widget._omitted_at = len(head)
+        return widget
+
+    @classmethod
+    def from_arrow(
+        cls,
+        table: "pa.Table",
+        columns: list[str] | None = None,
+        max_rows: int | None = None,
+        max_rows_strategy: str = "head",
+    ) -> "TableWidget":
+        """Create a table from a pyarrow Table or RecordBatch without pandas.
+
+        Columns are selected and rows over `max_rows` dropped on the Arrow data, so
+        only the shown cells are converted to Python strings.
+
+        Args:
+            table (pa.Table): pyarrow Table or RecordBatch.
+            columns (Optional[List[str]]): Columns to keep, in this order. Defaults to
+                all.
+            max_rows (Optional[int]): Maximum number of rows, see `set_max_rows`.
+            max_rows_strategy (str): Rows kept under max_rows, see `set_max_rows`.
+
+        Returns:
+            TableWidget: New table with the Arrow rows.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            KeyError: If a column does not exist.
+            ValueError: If max_rows or max_rows_strategy is invalid.
+
+        Examples:
+            >>> table = TableWidget.from_arrow(arrow_table, columns=["name", "total"], max_rows=100)
+        """
+        check_optional_dependency("pyarrow")
+        widget = cls()
+        if max_rows is not None:
+            widget.set_max_rows(max_rows, max_rows_strategy)
+
+        if columns is not None:
+            table = table.select(columns)
+        head: list[int] = []
+        tail: list[int] = []
+        omitted = 0
+        if widget._max_rows is not None and table.num_rows > widget._max_rows:
+            head, omitted, tail = _truncate_rows(
+                range(table.num_rows),
+                widget._max_rows,
+                widget._max_rows_strategy,
+                widget._max_rows_seed,
+            )
+            table = table.take(head + tail)
+
+        widget._set_arrow_table(table)
+        widget._omitted_rows = omitted
+        widget._omitted_at = len(head)
+        return widget
+
+    @classmethod
+    def from_parquet(
+        cls,
+        path: str | Path,
+        columns: list[str] | None = None,
+        max_rows: int | None = None,
+        max_rows_strategy: str = "head",
+    ) -> "TableWidget":
+        """Create a table from a Parquet file with pyarrow, without pandas.
+
+        Only the selected columns are read, and with `max_rows` only the row groups
+        that contain the kept rows.
+
+        Args:
+            path (Union[str, Path]): Parquet file path.
+            columns (Optional[List[str]]): Columns to read, in this order. Defaults to
+                all.
+            max_rows (Optional[int]): Maximum number of rows, see `set_max_rows`.
+            max_rows_strategy (str): Rows kept under max_rows, see `set_max_rows`.
+
+        Returns:
+            TableWidget: New table with the Parquet rows.
+
+        Raises:
+            ImportError: If pyarrow is not installed.
+            ValueError: If max_rows or max_rows_strategy is invalid.
+
+        Examples:
+            >>> table = TableWidget.from_parquet("events.parquet", max_rows=1000, max_rows_strategy="tail")
+        """
+        pq = import_optional_dependency("pyarrow.parquet")
+        widget = cls()
+        if max_rows is not None:
+            widget.set_max_rows(max_rows, max_rows_strategy)
+
+        parquet_file = pq.ParquetFile(path)
+        metadata = parquet_file.metadata
+        if widget._max_rows is None or metadata.num_rows <= widget._max_rows:
+            widget._set_arrow_table(parquet_file.read(columns=columns))
+            return widget
+
+        head, omitted, tail = _truncate_rows(
+            range(metadata.num_rows),
+            widget._max_rows,
+            widget._max_rows_strategy,
+            widget._max_rows_seed,
+        )
+        positions = head + tail
+
+        # Read only the row groups containing kept rows, then pick the rows out of them
+        group_sizes = [
+            metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)
+        ]
+        group_starts = list(accumulate(group_sizes, initial=0))
+        position_groups = [bisect.bisect_right(group_starts, p) - 1 for p in positions]
+        groups = sorted(set(position_groups))
+        read_starts = dict(
+            zip(
+                groups,
+                accumulate((group_sizes[g] for g in groups), initial=0),
+                strict=False,
+            )
+        )
+        table = parquet_file.read_row_groups(groups, columns=columns)
+        table = table.take(
+            [
+                p - group_starts[g] + read_starts[g]
+                for p, g in zip(positions, position_groups, strict=True)
+            ]
+        )
+
+        widget._set_arrow_table(table)
+        widget._omitted_rows = omitted
+        widget._omitted_at = len(head)
+        return widget
+
+    def _set_arrow_table(self, table: "pa.Table") -> None:
+        """Replace headers and rows with the columns of an Arrow table"""
+        self._headers = list(table.column_names)
+        columns = [self._convert_arrow_column(column) for column in table.columns]
+        self._rows = (
+            [list(row) for row in zip(*columns, strict=True)]
+            if columns
+            else [[] for _ in range(table.num_rows)]
+        )
+
+    @staticmethod
+    def _convert_arrow_column(column: "pa.ChunkedArray") -> list[str | TableCell]:
+        """Convert an Arrow column to cell values, nulls become empty strings"""
+        pa = import_optional_dependency("pyarrow")
+        if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+            pc = import_optional_dependency("pyarrow.compute")
+            values: list[str | TableCell] = pc.fill_null(column, "").to_pylist()
+            return values
+        if pa.types.is_struct(column.type):
+            return [
+                "" if value is None else TableWidget._convert_dataframe_value(value)
+                for value in column.to_pylist()
+            ]
+        return ["" if value is None else str(value) for value in column.to_pylist()]
+
+    @staticmethod
+    def _convert_polars_column(series: "pl.Series") -> list[str | TableCell]:
+        """Convert a Polars column to cell values like `_convert_arrow_column`"""
+        import polars as pl
+
+        if series.dtype == pl.String:
+            values: list[str | TableCell] = series.fill_null("").to_list()
+            return values
+        if isinstance(series.dtype, pl.Struct):
+            return [
+                "" if value is None else TableWidget._convert_dataframe_value(value)
+                for value in series.to_list()
+            ]
+        return ["" if value is None else str(value) for value in series.to_list()]
+
+    @mutator
     def set_title(self, title: str) -> "TableWidget":
         """Set table title.
 
@@ -264,6 +857,7 @@ class TableWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def set_headers(self, headers: list[str]) -> "TableWidget":
         """Set table headers.
 
@@ -279,6 +873,7 @@ class TableWidget(BaseWidget):
         self._headers = headers.copy()
         return self
 
+    @mutator
     def add_row(self, row: list[str | TableCell]) -> "TableWidget":
         """Add row data.
 
@@ -294,6 +889,7 @@ class TableWidget(BaseWidget):
         self._rows.append(row)
         return self
 
+    @mutator
     def set_rows(self, rows: list[list[str | TableCell]]) -> "TableWidget":
         """Set all row data.
 
@@ -313,8 +909,121 @@ class TableWidget(BaseWidget):
             ```
         """
         self._rows = rows
+        self._row_source = None
+        self._omitted_rows = 0
+        self._omitted_at = 0
+        self._rules_frame = None
+        self._row_formats = None
         return self
 
+    @mutator
+    def set_row_source(
+        self,
+        rows: Iterable[Sequence[Any]],
+        headers: list[str] | None = None,
+        chunk_size: int = 1000,
+    ) -> "TableWidget":
+        """Set an iterator as the row source for very large tables.
+
+        Rows are pulled from the source only while the table renders, `chunk_size`
+        rows at a time. With `Email.export_stream()` or
+        `Email.export_html(streaming=True)` each chunk is written out before the next
+        one is read, so peak memory is one chunk instead of the whole table. Rows
+        added with `add_row` are rendered first.
+
+        The source is consumed by the first render, so a table backed by a
+        one-shot iterator (generator, DB-API cursor, csv reader) renders its rows
+        once and is never served from the render cache.
+
+        Args:
+            rows (Iterable[Sequence[Any]]): Row iterator, each row a sequence of
+                strings, `TableCell` objects or other values (converted with `str()`).
+            headers (Optional[List[str]]): Header list. Defaults to the column names in
+                `rows.description` for DB-API cursors, otherwise keeps current headers.
+            chunk_size (int): Number of rows rendered per chunk, defaults to 1000.
+
+        Returns:
+            TableWidget: Returns self to support method chaining.
+
+        Raises:
+            ValueError: If chunk_size is not positive.
+
+        Examples:
+            ```python
+            cursor.execute("SELECT name, region, total FROM sales")
+            table = TableWidget().set_row_source(cursor)
+
+            with open("sales.csv", newline="") as f:
+                reader = csv.reader(f)
+                table = TableWidget().set_row_source(reader, headers=next(reader))
+                email.add_widget(table).export_html("sales.html", streaming=True)
+            ```
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        if headers is None and isinstance(rows, _Cursor) and rows.description:
+            headers = [column[0] for column in rows.description]
+        if headers is not None:
+            self._headers = list(headers)
+        self._row_source = rows
+        self._row_chunk_size = chunk_size
+        return self
+
+    @mutator
+    def set_max_rows(
+        self, max_rows: int | None, strategy: str = "head", seed: int = 0
+    ) -> "TableWidget":
+        """Limit the number of rendered rows.
+
+        Rows over the limit are dropped before their cells are converted or rendered,
+        and a "… N more rows" row marks where they were. Set the limit before
+        `set_dataframe` so that dropped DataFrame rows are never converted; the
+        `dataframe` property still returns the full data.
+
+        Changing the limit after `set_dataframe` converts the DataFrame again under
+        the new limit (a LazyFrame is collected again), replacing rows added with
+        `add_row`. Rows dropped by `from_csv`, `from_arrow` or `from_parquet` cannot
+        be restored; the new limit applies to the rows that were kept.
+
+        Args:
+            max_rows (Optional[int]): Maximum number of rows, None removes the limit.
+            strategy (str): Which rows to keep: "head" (first rows), "tail" (last rows),
+                "head_tail" (first and last rows) or "sample" (random rows in original
+                order). Defaults to "head".
+            seed (int): Random seed for the "sample" strategy, defaults to 0.
+
+        Returns:
+            TableWidget: Returns self to support method chaining.
+
+        Raises:
+            ValueError: If max_rows is not positive or strategy is invalid.
+
+        Examples:
+            >>> table = TableWidget().set_max_rows(500, strategy="head_tail").set_dataframe(df)
+        """
+        if max_rows is not None and max_rows <= 0:
+            raise ValueError(f"max_rows must be positive, got {max_rows}")
+        if strategy not in _MAX_ROWS_STRATEGIES:
+            raise ValueError(
+                f"Invalid max rows strategy: {strategy}. "
+                f"Valid values: {list(_MAX_ROWS_STRATEGIES)}"
+            )
+        self._max_rows = max_rows
+        self._max_rows_strategy = strategy
+        self._max_rows_seed = seed
+
+        # Rows dropped under the previous limit were counted at ingestion
+        if self._dataframe is not None:
+            headers, pending_rows = self._headers, self._pending_rows
+            self.set_dataframe(self._dataframe)
+            self._headers, self._pending_rows = headers, pending_rows
+        else:
+            self._omitted_rows = 0
+            self._omitted_at = 0
+        return self
+
+    @mutator
     def clear_rows(self) -> "TableWidget":
         """Clear row data.
 
@@ -325,8 +1034,14 @@ class TableWidget(BaseWidget):
             >>> table = TableWidget().clear_rows()
         """
         self._rows.clear()
+        self._row_source = None
+        self._omitted_rows = 0
+        self._omitted_at = 0
+        self._rules_frame = None
+        self._row_formats = None
         return self
 
+    @mutator
     def show_index(self, show: bool = True) -> "TableWidget":
         """Set whether to display index.
 
@@ -342,6 +1057,7 @@ class TableWidget(BaseWidget):
         self._show_index = show
         return self
 
+    @mutator
     def set_striped(self, striped: bool = True) -> "TableWidget":
         """Set whether to use striped pattern.
 
@@ -357,6 +1073,7 @@ class TableWidget(BaseWidget):
         self._striped = striped
         return self
 
+    @mutator
     def set_bordered(self, bordered: bool = True) -> "TableWidget":
         """Set whether to display borders.
 
@@ -372,6 +1089,7 @@ class TableWidget(BaseWidget):
         self._bordered = bordered
         return self
 
+    @mutator
     def set_hover_effect(self, hover: bool = True) -> "TableWidget":
         """Set whether to enable hover effect.
 
@@ -387,6 +1105,7 @@ class TableWidget(BaseWidget):
         self._hover_effect = hover
         return self
 
+    @mutator
     def set_max_width(self, width: str) -> "TableWidget":
         """Set maximum width.
 
@@ -402,6 +1121,7 @@ class TableWidget(BaseWidget):
         self._max_width = width
         return self
 
+    @mutator
     def set_header_bg_color(self, color: str) -> "TableWidget":
         """Set header background color.
 
@@ -417,6 +1137,7 @@ class TableWidget(BaseWidget):
         self._header_bg_color = color
         return self
 
+    @mutator
     def set_border_color(self, color: str) -> "TableWidget":
         """Set border color.
 
@@ -432,12 +1153,16 @@ class TableWidget(BaseWidget):
         self._border_color = color
         return self
 
-    def add_data_row(self, row_data: list) -> "TableWidget":
+    @mutator
+    def add_data_row(self, row_data: list[Any]) -> "TableWidget":
         """Add data row (based on DataFrame).
 
         This method is used to add a row of data to the table. If the table has been initialized through `set_dataframe`,
         the new row will be added to the existing DataFrame; otherwise, a new DataFrame will be created.
 
+        Rows are buffered and merged into the DataFrame in one step the next time `dataframe`
+        is read, so adding n rows one by one costs O(n) instead of copying the DataFrame each time.
+
         Args:
             row_data (list): List containing row data. The length of the list should match the number of headers.
 
@@ -446,24 +1171,77 @@ class TableWidget(BaseWidget):
 
         Raises:
             ImportError: If pandas library is not installed.
+            TypeError: If the data was set from a Polars DataFrame.
+            ValueError: If the row length does not match the existing columns.
 
         Examples:
             >>> table = TableWidget().add_data_row(["New Project", "0%", "Started"])
         """
         check_optional_dependency("pandas")
-        pd = import_optional_dependency("pandas")
+        self._append_data_row(row_data)
+        return self
+
+    @mutator
+    def add_data_rows(self, rows: Iterable[list[Any]]) -> "TableWidget":
+        """Add multiple data rows (based on DataFrame).
+
+        Bulk version of `add_data_row` for streaming sources such as generators or
+        database cursors; rows are consumed once and buffered until `dataframe` is read.
+
+        Args:
+            rows (Iterable[list]): Rows, each matching the number of columns.
+
+        Returns:
+            TableWidget: Returns self to support method chaining.
+
+        Raises:
+            ImportError: If pandas library is not installed.
+            TypeError: If the data was set from a Polars DataFrame.
+            ValueError: If a row length does not match the existing columns.
 
+        Examples:
+            >>> cursor.execute("SELECT name, progress, status FROM projects")
+            >>> table = TableWidget().add_data_rows(cursor)
+        """
+        check_optional_dependency("pandas")
+        for row_data in rows:
+            self._append_data_row(row_data)
+        return self
+
+    def _append_data_row(self, row_data: list[Any]) -> None:
+        """Validate a row against the current width and add it to the pending buffer"""
+        if is_polars_frame(self._dataframe):
+            raise TypeError(
+                "add_data_row does not support Polars DataFrames, "
+                "concatenate the rows with polars and call set_dataframe again"
+            )
         if self._dataframe is not None:
-            # If DataFrame exists, add new row
-            new_row = pd.Series(row_data, index=self._dataframe.columns)
-            self._dataframe = pd.concat(
-                [self._dataframe, new_row.to_frame().T], ignore_index=True
+            width = len(self._dataframe.columns)
+        elif self._pending_rows:
+            width = len(self._pending_rows[0])
+        else:
+            width = len(row_data)
+        if len(row_data) != width:
+            raise ValueError(
+                f"Row length {len(row_data)} does not match "
+                f"the number of columns {width}"
             )
+        self._pending_rows.append(list(row_data))
+
+    def _flush_pending_rows(self) -> None:
+        """Merge buffered rows into the DataFrame with a single concat"""
+        if not self._pending_rows:
+            return
+        pd = import_optional_dependency("pandas")
+
+        if self._dataframe is not None:
+            new_rows = pd.DataFrame(self._pending_rows, columns=self._dataframe.columns)
+            self._dataframe = pd.concat([self._dataframe, new_rows], ignore_index=True)
         else:
-            # If no DataFrame exists, create new one
-            self._dataframe = pd.DataFrame([row_data])
-        return self
+            self._dataframe = pd.DataFrame(self._pending_rows)
+        self._pending_rows = []
 
+    @mutator
     def clear_data(self) -> "TableWidget":
         """Clear table data.
 
@@ -477,9 +1255,16 @@ class TableWidget(BaseWidget):
             >>> table = TableWidget().clear_data()
         """
         self._dataframe = None
+        self._pending_rows = []
         self._rows.clear()
+        self._row_source = None
+        self._omitted_rows = 0
+        self._omitted_at = 0
+        self._rules_frame = None
+        self._row_formats = None
         return self
 
+    @mutator
     def set_column_width(self, column: str, width: str) -> "TableWidget":
         """Set column width"""
         if not hasattr(self, "_column_widths"):
@@ -526,24 +1311,142 @@ class TableWidget(BaseWidget):
         """
         return TableCell(value=value, color=color, bold=bold, align=align)
 
+    @mutator
+    def add_rule(
+        self,
+        column: str,
+        op: str | Callable[[Any], Any],
+        threshold: Any = None,
+        status: StatusType | None = None,
+        color: str | None = None,
+        bold: bool = False,
+    ) -> "TableWidget":
+        """Add a conditional formatting rule for a DataFrame column.
+
+        Rules are evaluated column-wise with pandas/NumPy masks when the DataFrame is
+        set (or right away if it already is), and matching cells are styled without
+        creating a `TableCell` for each of them. Where several rules match a cell, the
+        last added one wins.
+
+        Args:
+            column (str): DataFrame column name.
+            op (Union[str, Callable]): One of ">", ">=", "<", "<=", "==", "!=",
+                "between" (threshold is an inclusive (low, high) pair), "in" (threshold
+                is a collection) or "contains" (threshold is a substring); or a
+                function taking the column as a pandas Series and returning a boolean
+                mask.
+            threshold (Any): Value compared against, unused when op is a function.
+            status (Optional[StatusType]): Status colors applied to matching cells.
+            color (Optional[str]): Text color applied to matching cells.
+            bold (bool): Whether matching cells are bold, defaults to False.
+
+        Returns:
+            TableWidget: Returns self to support method chaining.
+
+        Raises:
+            ValueError: If op is unknown, the rule sets no style, or the column does
+                not exist in the DataFrame.
+
+        Examples:
+            ```python
+            table = (TableWidget()
+                     .add_rule("Growth", "<", 0, status=StatusType.ERROR)
+                     .add_rule("Growth", ">=", 0.1, status=StatusType.SUCCESS, bold=True)
+                     .add_rule("Region", lambda s: s.str.startswith("EU"), color="#0078d4")
+                     .set_dataframe(df))
+            ```
+        """
+        if callable(op):
+            predicate = op
+        elif op in _RULE_OPERATORS:
+            compare = _RULE_OPERATORS[op]
+            predicate = lambda values: compare(values, threshold)  # noqa: E731
+        else:
+            raise ValueError(
+                f"Invalid rule operator: {op}. Valid values: {list(_RULE_OPERATORS)}"
+            )
+        if status is None and color is None and not bold:
+            raise ValueError("A rule must set status, color or bold")
+
+        self._rules.append(_FormatRule(column, predicate, status, color, bold))
+        try:
+            self._evaluate_rules()
+        except Exception:
+            # Drop the failing rule and restore the formatting of the others
+            self._rules.pop()
+            self._evaluate_rules()
+            raise
+        return self
+
+    @mutator
+    def clear_rules(self) -> "TableWidget":
+        """Remove all conditional formatting rules.
+
+        Returns:
+            TableWidget: Returns self to support method chaining.
+
+        Examples:
+            >>> table = TableWidget().clear_rules()
+        """
+        self._rules = []
+        self._row_formats = None
+        return self
+
+    def _check_rule_columns(self, columns: Iterable[Any]) -> None:
+        """Raise before new data replaces the table if a rule column is missing"""
+        known = set(columns)
+        for rule in self._rules:
+            if rule.column not in known:
+                raise ValueError(f"Unknown rule column: {rule.column}")
+
+    def _evaluate_rules(self) -> None:
+        """Compute the rule number of every cell of the DataFrame rows"""
+        self._row_formats = None
+        frame = self._rules_frame
+        if frame is None or not self._rules:
+            return
+        np = import_optional_dependency("numpy")
+
+        polars = is_polars_frame(frame)
+        columns = list(frame.columns)
+        codes = np.zeros((len(frame), len(columns)), dtype=np.int32)
+        for number, rule in enumerate(self._rules, 1):
+            if rule.column not in columns:
+                raise ValueError(f"Unknown rule column: {rule.column}")
+            position = columns.index(rule.column)
+            if polars:
+                mask = rule.predicate(frame.get_column(rule.column))
+                if hasattr(mask, "fill_null"):
+                    mask = mask.fill_null(False).to_numpy()
+            else:
+                mask = rule.predicate(frame.iloc[:, position])
+                if hasattr(mask, "to_numpy"):
+                    mask = mask.to_numpy(dtype=bool, na_value=False)
+            codes[np.asarray(mask, dtype=bool), position] = number
+
+        # Rows share the few distinct combinations, so only a small index is kept
+        # per row
+        patterns, row_formats = np.unique(codes, axis=0, return_inverse=True)
+        self._format_patterns = [
+            codes if any(codes) else None for codes in patterns.tolist()
+        ]
+        self._row_formats = row_formats.reshape(-1).astype(
+            np.min_scalar_type(len(patterns))
+        )
+
     def _get_status_style(self, status: StatusType) -> dict[str, str]:
         """Get status style"""
-        styles = {
-            StatusType.SUCCESS: {"color": "#107c10", "background": "#dff6dd"},
-            StatusType.WARNING: {"color": "#ff8c00", "background": "#fff4e6"},
-            StatusType.ERROR: {"color": "#d13438", "background": "#ffebee"},
-            StatusType.INFO: {"color": "#0078d4", "background": "#e6f3ff"},
-            StatusType.PRIMARY: {"color": "#0078d4", "background": "#e6f3ff"},
-        }
-        return styles.get(status, {"color": "#323130", "background": "#ffffff"})
+        return dict(_STATUS_STYLES.get(status, _DEFAULT_STATUS_STYLE))
 
     @property
-    def dataframe(self) -> Optional["pd.DataFrame"]:
+    def dataframe(self) -> Optional["pd.DataFrame | pl.DataFrame | pl.LazyFrame"]:
         """Get DataFrame data.
 
         Returns:
-            Optional[pd.DataFrame]: DataFrame object or None.
+            Optional[Union[pd.DataFrame, pl.DataFrame, pl.LazyFrame]]: DataFrame object
+            (the Polars frame itself when one was set) or None.
         """
+        self._flush_pending_rows()
         return self._dataframe
 
     @property
@@ -568,6 +1471,8 @@ class TableWidget(BaseWidget):
     def rows(self) -> list[list[str | TableCell]]:
         """Get row data.
 
+        Rows of a source set with `set_row_source` are not included.
+
         Returns:
             List[List[Union[str, TableCell]]]: Row data list.
         """
@@ -578,9 +1483,21 @@ class TableWidget(BaseWidget):
 
     def get_template_context(self) -> dict[str, Any]:
         """Get template context data required for rendering"""
-        if not self._headers and not self._rows:
+        if not self._headers and not self._rows and self._row_source is None:
             return {}
 
+        context = self._get_table_context()
+        rows, omitted, tail = self._get_row_sections()
+        head = list(rows)
+        rows_data = self._build_rows_data(head)
+        if omitted:
+            rows_data.append(self._build_overflow_row(omitted, len(head), head or tail))
+            rows_data.extend(self._build_rows_data(tail, len(head) + omitted))
+        context["rows_data"] = rows_data
+        return context
+
+    def _get_table_context(self) -> dict[str, Any]:
+        """Get template context shared by all rows (title, headers and styles)"""
         # Container style - center alignment, 5px left and right padding for margin effect
         container_style = "margin: 16px auto; width: 100%; max-width: 100%; padding: 0 5px; box-sizing: border-box;"
         if self._max_width:
@@ -636,60 +1553,218 @@ class TableWidget(BaseWidget):
         if self._bordered:
             index_td_style += f" border-right: 1px solid {self._border_color};"
 
-        # Process row data
-        rows_data = []
-        for idx, row in enumerate(self._rows):
-            # Row style
-            row_style = ""
-            if self._striped and idx % 2 == 1:
-                row_style = "background: #faf9f8;"
-            if self._bordered:
-                row_style += f" border-bottom: 1px solid {self._border_color};"
-
-            # Process cell data
-            cells_data = []
-            for cell in row:
-                td_style = "padding: 8px; vertical-align: top;"
+        return {
+            "title": self._title,
+            "container_style": container_style,
+            "table_style": table_style,
+            "header_style": header_style,
+            "index_th_style": index_th_style,
+            "th_style": th_style,
+            "index_td_style": index_td_style,
+            "headers": self._headers,
+            "show_index": self._show_index,
+        }
 
-                if isinstance(cell, TableCell):
-                    # Handle TableCell
-                    if cell.status:
-                        status_style = self._get_status_style(cell.status)
-                        td_style += f" color: {status_style['color']}; background: {status_style['background']};"
+    def _iter_rows(self) -> Iterator[Sequence[Any]]:
+        """Iterate over added rows followed by the rows of the row source"""
+        if self._row_source is None:
+            return iter(self._rows)
+        return chain(self._rows, self._row_source)
 
-                    if cell.color:
-                        td_style += f" color: {cell.color};"
+    def _get_row_sections(
+        self,
+    ) -> tuple[Iterable[_PositionedRow], int, list[_PositionedRow]]:
+        """Split the rows around the ones dropped by the set_max_rows limit.
 
-                    if cell.bold:
-                        td_style += " font-weight: bold;"
+        Rows are paired with their position in the added rows and row source, which
+        locates their conditional formatting.
 
-                    td_style += f" text-align: {cell.align};"
+        Returns:
+            Tuple[Iterable, int, list]: (position, row) pairs before the overflow row,
+            number of omitted rows, pairs after the overflow row. Without omitted rows
+            all rows are in the first section and are produced lazily; with omitted
+            rows the first section is a list of at most `max_rows` pairs.
+        """
+        rows: Iterable[_PositionedRow] = enumerate(self._iter_rows())
+        if self._max_rows is not None:
+            head, omitted, tail = _truncate_rows(
+                rows, self._max_rows, self._max_rows_strategy, self._max_rows_seed
+            )
+            if omitted:
+                return head, omitted + self._omitted_rows, tail
+            rows = head + tail
+
+        if not self._omitted_rows:
+            return rows, 0, []
+        kept = list(rows)
+        return kept[: self._omitted_at], self._omitted_rows, kept[self._omitted_at :]
+
+    def _build_overflow_row(
+        self, omitted: int, position: int, sample_rows: list[_PositionedRow]
+    ) -> dict[str, Any]:
+        """Build the "… N more rows" row spanning all columns"""
+        columns = len(self._headers) or max(
+            (len(row) for _, row in sample_rows), default=1
+        )
+        style = "padding: 8px; color: #605e5c; font-style: italic; text-align: center;"
+        if self._bordered:
+            style += f" border-right: 1px solid {self._border_color};"
+        border_bottom = (
+            f" border-bottom: 1px solid {self._border_color};" if self._bordered else ""
+        )
+        stripe = "background: #faf9f8;" if self._striped and position % 2 else ""
+        return {
+            "index": "",
+            "row_style": stripe + border_bottom,
+            "cells": [
+                {
+                    "value": f"… {omitted} more row{'s' if omitted != 1 else ''}",
+                    "style": style,
+                    "colspan": columns,
+                }
+            ],
+        }
+
+    def _build_rows_data(
+        self, rows: Iterable[_PositionedRow], start: int = 0
+    ) -> list[dict[str, Any]]:
+        """Build per-row template data.
 
-                    if self._bordered:
-                        td_style += f" border-right: 1px solid {self._border_color};"
+        Args:
+            rows (Iterable[Tuple[int, Sequence[Any]]]): Rows to convert, each paired
+                with its position in the added rows and row source.
+            start (int): Position of the first row in the table, used for the index
+                column and stripe parity when rendering in chunks.
+
+        Returns:
+            List[Dict[str, Any]]: Row dicts with index, row style and cell data.
+        """
+        bordered = self._bordered
+        border_color = self._border_color
+
+        # Row and plain cell styles only depend on table settings and stripe parity
+        border_bottom = f" border-bottom: 1px solid {border_color};" if bordered else ""
+        stripe = "background: #faf9f8;" if self._striped else ""
+        row_styles = (border_bottom, stripe + border_bottom)
+        plain_style = (
+            "padding: 8px; vertical-align: top; color: #323130; text-align: center;"
+        )
+        if bordered:
+            plain_style += f" border-right: 1px solid {border_color};"
+
+        row_formats = self._row_formats
+        formatted_rows = 0 if row_formats is None else len(row_formats)
+        patterns = self._format_patterns
+        rule_styles = [plain_style] + [
+            _cell_style(
+                rule.status, rule.color, rule.bold, "center", bordered, border_color
+            )
+            for rule in self._rules
+        ]
 
+        rows_data = []
+        for idx, (position, row) in enumerate(rows, start):
+            cells_data = []
+            row_codes = (
+                patterns[row_formats[position]] if position < formatted_rows else None
+            )
+            for column, cell in enumerate(row):
+                if row_codes and row_codes[column]:
+                    value = cell.value if isinstance(cell, TableCell) else cell
+                    cells_data.append(
+                        {"value": value, "style": rule_styles[row_codes[column]]}
+                    )
+                elif isinstance(cell, TableCell):
+                    td_style = _cell_style(
+                        cell.status,
+                        cell.color,
+                        cell.bold,
+                        cell.align,
+                        bordered,
+                        border_color,
+                    )
                     cells_data.append({"value": cell.value, "style": td_style})
                 else:
-                    # Handle regular strings - default center alignment
-                    td_style += " color: #323130; text-align: center;"
-                    if self._bordered:
-                        td_style += f" border-right: 1px solid {self._border_color};"
-
-                    cells_data.append({"value": cell, "style": td_style})
+                    cells_data.append({"value": cell, "style": plain_style})
 
             rows_data.append(
-                {"index": idx + 1, "row_style": row_style, "cells": cells_data}
+                {
+                    "index": idx + 1,
+                    "row_style": row_styles[idx % 2],
+                    "cells": cells_data,
+                }
             )
 
-        return {
-            "title": self._title,
-            "container_style": container_style,
-            "table_style": table_style,
-            "header_style": header_style,
-            "index_th_style": index_th_style,
-            "th_style": th_style,
-            "index_td_style": index_td_style,
-            "headers": self._headers,
-            "show_index": self._show_index,
-            "rows_data": rows_data,
-        }
+        return rows_data
+
+    def _get_render_version(self) -> Any:
+        """Disable the render cache while rows come from a one-shot row source"""
+        if self._row_source is not None:
+            return None
+        return super()._get_render_version()
+
+    def render_html_stream(self) -> Iterator[str]:
+        """Render the table as a stream of HTML chunks.
+
+        Tables with a row source yield the table head, then the `<tr>` rows
+        `chunk_size` at a time, then the table tail; other tables yield
+        `render_html()` as a single chunk. If the row source raises partway
+        through, the error is logged and the table is closed after the rows
+        already yielded, so the streamed document stays well-formed.
+
+        Yields:
+            str: HTML chunks in document order.
+        """
+        if self._row_source is None:
+            yield from super().render_html_stream()
+            return
+
+        context = self._get_table_context()
+        key = get_template_key(type(self))
+        # Jinja drops the trailing newline of a template, the head ends with one
+        yield (
+            self._template_engine.render(
+                self._TEMPLATE_HEAD, context, name=f"{key}:head"
+            )
+            + "\n"
+        )
+
+        try:
+            rows, omitted, tail = self._get_row_sections()
+            if not omitted:
+                yield from self._render_row_chunks(rows, 0, context, f"{key}:rows")
+            else:
+                # With omitted rows the head holds at most max_rows rows
+                head = list(rows)
+                yield from self._render_row_chunks(head, 0, context, f"{key}:rows")
+                context["rows_data"] = [
+                    self._build_overflow_row(omitted, len(head), head or tail)
+                ]
+                yield self._template_engine.render(
+                    self._TEMPLATE_ROWS, context, name=f"{key}:rows"
+                )
+                yield from self._render_row_chunks(
+                    tail, len(head) + omitted, context, f"{key}:rows"
+                )
+        except Exception as e:
+            # The head is already out, close the table instead of leaving it open
+            self._logger.error("Table %s row source failed: %s", self.widget_id, e)
+
+        context["rows_data"] = []
+        yield self._template_engine.render(
+            self._TEMPLATE_TAIL, context, name=f"{key}:tail"
+        )
+
+    def _render_row_chunks(
+        self,
+        rows: Iterable[_PositionedRow],
+        start: int,
+        context: dict[str, Any],
+        name: str,
+    ) -> Iterator[str]:
+        """Render rows `chunk_size` at a time, starting at table position `start`"""
+        iterator = iter(rows)
+        while chunk := list(islice(iterator, self._row_chunk_size)):
+            context["rows_data"] = self._build_rows_data(chunk, start)
+            yield self._template_engine.render(self._TEMPLATE_ROWS, context, name=name)
+            start += len(chunk)
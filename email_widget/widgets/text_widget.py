@@ -5,7 +5,7 @@ This module provides a text display widget that supports multiple text types and
 
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import TextAlign, TextType
 from email_widget.core.validators import (
     ColorValidator,
@@ -134,6 +134,9 @@ class TextWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     # Template definition
     TEMPLATE = """
     <!--[if mso]>
@@ -190,6 +193,7 @@ class TextWidget(BaseWidget):
         self._size_validator = SizeValidator()
         self._content_validator = NonEmptyStringValidator()
 
+    @mutator
     def set_content(self, content: str) -> "TextWidget":
         """Set text content, supports multi-line text (separated by `\n`).
 
@@ -215,6 +219,7 @@ class TextWidget(BaseWidget):
         self._content = content
         return self
 
+    @mutator
     def set_type(self, text_type: TextType) -> "TextWidget":
         """Set text type, different types apply different preset styles.
 
@@ -232,6 +237,7 @@ class TextWidget(BaseWidget):
         self._apply_type_styles()
         return self
 
+    @mutator
     def set_font_size(self, size: str) -> "TextWidget":
         """Set font size.
 
@@ -256,6 +262,7 @@ class TextWidget(BaseWidget):
         self._font_size = size
         return self
 
+    @mutator
     def set_align(self, align: TextAlign) -> "TextWidget":
         """Set text alignment.
 
@@ -272,6 +279,7 @@ class TextWidget(BaseWidget):
         self._align = align
         return self
 
+    @mutator
     def set_color(self, color: str) -> "TextWidget":
         """Set text color.
 
@@ -296,6 +304,7 @@ class TextWidget(BaseWidget):
         self._color = color
         return self
 
+    @mutator
     def set_line_height(self, height: str) -> "TextWidget":
         """Set line height.
 
@@ -312,6 +321,7 @@ class TextWidget(BaseWidget):
         self._line_height = height
         return self
 
+    @mutator
     def set_font_weight(self, weight: str) -> "TextWidget":
         """Set font weight.
 
@@ -328,6 +338,7 @@ class TextWidget(BaseWidget):
         self._font_weight = weight
         return self
 
+    @mutator
     def set_font_family(self, family: str) -> "TextWidget":
         """Set font family.
 
@@ -344,6 +355,7 @@ class TextWidget(BaseWidget):
         self._font_family = family
         return self
 
+    @mutator
     def set_margin(self, margin: str) -> "TextWidget":
         """Set margin.
 
@@ -360,6 +372,7 @@ class TextWidget(BaseWidget):
         self._margin = margin
         return self
 
+    @mutator
     def set_max_width(self, max_width: str) -> "TextWidget":
         """Set maximum width.
 
@@ -376,6 +389,7 @@ class TextWidget(BaseWidget):
         self._max_width = max_width
         return self
 
+    @mutator
     def set_bold(self, bold: bool = True) -> "TextWidget":
         """Set whether text is bold.
 
@@ -392,6 +406,7 @@ class TextWidget(BaseWidget):
         self._font_weight = "bold" if bold else "normal"
         return self
 
+    @mutator
     def set_italic(self, italic: bool = True) -> "TextWidget":
         """Set whether text is italic.
 
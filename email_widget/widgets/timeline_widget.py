@@ -7,7 +7,7 @@ Supports multiple event types, time formats, and style configurations.
 from datetime import datetime
 from typing import Any
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 from email_widget.core.enums import StatusType
 from email_widget.core.validators import TypeValidator
 
@@ -51,6 +51,9 @@ class TimelineWidget(BaseWidget):
         ```
     """
 
+    # Every state change goes through a @mutator method
+    RENDER_CACHE = True
+
     TEMPLATE = """
     <div style="
         background: #ffffff;
@@ -188,6 +191,7 @@ class TimelineWidget(BaseWidget):
         """获取模板名称。"""
         return "timeline_widget.html"
 
+    @mutator
     def add_event(
         self,
         title: str,
@@ -271,6 +275,7 @@ class TimelineWidget(BaseWidget):
         """根据时间对事件进行排序。"""
         self._events.sort(key=lambda x: x["time_sort_key"], reverse=self._reverse_order)
 
+    @mutator
     def set_title(self, title: str) -> "TimelineWidget":
         """设置时间线标题。
 
@@ -287,6 +292,7 @@ class TimelineWidget(BaseWidget):
         self._title = title
         return self
 
+    @mutator
     def show_timestamps(self, show: bool = True) -> "TimelineWidget":
         """设置是否显示时间戳。
 
@@ -303,6 +309,7 @@ class TimelineWidget(BaseWidget):
         self._show_time = show
         return self
 
+    @mutator
     def set_reverse_order(self, reverse: bool = True) -> "TimelineWidget":
         """设置是否按时间倒序排列。
 
@@ -320,6 +327,7 @@ class TimelineWidget(BaseWidget):
         self._sort_events()  # 重新排序
         return self
 
+    @mutator
     def clear_events(self) -> "TimelineWidget":
         """清空所有事件。
 
@@ -329,6 +337,7 @@ class TimelineWidget(BaseWidget):
         self._events.clear()
         return self
 
+    @mutator
     def remove_event(self, index: int) -> "TimelineWidget":
         """根据索引移除事件。
 
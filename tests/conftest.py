@@ -87,6 +87,81 @@ def sample_widget_data():
     }
 
 
+def _sample_widgets():
+    """每个内置Widget一个带内容的实例工厂 {类名: 工厂函数}"""
+    from email_widget.core.enums import AlertType, LogLevel, StatusType
+    from email_widget.widgets import (
+        AlertWidget,
+        ButtonWidget,
+        CardWidget,
+        ChartWidget,
+        ChecklistWidget,
+        CircularProgressWidget,
+        ColumnWidget,
+        ImageWidget,
+        LogWidget,
+        MetricWidget,
+        ProgressWidget,
+        QuoteWidget,
+        SeparatorWidget,
+        StatusWidget,
+        TableWidget,
+        TextWidget,
+        TimelineWidget,
+    )
+
+    image = "data:image/png;base64,iVBORw0KGgo="
+    factories = [
+        lambda: AlertWidget()
+        .set_content("磁盘空间不足")
+        .set_alert_type(AlertType.WARNING),
+        lambda: ButtonWidget().set_text("打开").set_href("https://example.com"),
+        lambda: CardWidget()
+        .set_title("卡片")
+        .set_content("内容")
+        .add_metadata("负责人", "ops"),
+        lambda: ChartWidget().set_image_url(image).set_title("图表"),
+        lambda: ChecklistWidget()
+        .set_title("清单")
+        .add_item("构建", True)
+        .add_item("发布", False),
+        lambda: CircularProgressWidget().set_value(42),
+        # 列数多于Widget数，模板使用range()补齐空列
+        lambda: ColumnWidget()
+        .set_columns(3)
+        .add_widgets([TextWidget().set_content("a"), TextWidget().set_content("b")]),
+        lambda: ImageWidget().set_image_url(image).set_title("图片"),
+        lambda: LogWidget().add_log_entry("服务启动", LogLevel.INFO),
+        lambda: MetricWidget()
+        .set_title("指标")
+        .add_metric("用户", 1200, "", "+5%", "success"),
+        lambda: ProgressWidget().set_value(70).set_label("上传"),
+        lambda: QuoteWidget().set_content("引用").set_author("作者"),
+        lambda: SeparatorWidget(),
+        lambda: StatusWidget()
+        .set_title("状态")
+        .add_status_item("CPU", "40%", StatusType.SUCCESS),
+        lambda: TableWidget().set_headers(["A", "B"]).add_row(["1", "2"]),
+        lambda: TextWidget().set_content("你好"),
+        lambda: TimelineWidget()
+        .set_title("时间线")
+        .add_event("上线", "2024-01-01", "已发布"),
+    ]
+    return {type(factory()).__name__: factory for factory in factories}
+
+
+@pytest.fixture(params=sorted(_sample_widgets()))
+def builtin_widget_factory(request):
+    """按内置Widget参数化，返回创建带内容实例的工厂函数"""
+    return _sample_widgets()[request.param]
+
+
+@pytest.fixture
+def builtin_widget_factories():
+    """所有内置Widget的实例工厂 {类名: 工厂函数}"""
+    return _sample_widgets()
+
+
 # 测试标记
 def pytest_configure(config):
     """配置自定义标记"""
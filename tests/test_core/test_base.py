@@ -11,7 +11,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from email_widget.core.base import BaseWidget
+from email_widget.core.base import BaseWidget, mutator
 
 
 class ConcreteWidget(BaseWidget):
@@ -26,6 +26,12 @@ class ConcreteWidget(BaseWidget):
         return {"test_data": "test_value"}
 
 
+class CachedWidget(ConcreteWidget):
+    """启用渲染缓存的测试Widget"""
+
+    RENDER_CACHE = True
+
+
 class TestBaseWidgetInitialization:
     """BaseWidget初始化测试"""
 
@@ -280,6 +286,160 @@ class TestBaseWidgetUtilityMethods:
         assert new_id.startswith("concretewidget_")
         assert len(new_id.split("_")[1]) == 8
 
+    def test_pickle_roundtrip(self):
+        """测试Widget可以序列化后在其他进程中渲染"""
+        import pickle
+
+        from email_widget.core.template_engine import get_template_engine
+
+        widget = CachedWidget(widget_id="picklable")
+        widget._set_parent(Mock())
+        widget.render_html()
+
+        state = widget.__getstate__()
+        assert "_template_engine" not in state
+        assert "_logger" not in state
+        assert state["_parent"] is None
+        assert state["_cached_html"] is None
+        assert widget._cached_html is not None
+
+        restored = pickle.loads(pickle.dumps(widget))
+
+        assert restored.widget_id == "picklable"
+        assert restored.parent is None
+        assert restored._template_engine is get_template_engine()
+        assert restored.render_html() == widget.render_html()
+
+
+class TestBaseWidgetRenderCache:
+    """BaseWidget渲染缓存测试"""
+
+    def setup_method(self):
+        """每个测试方法执行前的设置"""
+        BaseWidget.reset_render_cache_stats()
+
+    def test_render_html_uses_cache(self):
+        """测试未修改的Widget复用缓存的HTML"""
+        widget = CachedWidget()
+
+        with patch.object(
+            widget, "get_template_context", wraps=widget.get_template_context
+        ) as mock_context:
+            first = widget.render_html()
+            second = widget.render_html()
+
+        assert first == second
+        assert mock_context.call_count == 1
+        stats = BaseWidget.get_render_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_mutator_invalidates_cache(self):
+        """测试set_*方法使缓存失效"""
+        widget = CachedWidget(widget_id="before")
+        widget.render_html()
+
+        widget.set_widget_id("after")
+        widget.render_html()
+
+        assert BaseWidget.get_render_cache_stats()["misses"] == 2
+
+    def test_subclass_mutators_are_wrapped(self):
+        """测试子类中以mutator标记的方法递增状态版本"""
+
+        class MutableWidget(CachedWidget):
+            TEMPLATE = "<div>{{ items|join(',') }}</div>"
+
+            def __init__(self):
+                super().__init__()
+                self._items = []
+
+            @mutator
+            def add_item(self, item):
+                self._items.append(item)
+                return self
+
+            def get_template_context(self):
+                return {"items": self._items}
+
+        widget = MutableWidget()
+        assert widget.render_html() == "<div></div>"
+
+        widget.add_item("a")
+        assert widget.render_html() == "<div>a</div>"
+
+        widget._items.append("b")
+        assert widget.render_html() == "<div>a</div>"
+        widget.invalidate_render_cache()
+        assert widget.render_html() == "<div>a,b</div>"
+
+    def test_render_cache_disabled_by_default(self):
+        """测试未启用RENDER_CACHE的子类每次都重新渲染"""
+        assert ConcreteWidget.RENDER_CACHE is False
+
+        widget = ConcreteWidget()
+        widget.render_html()
+        widget.render_html()
+
+        stats = BaseWidget.get_render_cache_stats()
+        assert stats["hits"] == 0
+        assert stats["misses"] == 2
+
+    def test_plain_setter_subclass_renders_fresh_html(self):
+        """测试使用普通setter的子类在修改后导出最新HTML"""
+        from email_widget.email import Email
+
+        class PlainSetterWidget(BaseWidget):
+            TEMPLATE = "<div>{{ text }}</div>"
+
+            def __init__(self):
+                super().__init__()
+                self._text = "a"
+
+            def set_text(self, text):
+                self._text = text
+                return self
+
+            def _get_template_name(self):
+                return "plain_setter.html"
+
+            def get_template_context(self):
+                return {"text": self._text}
+
+        widget = PlainSetterWidget()
+        email = Email("Plain setter")
+        email.add_widget(widget)
+        assert "<div>a</div>" in email.export_str()
+
+        widget.set_text("b")
+        assert "<div>b</div>" in email.export_str()
+
+    def test_failed_render_not_cached(self):
+        """测试渲染失败的结果不被缓存"""
+        widget = CachedWidget()
+
+        with patch.object(
+            widget, "get_template_context", side_effect=ValueError("boom")
+        ):
+            assert "Widget Rendering Error" in widget.render_html()
+
+        assert widget.render_html() == "<div class='test-widget'>test_value</div>"
+
+    def test_reset_render_cache_stats(self):
+        """测试重置缓存统计"""
+        widget = CachedWidget()
+        widget.render_html()
+        widget.render_html()
+
+        BaseWidget.reset_render_cache_stats()
+
+        assert BaseWidget.get_render_cache_stats() == {
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0,
+        }
+
 
 class TestBaseWidgetValidation:
     """BaseWidget验证测试"""
@@ -8,6 +8,7 @@
 - 线程安全性
 """
 
+import base64
 import json
 import tempfile
 import time
@@ -16,7 +17,15 @@ from unittest.mock import patch
 
 import pytest
 
-from email_widget.core.cache import ImageCache
+from email_widget.core import cache as cache_module
+from email_widget.core.cache import (
+    EvictionPolicy,
+    GDSFPolicy,
+    ImageCache,
+    LFUPolicy,
+    LRUPolicy,
+    get_image_cache,
+)
 
 
 class TestImageCacheInitialization:
@@ -212,9 +221,9 @@ class TestImageCacheOperations:
                 assert result is False
 
     def test_get_file_read_error(self):
-        """测试文件读取错误"""
+        """测试文件读取错误（不使用内存层）"""
         with tempfile.TemporaryDirectory() as temp_dir:
-            cache = ImageCache(cache_dir=temp_dir)
+            cache = ImageCache(cache_dir=temp_dir, memory_bytes=0)
 
             # 先成功设置缓存
             cache.set("test_source", b"test_data", "image/png")
@@ -265,6 +274,40 @@ class TestImageCacheLRUEviction:
             assert cache.get("source3") is not None
             assert cache.get("source4") is not None
 
+    def test_index_kept_in_lru_order(self):
+        """测试索引按最近使用顺序排列，无需依赖时间戳"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_size=3)
+            with patch("email_widget.core.cache.time.time", return_value=1000.0):
+                for i in range(1, 4):
+                    cache.set(f"source{i}", b"data", "image/png")
+                cache.get("source1")
+                cache.set("source2", b"data2", "image/png")
+                cache.set("source4", b"data4", "image/png")
+
+            keys = [cache._generate_cache_key(f"source{i}") for i in (1, 2, 4)]
+            assert list(cache._cache_index) == keys
+
+    def test_load_legacy_index_in_access_order(self):
+        """测试加载旧版本未排序的索引文件时按访问时间排列"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            index_data = {
+                key: {"file_path": f"{key}.png", "access_time": access_time, "size": 1}
+                for key, access_time in (
+                    ("newest", 3.0),
+                    ("oldest", 1.0),
+                    ("middle", 2.0),
+                )
+            }
+            with open(Path(temp_dir) / "cache_index.json", "w", encoding="utf-8") as f:
+                json.dump(index_data, f, indent=2)
+
+            cache = ImageCache(cache_dir=temp_dir, max_size=3)
+            assert list(cache._cache_index) == ["oldest", "middle", "newest"]
+
+            cache.set("source", b"data", "image/png")
+            assert list(cache._cache_index)[:2] == ["middle", "newest"]
+
     def test_remove_cache_item(self):
         """测试移除缓存项"""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -288,6 +331,460 @@ class TestImageCacheLRUEviction:
             assert not file_path.exists()
 
 
+class TestImageCacheJournal:
+    """ImageCache索引日志持久化测试"""
+
+    def test_hit_does_not_rewrite_index(self):
+        """测试命中缓存时不重写整个索引"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("source1", b"data1", "image/png")
+
+            with patch.object(cache, "_save_cache_index") as save:
+                for _ in range(10):
+                    assert cache.get("source1") is not None
+
+            save.assert_not_called()
+            assert cache._dirty is True
+
+    def test_flush_interval_elapsed(self):
+        """测试超过刷新间隔后命中会写入访问时间"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, flush_interval=0)
+            cache.set("source1", b"data1", "image/png")
+            cache.get("source1")
+
+            cache_key = cache._generate_cache_key("source1")
+            with open(cache._index_file, encoding="utf-8") as f:
+                saved = json.load(f)
+            assert (
+                saved[cache_key]["access_time"]
+                == cache._cache_index[cache_key]["access_time"]
+            )
+            assert cache._dirty is False
+
+    def test_flush_compacts_journal(self):
+        """测试flush将日志合并到索引文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("source1", b"data1", "image/png")
+            cache.set("source2", b"data2", "image/png")
+            assert cache._journal_file.read_text(encoding="utf-8").count("\n") == 2
+
+            cache.flush()
+
+            assert cache._journal_file.read_text(encoding="utf-8") == ""
+            with open(cache._index_file, encoding="utf-8") as f:
+                assert len(json.load(f)) == 2
+
+    def test_replay_journal_after_crash(self):
+        """测试未flush时从日志恢复缓存项，忽略写了一半的行"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache1 = ImageCache(cache_dir=temp_dir)
+            cache1.set("source1", b"data1", "image/png")
+            cache1.flush()
+            cache1.set("source2", b"data2", "image/png")
+            cache1.set("source3", b"data3", "image/png")
+            cache1._remove_cache_item(
+                cache1._generate_cache_key("source3"),
+                cache1._cache_index[cache1._generate_cache_key("source3")],
+            )
+            with open(cache1._journal_file, "a", encoding="utf-8") as f:
+                f.write('{"k": "torn')
+
+            cache2 = ImageCache(cache_dir=temp_dir)
+
+            assert cache2.get("source1") == (b"data1", "image/png")
+            assert cache2.get("source2") == (b"data2", "image/png")
+            assert cache2.get("source3") is None
+            assert cache2._journal_entries == 4
+
+    def test_journal_compacted_under_churn(self):
+        """测试淘汰频繁时日志会定期合并"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_size=2)
+            with patch("email_widget.core.cache._JOURNAL_MIN_ENTRIES", 4):
+                for i in range(20):
+                    cache.set(f"source{i}", b"data", "image/png")
+
+            assert cache._journal_entries <= 5
+            assert set(ImageCache(cache_dir=temp_dir)._cache_index) == set(
+                cache._cache_index
+            )
+
+    def test_clear_removes_journal(self):
+        """测试清理缓存时删除日志文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("source1", b"data1", "image/png")
+
+            cache.clear()
+
+            assert not cache._journal_file.exists()
+            assert ImageCache(cache_dir=temp_dir)._cache_index == {}
+
+
+class TestImageCacheEvictionPolicies:
+    """ImageCache字节上限、过期时间和淘汰策略测试"""
+
+    def test_max_bytes_eviction(self):
+        """测试超过字节上限时淘汰缓存项"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_bytes=100)
+            for i in range(3):
+                cache.set(f"source{i}", b"x" * 40, "image/png")
+
+            stats = cache.get_cache_stats()
+            assert stats["total_items"] == 2
+            assert stats["total_size_bytes"] == 80
+            assert stats["evictions"] == {"max_size": 0, "max_bytes": 1, "expired": 0}
+            assert cache.get("source0") is None
+
+    def test_image_larger_than_max_bytes_not_stored(self):
+        """测试大于字节上限的图片不会被缓存"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_bytes=10)
+            cache.set("small", b"x" * 5, "image/png")
+
+            assert cache.set("large", b"x" * 11, "image/png") is False
+            assert cache.get("small") is not None
+            assert cache.get_cache_stats()["total_size_bytes"] == 5
+
+    def test_replace_item_updates_size(self):
+        """测试重复写入同一来源时更新总大小并删除旧文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("source", b"x" * 40, "image/png")
+            cache.set("source", b"x" * 10, "image/jpeg")
+
+            assert cache.get_cache_stats()["total_size_bytes"] == 10
+            assert [path.suffix for path in Path(temp_dir).glob("*.*g")] == [".jpeg"]
+
+    def test_ttl_expiry(self):
+        """测试缓存项过期后不再返回"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, ttl=60)
+            with patch("email_widget.core.cache.time.time", return_value=1000.0):
+                cache.set("source", b"data", "image/png")
+                cache.set("pinned", b"data", "image/png", ttl=3600)
+
+            with patch("email_widget.core.cache.time.time", return_value=1059.0):
+                assert cache.get("source") is not None
+            with patch("email_widget.core.cache.time.time", return_value=1061.0):
+                assert cache.get("source") is None
+                assert cache.get("pinned") is not None
+
+            assert cache.get_cache_stats()["evictions"]["expired"] == 1
+
+    def test_expired_items_purged_on_set(self):
+        """测试写入时清除所有已过期的缓存项"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, ttl=60)
+            with patch("email_widget.core.cache.time.time", return_value=1000.0):
+                for i in range(3):
+                    cache.set(f"source{i}", b"data", "image/png")
+            with patch("email_widget.core.cache.time.time", return_value=2000.0):
+                cache.set("fresh", b"data", "image/png")
+
+            assert len(cache._cache_index) == 1
+            assert cache.get_cache_stats()["evictions"]["expired"] == 3
+
+    def test_ttl_applies_to_loaded_items(self):
+        """测试加载的旧缓存项按当前ttl过期"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with patch("email_widget.core.cache.time.time", return_value=1000.0):
+                ImageCache(cache_dir=temp_dir).set("source", b"data", "image/png")
+
+            cache = ImageCache(cache_dir=temp_dir, ttl=60)
+            with patch("email_widget.core.cache.time.time", return_value=1061.0):
+                assert cache.get("source") is None
+
+    def test_lfu_policy(self):
+        """测试LFU策略淘汰使用次数最少的缓存项"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_size=2, policy="lfu")
+            cache.set("frequent", b"data", "image/png")
+            cache.set("rare", b"data", "image/png")
+            cache.get("frequent")
+            cache.get("frequent")
+            cache.get("rare")
+
+            cache.set("new", b"data", "image/png")
+
+            assert cache.get("frequent") is not None
+            assert cache.get("rare") is None
+            assert cache.get_cache_stats()["policy"] == "lfu"
+
+    def test_gdsf_policy_prefers_evicting_large_items(self):
+        """测试GDSF策略优先淘汰大而少用的缓存项"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_bytes=1100, policy="gdsf")
+            cache.set("chart", b"x" * 1000, "image/png")
+            cache.set("icon1", b"x" * 10, "image/png")
+            cache.set("icon2", b"x" * 10, "image/png")
+            cache.get("chart")
+
+            cache.set("icon3", b"x" * 100, "image/png")
+
+            assert cache.get("chart") is None
+            assert all(cache.get(f"icon{i}") is not None for i in (1, 2, 3))
+
+    def test_gdsf_policy_survives_reload(self):
+        """测试重新加载后GDSF策略按索引重建"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ImageCache(cache_dir=temp_dir).set("chart", b"x" * 1000, "image/png")
+            ImageCache(cache_dir=temp_dir).set("icon", b"x" * 10, "image/png")
+
+            cache = ImageCache(cache_dir=temp_dir, max_size=2, policy=GDSFPolicy())
+            cache.set("icon2", b"x" * 10, "image/png")
+
+            assert cache.get("chart") is None
+            assert cache.get("icon") is not None
+
+    def test_custom_policy(self):
+        """测试自定义淘汰策略"""
+
+        class LargestFirstPolicy(EvictionPolicy):
+            def select_victim(self, index):
+                return max(index, key=lambda key: index[key]["size"])
+
+            @property
+            def policy_name(self) -> str:
+                return "largest"
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(
+                cache_dir=temp_dir, max_size=2, policy=LargestFirstPolicy()
+            )
+            cache.set("large", b"x" * 100, "image/png")
+            cache.set("small", b"x", "image/png")
+            cache.set("medium", b"x" * 10, "image/png")
+
+            assert cache.get("large") is None
+            assert cache.get_cache_stats()["policy"] == "largest"
+
+    def test_invalid_policy(self):
+        """测试无效的淘汰策略"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError):
+                ImageCache(cache_dir=temp_dir, policy="random")
+
+    def test_environment_variables(self, monkeypatch):
+        """测试通过环境变量配置缓存"""
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_MAX_SIZE", "5")
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_MAX_BYTES", "1024")
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_TTL", "30")
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_POLICY", "LFU")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            stats = ImageCache(cache_dir=temp_dir).get_cache_stats()
+
+        assert stats["max_size"] == 5
+        assert stats["max_bytes"] == 1024
+        assert stats["ttl"] == 30.0
+        assert stats["policy"] == "lfu"
+
+    def test_invalid_environment_variable(self, monkeypatch):
+        """测试无效的环境变量值"""
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_MAX_BYTES", "lots")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with pytest.raises(ValueError, match="EMAILWIDGET_IMAGE_CACHE_MAX_BYTES"):
+                ImageCache(cache_dir=temp_dir)
+
+    def test_get_image_cache_with_options(self, monkeypatch):
+        """测试get_image_cache传入选项时替换全局实例"""
+        monkeypatch.setattr(cache_module, "_global_cache", None)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = get_image_cache(cache_dir=temp_dir, max_bytes=2048, policy="gdsf")
+
+            assert get_image_cache() is cache
+            assert isinstance(cache._policy, GDSFPolicy)
+            assert cache.get_cache_stats()["max_bytes"] == 2048
+
+    def test_default_policy_is_lru(self):
+        """测试默认使用LRU策略"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert isinstance(ImageCache(cache_dir=temp_dir)._policy, LRUPolicy)
+            assert not isinstance(ImageCache(cache_dir=temp_dir)._policy, LFUPolicy)
+
+    def test_priority_policy_requires_priority(self):
+        """测试未实现_priority的优先级策略不能实例化"""
+
+        class IncompletePolicy(cache_module._PriorityPolicy):
+            @property
+            def policy_name(self) -> str:
+                return "incomplete"
+
+        with pytest.raises(TypeError):
+            IncompletePolicy()
+
+
+class TestImageCacheMemoryTier:
+    """ImageCache内存层测试"""
+
+    def test_memory_hit_does_not_touch_disk(self):
+        """测试内存层命中时不访问文件系统"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("logo", b"logo_data", "image/png")
+
+            with (
+                patch("pathlib.Path.exists", side_effect=AssertionError("stat")),
+                patch("builtins.open", side_effect=AssertionError("open")),
+            ):
+                for _ in range(3):
+                    assert cache.get("logo") == (b"logo_data", "image/png")
+
+            stats = cache.get_cache_stats()
+            assert stats["hits"] == {"memory": 3, "disk": 0}
+            assert stats["memory_items"] == 1
+
+    def test_disk_hit_promotes_to_memory(self):
+        """测试文件系统层命中后提升到内存层"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            ImageCache(cache_dir=temp_dir).set("logo", b"logo_data", "image/png")
+
+            cache = ImageCache(cache_dir=temp_dir)
+            assert cache.get("logo") is not None
+            assert cache.get("logo") is not None
+            assert cache.get("missing") is None
+
+            stats = cache.get_cache_stats()
+            assert stats["hits"] == {"memory": 1, "disk": 1}
+            assert stats["misses"] == 1
+
+    def test_memory_budget_demotes_least_recently_used(self):
+        """测试内存层超出字节预算时降级最久未使用的数据"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, memory_bytes=100)
+            for i in range(3):
+                cache.set(f"source{i}", b"x" * 40, "image/png")
+
+            assert list(cache._memory) == [
+                cache._generate_cache_key(f"source{i}") for i in (1, 2)
+            ]
+            assert cache.get_cache_stats()["memory_bytes"] == 80
+
+            # 降级的数据仍可从文件系统层读取
+            assert cache.get("source0") == (b"x" * 40, "image/png")
+            assert cache.get_cache_stats()["hits"]["disk"] == 1
+
+    def test_large_item_stays_on_disk(self):
+        """测试大于内存预算的数据只保存在文件系统层"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, memory_bytes=10)
+            cache.set("chart", b"x" * 11, "image/png")
+
+            assert cache.get_cache_stats()["memory_items"] == 0
+            assert cache.get("chart") is not None
+
+    def test_evicted_items_leave_memory(self):
+        """测试淘汰和清理时同时移出内存层"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, max_size=1)
+            cache.set("source1", b"data1", "image/png")
+            cache.set("source2", b"data2", "image/png")
+
+            assert cache.get("source1") is None
+            assert cache.get_cache_stats()["memory_bytes"] == 5
+
+            cache.clear()
+            assert cache.get_cache_stats()["memory_items"] == 0
+            assert cache.get_cache_stats()["memory_bytes"] == 0
+
+    def test_memory_tier_disabled(self, monkeypatch):
+        """测试通过环境变量关闭内存层"""
+        monkeypatch.setenv("EMAILWIDGET_IMAGE_CACHE_MEMORY_BYTES", "0")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("logo", b"logo_data", "image/png")
+            cache.get("logo")
+
+            assert cache.get_cache_stats()["hits"] == {"memory": 0, "disk": 1}
+
+
+class TestImageCacheDataUri:
+    """ImageCache data URI缓存测试"""
+
+    def test_get_data_uri(self):
+        """测试获取编码后的data URI并缓存在内存层"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("logo", b"logo_data", "image/jpeg")
+
+            data_uri = cache.get_data_uri("logo")
+
+            assert (
+                data_uri
+                == "data:image/jpeg;base64," + base64.b64encode(b"logo_data").decode()
+            )
+            with patch("email_widget.core.cache.base64.b64encode") as encode:
+                assert cache.get_data_uri("logo") is data_uri
+            encode.assert_not_called()
+            assert cache.get_cache_stats()["memory_data_uris"] == 1
+
+    def test_set_with_data_uri(self):
+        """测试写入时传入已编码的data URI"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set(
+                "logo",
+                b"logo_data",
+                "image/png",
+                data_uri="data:image/png;base64,bG9nb19kYXRh",
+            )
+
+            with patch("email_widget.core.cache.base64.b64encode") as encode:
+                assert (
+                    cache.get_data_uri("logo") == "data:image/png;base64,bG9nb19kYXRh"
+                )
+            encode.assert_not_called()
+
+    def test_data_uri_miss(self):
+        """测试未缓存时返回None"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            assert ImageCache(cache_dir=temp_dir).get_data_uri("missing") is None
+
+    def test_data_uri_counts_against_memory_budget(self):
+        """测试data URI计入内存层字节预算"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, memory_bytes=80)
+            cache.set("source1", b"x" * 20, "image/png")
+            cache.set("source2", b"x" * 20, "image/png")
+
+            # 编码后的URI放不进预算时，最久未使用的source1被降级
+            assert cache.get_data_uri("source2") is not None
+            stats = cache.get_cache_stats()
+            assert stats["memory_items"] == 1
+            assert stats["memory_bytes"] == 20 + len(cache.get_data_uri("source2"))
+
+    def test_data_uri_too_large_for_memory(self):
+        """测试超过内存预算的data URI仍能返回但不缓存"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir, memory_bytes=30)
+            cache.set("source", b"x" * 20, "image/png")
+
+            assert cache.get_data_uri("source").startswith("data:image/png;base64,")
+            assert cache.get_cache_stats()["memory_data_uris"] == 0
+            assert cache.get_cache_stats()["memory_bytes"] == 20
+
+    def test_set_replaces_stale_data_uri(self):
+        """测试重新写入数据时丢弃旧的data URI"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = ImageCache(cache_dir=temp_dir)
+            cache.set("logo", b"old_logo", "image/png")
+            cache.get_data_uri("logo")
+
+            cache.set("logo", b"new_logo", "image/png")
+
+            assert cache.get_data_uri("logo").endswith(
+                base64.b64encode(b"new_logo").decode()
+            )
+
+
 class TestImageCacheClearOperation:
     """ImageCache清理操作测试"""
 
@@ -104,6 +104,36 @@ class TestEmailWidgetLogger:
         assert "lineno" in formatter._fmt
         assert "message" in formatter._fmt
 
+    def test_is_enabled_for(self):
+        """测试日志级别检查"""
+        logger = EmailWidgetLogger()
+
+        assert logger.is_enabled_for(logging.INFO)
+        assert not logger.is_enabled_for(logging.DEBUG)
+
+    def test_is_enabled_for_when_disabled(self):
+        """测试禁用日志时所有级别都不输出"""
+        logging.getLogger("EmailWidget").handlers.clear()
+        os.environ["EMAILWIDGET_DISABLE_LOGGING"] = "true"
+        try:
+            logger = EmailWidgetLogger()
+            assert not logger.is_enabled_for(logging.CRITICAL)
+        finally:
+            del os.environ["EMAILWIDGET_DISABLE_LOGGING"]
+            logging.getLogger("EmailWidget").setLevel(logging.NOTSET)
+
+    def test_deferred_arguments(self, caplog):
+        """测试%风格参数仅在输出时格式化"""
+        logger = EmailWidgetLogger()
+        argument = MagicMock()
+
+        logger.debug("skipped %s", argument)
+        argument.__str__.assert_not_called()
+
+        with caplog.at_level(logging.INFO, logger="EmailWidget"):
+            logger.info("rendered %d widgets in %s", 3, "email")
+        assert "rendered 3 widgets in email" in caplog.text
+
 
 class TestGetProjectLogger:
     """get_project_logger函数测试类"""
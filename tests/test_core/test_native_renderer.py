@@ -0,0 +1,370 @@
+"""原生渲染后端测试用例"""
+
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from jinja2 import TemplateError
+
+from email_widget.core.enums import (
+    AlertType,
+    LayoutType,
+    LogLevel,
+    ProgressTheme,
+    SeparatorType,
+    StatusType,
+    TextType,
+)
+from email_widget.core.native_renderer import (
+    NativeTemplate,
+    UnsupportedTemplateError,
+    compile_native,
+)
+from email_widget.core.template_engine import (
+    RENDER_BACKEND_ENV,
+    StringTemplateLoader,
+    TemplateEngine,
+    create_environment,
+    get_template_key,
+)
+from email_widget.email import Email
+from email_widget.precompile import collect_templates
+from email_widget.widgets import (
+    AlertWidget,
+    ButtonWidget,
+    CardWidget,
+    ChartWidget,
+    ChecklistWidget,
+    CircularProgressWidget,
+    ColumnWidget,
+    ImageWidget,
+    LogWidget,
+    MetricWidget,
+    ProgressWidget,
+    QuoteWidget,
+    SeparatorWidget,
+    StatusWidget,
+    TableWidget,
+    TextWidget,
+    TimelineWidget,
+)
+
+PNG_DATA_URI = (
+    "data:image/png;base64,"
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+
+def _chart():
+    widget = ChartWidget().set_title("Sales").set_description("Monthly sales")
+    widget._image_url = PNG_DATA_URI
+    return widget.set_data_summary("Peak in June")
+
+
+# 共享示例(conftest的builtin_widget_factory)之外的Widget状态，覆盖模板中的其他分支
+WIDGET_VARIANTS = {
+    "alert_empty": lambda: AlertWidget(),
+    "alert": lambda: AlertWidget()
+    .set_content("Disk almost full")
+    .set_alert_type(AlertType.WARNING)
+    .set_title("Storage"),
+    "alert_no_icon": lambda: AlertWidget().set_content("Note").set_icon(""),
+    "button": lambda: ButtonWidget()
+    .set_text("Open")
+    .set_href("https://example.com")
+    .set_align("center")
+    .set_border("1px solid #ccc"),
+    "card_empty": lambda: CardWidget(),
+    "card": lambda: CardWidget()
+    .set_title("Summary")
+    .set_content("All systems go")
+    .set_status(StatusType.SUCCESS)
+    .set_icon("✅")
+    .add_metadata("Owner", "Ops")
+    .add_metadata("Region", "EU"),
+    "chart_empty": lambda: ChartWidget(),
+    "chart": _chart,
+    "checklist_empty": lambda: ChecklistWidget(),
+    "checklist": lambda: ChecklistWidget()
+    .set_title("Release")
+    .add_item("Build", True, description="CI green")
+    .add_item("Deploy", False, status_type=StatusType.WARNING, status_text="Pending")
+    .add_item("Verify", None),
+    "checklist_compact": lambda: ChecklistWidget()
+    .set_compact_mode(True)
+    .add_item("Only item", True),
+    "circular_progress": lambda: CircularProgressWidget()
+    .set_value(42)
+    .set_label("CPU")
+    .set_theme(ProgressTheme.ERROR),
+    "column_empty": lambda: ColumnWidget(),
+    "column": lambda: ColumnWidget()
+    .set_columns(3)
+    .add_widgets([TextWidget().set_content(f"Column {i}") for i in range(4)]),
+    "image_empty": lambda: ImageWidget(),
+    "image": lambda: ImageWidget()
+    .set_image_url("https://example.com/logo.png", embed=False)
+    .set_title("Logo")
+    .set_description("Company logo")
+    .set_size(width="120px"),
+    "log_empty": lambda: LogWidget(),
+    "log": lambda: LogWidget()
+    .set_title("Recent logs")
+    .set_logs(
+        [
+            "2024-01-01 10:00:00.000 | INFO | app:main:10 - Started",
+            "2024-01-01 10:00:01.000 | ERROR | app:run:20 - Failed",
+        ]
+    )
+    .add_log_entry("Manual entry", LogLevel.WARNING, datetime(2024, 1, 1, 12, 0)),
+    "metric_empty": lambda: MetricWidget(),
+    "metric": lambda: MetricWidget()
+    .set_title("KPIs")
+    .add_metric("Users", 12345, "people", "+12%", StatusType.SUCCESS, "Active")
+    .add_metric("Errors", 3, trend="-1", trend_type=StatusType.ERROR),
+    "metric_vertical": lambda: MetricWidget()
+    .set_layout("vertical")
+    .add_metric("Latency", 120, "ms"),
+    "progress": lambda: ProgressWidget()
+    .set_value(75)
+    .set_label("Progress")
+    .set_theme(ProgressTheme.SUCCESS),
+    "quote_empty": lambda: QuoteWidget(),
+    "quote": lambda: QuoteWidget()
+    .set_content("Simplicity is prerequisite for reliability.")
+    .set_author("Edsger Dijkstra")
+    .set_source("EWD498"),
+    "separator": lambda: SeparatorWidget().set_type(SeparatorType.DASHED),
+    "status_empty": lambda: StatusWidget(),
+    "status": lambda: StatusWidget()
+    .set_title("Services")
+    .add_status_item("API", "Up", StatusType.SUCCESS)
+    .add_status_item("DB", "Degraded", StatusType.WARNING),
+    "status_horizontal": lambda: StatusWidget()
+    .set_layout(LayoutType.HORIZONTAL)
+    .add_status_item("Queue", "12"),
+    "table_empty": lambda: TableWidget(),
+    "table": lambda: TableWidget()
+    .set_title("Report")
+    .set_dataframe(
+        pd.DataFrame(
+            {
+                "name": ["a", "b", "c"],
+                "value": [1, 2.5, None],
+                "status": [
+                    {"text": "OK", "status": "success"},
+                    {"text": "Warn", "status": "warning"},
+                    "n/a",
+                ],
+            }
+        )
+    ),
+    "table_plain": lambda: TableWidget()
+    .set_headers(["A", "B"])
+    .add_row(["1", "2"])
+    .set_striped(False)
+    .set_bordered(False)
+    .set_column_width("A", "100px"),
+    "text_empty": lambda: TextWidget(),
+    "text": lambda: TextWidget()
+    .set_content("First line\nSecond line")
+    .set_type(TextType.SECTION_H2)
+    .set_bold(True)
+    .set_italic(True),
+    "text_single": lambda: TextWidget().set_content("Hello"),
+    "timeline_empty": lambda: TimelineWidget(),
+    "timeline": lambda: TimelineWidget()
+    .set_title("History")
+    .add_event("Created", datetime(2024, 1, 1), "Project created", StatusType.INFO)
+    .add_event("Released", "2024-02-01", status_type=StatusType.SUCCESS)
+    .add_event("Note"),
+    "timeline_reversed": lambda: TimelineWidget()
+    .set_reverse_order(True)
+    .add_event("A", "2024-01-01")
+    .add_event("B", "2024-01-02"),
+}
+
+
+@pytest.fixture
+def jinja_engine():
+    """Jinja2后端模板引擎"""
+    return TemplateEngine(render_backend="jinja")
+
+
+@pytest.fixture
+def native_engine():
+    """原生后端模板引擎"""
+    return TemplateEngine(render_backend="native")
+
+
+class TestNativeRendererParity:
+    """原生后端与Jinja2输出一致性测试"""
+
+    def test_all_builtin_templates_compile(self):
+        """测试所有内置模板都能编译为原生模板"""
+        env = create_environment(StringTemplateLoader())
+
+        for name, template_string in collect_templates().items():
+            assert isinstance(compile_native(env, template_string), NativeTemplate), (
+                name
+            )
+
+    @staticmethod
+    def _assert_identical(widget, jinja_engine, native_engine):
+        context = widget.get_template_context()
+        name = get_template_key(type(widget))
+
+        expected = jinja_engine.render(widget.TEMPLATE, context, name=name)
+        actual = native_engine.render(widget.TEMPLATE, context, name=name)
+
+        assert actual == expected
+
+    def test_builtin_widget_output_identical(
+        self, builtin_widget_factory, jinja_engine, native_engine
+    ):
+        """测试每个内置Widget在两种后端下输出完全一致"""
+        self._assert_identical(builtin_widget_factory(), jinja_engine, native_engine)
+
+    @pytest.mark.parametrize("case", list(WIDGET_VARIANTS))
+    def test_widget_variant_output_identical(self, case, jinja_engine, native_engine):
+        """测试Widget的其他状态在两种后端下输出完全一致"""
+        self._assert_identical(WIDGET_VARIANTS[case](), jinja_engine, native_engine)
+
+    def test_email_output_identical(self, monkeypatch, builtin_widget_factories):
+        """测试完整邮件在两种后端下输出完全一致"""
+        email = Email("Parity")
+        factories = [*builtin_widget_factories.values(), *WIDGET_VARIANTS.values()]
+        for factory in factories:
+            email.add_widget(factory())
+
+        outputs = []
+        for backend in ("jinja", "native"):
+            monkeypatch.setenv(RENDER_BACKEND_ENV, backend)
+            engine = TemplateEngine()
+            monkeypatch.setattr(
+                "email_widget.core.template_engine._global_template_engine", engine
+            )
+            for widget in email.widgets:
+                widget._template_engine = engine
+                widget.invalidate_render_cache()
+            email._template_engine = engine
+            outputs.append(email.export_str())
+
+        assert outputs[0] == outputs[1]
+
+
+class TestNativeTemplateSemantics:
+    """原生模板语义测试"""
+
+    @pytest.fixture
+    def env(self):
+        return create_environment(StringTemplateLoader())
+
+    @pytest.mark.parametrize(
+        "template_string,context",
+        [
+            ("{{ missing }}|{{ missing|length }}", {}),
+            ("{% if missing %}yes{% else %}no{% endif %}", {}),
+            ("{% for x in missing %}{{ x }}{% else %}empty{% endfor %}", {}),
+            ("{{ obj.key }}|{{ obj.nope }}", {"obj": {"key": "v"}}),
+            ("{{ items[1] }}", {"items": ["a", "b"]}),
+            (
+                "{% for k, v in d.items() %}{{ k }}={{ v }}{% if not loop.last %},{% endif %}{% endfor %}",
+                {"d": {"a": 1, "b": 2}},
+            ),
+            (
+                "{% for x in xs %}{{ loop.index }}/{{ loop.length }}{% for y in xs %}{{ loop.first }}{% endfor %}{% endfor %}",
+                {"xs": [1, 2]},
+            ),
+            ("{% for i in range(n) %}{{ i }}{% endfor %}", {"n": 3}),
+            (
+                "{{ a if flag else b }}|{{ a if not flag }}",
+                {"a": 1, "b": 2, "flag": False},
+            ),
+            ("{% if x > 1 and x != 5 or x == 0 %}ok{% endif %}", {"x": 3}),
+            ("  {% if True %}\n    <p>{{ v }}</p>\n  {% endif %}\n", {"v": None}),
+        ],
+    )
+    def test_matches_jinja(self, env, template_string, context):
+        """测试原生模板与Jinja2语义一致"""
+        expected = env.from_string(template_string).render(**context)
+
+        assert compile_native(env, template_string).render(**context) == expected
+
+    def test_undefined_attribute_access_raises(self, env):
+        """测试访问未定义变量的属性时抛出异常"""
+        template = compile_native(env, "{{ missing.attr }}")
+
+        with pytest.raises(TemplateError):
+            template.render()
+
+    @pytest.mark.parametrize(
+        "template_string",
+        ["{{ x|upper }}", "{% set y = 1 %}", "{% macro m() %}{% endmacro %}"],
+    )
+    def test_unsupported_syntax(self, env, template_string):
+        """测试不支持的语法抛出UnsupportedTemplateError"""
+        with pytest.raises(UnsupportedTemplateError):
+            compile_native(env, template_string)
+
+    def test_generate_yields_output(self, env):
+        """测试generate接口"""
+        template = compile_native(env, "<p>{{ v }}</p>")
+
+        assert "".join(template.generate(v=1)) == "<p>1</p>"
+
+
+class TestNativeBackendEngine:
+    """模板引擎原生后端测试"""
+
+    def test_default_backend(self, monkeypatch):
+        """测试默认使用Jinja2后端"""
+        monkeypatch.delenv(RENDER_BACKEND_ENV, raising=False)
+
+        assert TemplateEngine().render_backend == "jinja"
+
+    def test_backend_from_environment(self, monkeypatch):
+        """测试通过环境变量选择后端"""
+        monkeypatch.setenv(RENDER_BACKEND_ENV, "native")
+
+        engine = TemplateEngine()
+
+        assert engine.render_backend == "native"
+        assert engine.get_cache_stats()["render_backend"] == "native"
+
+    def test_invalid_backend(self):
+        """测试无效后端"""
+        with pytest.raises(ValueError, match="Invalid render backend"):
+            TemplateEngine(render_backend="mako")
+
+    def test_native_templates_used(self, native_engine):
+        """测试原生后端编译出原生模板"""
+        native_engine.render("<p>{{ v }}</p>", {"v": 1}, name="t")
+
+        assert isinstance(native_engine._template_registry["t"][1], NativeTemplate)
+
+    def test_unsupported_template_falls_back_to_jinja(self, native_engine):
+        """测试不支持的模板回退到Jinja2"""
+        html = native_engine.render("{{ v|upper }}", {"v": "abc"})
+
+        assert html == "ABC"
+        assert not isinstance(
+            native_engine._get_template("{{ v|upper }}"), NativeTemplate
+        )
+
+    def test_syntax_error_raises(self, native_engine):
+        """测试语法错误仍然抛出TemplateError"""
+        with pytest.raises(TemplateError):
+            native_engine.render("{% if %}", {})
+
+    def test_render_safe_fallback(self, native_engine):
+        """测试渲染失败时返回备用内容"""
+        html = native_engine.render_safe("{{ missing.attr }}", {}, fallback="fallback")
+
+        assert html == "fallback"
+
+    def test_render_stream(self, native_engine):
+        """测试流式渲染接口"""
+        chunks = list(native_engine.render_stream("<p>{{ v }}</p>", {"v": 2}))
+
+        assert "".join(chunks) == "<p>2</p>"
@@ -2,12 +2,19 @@
 
 import threading
 import time
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 from jinja2 import TemplateError
 
-from email_widget.core.template_engine import TemplateEngine, get_template_engine
+from email_widget.core.template_engine import (
+    BYTECODE_CACHE_DIR_ENV,
+    TemplateBytecodeCache,
+    TemplateEngine,
+    get_template_engine,
+    get_template_key,
+)
 
 
 class TestTemplateEngineInitialization:
@@ -108,6 +115,17 @@ class TestTemplateRendering:
 
         assert result == "<div>Hello World!</div>"
 
+    def test_render_records_timings(self):
+        """测试渲染阶段耗时记录"""
+        engine = TemplateEngine()
+        timings = {}
+
+        result = engine.render_safe("<p>{{ v }}</p>", {"v": 1}, timings=timings)
+
+        assert result == "<p>1</p>"
+        assert set(timings) == {"template", "render"}
+        assert all(value >= 0 for value in timings.values())
+
     def test_render_with_complex_context(self):
         """测试复杂上下文渲染"""
         engine = TemplateEngine()
@@ -195,6 +213,28 @@ class TestSafeTemplateRendering:
         assert result == fallback
 
 
+class TestStreamTemplateRendering:
+    """流式模板渲染测试"""
+
+    def test_render_stream_matches_render(self):
+        """测试流式渲染结果与普通渲染一致"""
+        engine = TemplateEngine()
+        template_string = "<ul>{% for i in items %}<li>{{ i }}</li>{% endfor %}</ul>"
+        context = {"items": [1, 2, 3]}
+
+        chunks = list(engine.render_stream(template_string, context))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == engine.render(template_string, context)
+
+    def test_render_stream_syntax_error(self):
+        """测试流式渲染语法错误"""
+        engine = TemplateEngine()
+
+        with pytest.raises(TemplateError):
+            engine.render_stream("<div>{% invalid syntax %}</div>", {})
+
+
 class TestTemplateValidation:
     """模板验证测试"""
 
@@ -312,6 +352,178 @@ class TestCacheManagement:
         assert stats_after["cache_size_bytes"] == 0
 
 
+class TestTemplateRegistry:
+    """模板注册表测试"""
+
+    def test_register_template(self):
+        """测试注册命名模板"""
+        engine = TemplateEngine()
+
+        engine.register_template("greeting", "<p>Hello {{ name }}</p>")
+
+        assert "greeting" in engine._template_registry
+        assert engine._template_cache == {}
+        assert engine.get_cache_stats()["registered_templates"] == 1
+
+    def test_named_lookup_compiles_once(self):
+        """测试命名模板只编译一次"""
+        engine = TemplateEngine()
+        template_string = "<p>{{ v }}</p>"
+
+        with patch.object(
+            engine, "_compile_template", wraps=engine._compile_template
+        ) as mock_compile:
+            for i in range(5):
+                assert (
+                    engine.render(template_string, {"v": i}, name="p") == f"<p>{i}</p>"
+                )
+
+        mock_compile.assert_called_once()
+
+    def test_named_template_source_change(self):
+        """测试同名模板源码变化时重新编译"""
+        engine = TemplateEngine()
+
+        assert engine.render("<p>{{ v }}</p>", {"v": 1}, name="w") == "<p>1</p>"
+        assert engine.render("<b>{{ v }}</b>", {"v": 2}, name="w") == "<b>2</b>"
+        assert engine.get_cache_stats()["registered_templates"] == 1
+
+    def test_widget_templates_registered_by_class(self):
+        """测试Widget模板按类注册"""
+        from email_widget.widgets.text_widget import TextWidget
+
+        engine = get_template_engine()
+        engine.clear_cache()
+
+        TextWidget().set_content("a").render_html()
+        TextWidget().set_content("b").render_html()
+
+        assert list(engine._template_registry) == [get_template_key(TextWidget)]
+        assert engine._template_cache == {}
+
+    def test_clear_cache_clears_registry(self):
+        """测试清空缓存同时清空注册表"""
+        engine = TemplateEngine()
+        engine.register_template("x", "<i></i>")
+
+        engine.clear_cache()
+
+        assert engine._template_registry == {}
+
+
+class TestTemplateCacheLRU:
+    """临时模板LRU缓存测试"""
+
+    def test_eviction_beyond_limit(self):
+        """测试超过上限时淘汰最久未使用的模板"""
+        engine = TemplateEngine(max_cached_templates=2)
+
+        engine._get_template("<a></a>")
+        engine._get_template("<b></b>")
+        engine._get_template("<a></a>")  # 访问a，使b成为最久未使用
+        engine._get_template("<c></c>")
+
+        assert list(engine._template_cache) == ["<a></a>", "<c></c>"]
+        stats = engine.get_cache_stats()
+        assert stats["cached_templates"] == 2
+        assert stats["max_cached_templates"] == 2
+        assert stats["cache_evictions"] == 1
+
+    def test_zero_limit_disables_cache(self):
+        """测试上限为0时不缓存临时模板"""
+        engine = TemplateEngine(max_cached_templates=0)
+
+        assert engine.render("<p>{{ v }}</p>", {"v": 1}) == "<p>1</p>"
+        assert len(engine._template_cache) == 0
+        assert engine.get_cache_stats()["cache_evictions"] == 1
+
+
+class TestBytecodeCache:
+    """模板字节码缓存测试"""
+
+    def test_disabled_by_default(self, monkeypatch):
+        """测试默认不启用字节码缓存"""
+        monkeypatch.delenv(BYTECODE_CACHE_DIR_ENV, raising=False)
+        engine = TemplateEngine()
+
+        assert engine._env.bytecode_cache is None
+        assert engine.get_cache_stats()["bytecode_cache_dir"] is None
+
+    def test_enabled_by_argument(self, temp_dir):
+        """测试通过参数启用字节码缓存"""
+        engine = TemplateEngine(bytecode_cache_dir=temp_dir)
+
+        result = engine.render("<div>{{ name }}</div>", {"name": "cached"})
+
+        assert result == "<div>cached</div>"
+        assert isinstance(engine._env.bytecode_cache, TemplateBytecodeCache)
+        assert engine.get_cache_stats()["bytecode_cache_dir"] == str(temp_dir)
+        assert len(list(temp_dir.glob("emailwidget_*.cache"))) == 1
+
+    def test_enabled_by_environment(self, temp_dir, monkeypatch):
+        """测试通过环境变量启用字节码缓存"""
+        monkeypatch.setenv(BYTECODE_CACHE_DIR_ENV, str(temp_dir / "bytecode"))
+        engine = TemplateEngine()
+
+        engine.render("<p>{{ x }}</p>", {"x": 1})
+
+        assert len(list((temp_dir / "bytecode").glob("*.cache"))) == 1
+
+    def test_reuse_across_engines(self, temp_dir):
+        """测试新引擎实例从磁盘加载字节码而不重新编译"""
+        template = "<ul>{% for i in items %}<li>{{ i }}</li>{% endfor %}</ul>"
+        TemplateEngine(bytecode_cache_dir=temp_dir).render(template, {"items": [1]})
+
+        engine = TemplateEngine(bytecode_cache_dir=temp_dir)
+        with patch.object(engine._env, "compile", wraps=engine._env.compile) as mock:
+            result = engine.render(template, {"items": [1, 2]})
+
+        mock.assert_not_called()
+        assert result == "<ul><li>1</li><li>2</li></ul>"
+
+    def test_builtin_widgets_match_runtime_compilation(
+        self, temp_dir, builtin_widget_factory
+    ):
+        """测试启用字节码缓存时内置Widget的渲染结果与运行时编译一致"""
+        expected = builtin_widget_factory().render_html()
+
+        # 第一个引擎写入字节码，第二个引擎从磁盘加载
+        for _ in range(2):
+            widget = builtin_widget_factory()
+            widget._template_engine = TemplateEngine(bytecode_cache_dir=temp_dir)
+            assert widget.render_html() == expected
+
+        assert list(temp_dir.glob("emailwidget_*.cache"))
+
+    def test_cache_key_includes_jinja_version(self, temp_dir):
+        """测试缓存键包含Jinja2版本"""
+        cache = TemplateBytecodeCache(temp_dir)
+        key = cache.get_cache_key("<div></div>")
+
+        with patch("email_widget.core.template_engine.jinja2.__version__", "0.0.0"):
+            assert cache.get_cache_key("<div></div>") != key
+        assert cache.get_cache_key("<span></span>") != key
+
+    def test_write_error_falls_back(self, temp_dir):
+        """测试缓存写入失败时仍能正常渲染"""
+        engine = TemplateEngine(bytecode_cache_dir=temp_dir)
+
+        with patch(
+            "jinja2.bccache.FileSystemBytecodeCache.dump_bytecode",
+            side_effect=OSError("disk full"),
+        ):
+            result = engine.render("<b>{{ v }}</b>", {"v": "ok"})
+
+        assert result == "<b>ok</b>"
+
+    def test_invalid_directory_disables_cache(self, temp_file):
+        """测试缓存目录无法创建时禁用字节码缓存"""
+        engine = TemplateEngine(bytecode_cache_dir=Path(temp_file) / "sub")
+
+        assert engine._env.bytecode_cache is None
+        assert engine.render("<i>{{ v }}</i>", {"v": 1}) == "<i>1</i>"
+
+
 class TestTemplateEngineErrorHandling:
     """模板引擎错误处理测试"""
 
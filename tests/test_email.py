@@ -16,7 +16,7 @@ from email_widget.core.enums import (
     TextAlign,
     TextType,
 )
-from email_widget.email import Email
+from email_widget.email import Email, _render_widget
 from email_widget.widgets.alert_widget import AlertWidget
 from email_widget.widgets.card_widget import CardWidget
 from email_widget.widgets.circular_progress_widget import CircularProgressWidget
@@ -281,6 +281,33 @@ class TestEmailConvenienceMethods:
         assert len(self.email.widgets) == 1
         assert isinstance(self.email.widgets[0], TableWidget)
 
+    def test_add_table_from_df_max_rows(self):
+        """测试添加DataFrame表格时限制行数"""
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"id": range(100), "name": [f"row-{i}" for i in range(100)]})
+
+        self.email.add_table_from_df(df, max_rows=10, max_rows_strategy="tail")
+
+        table = self.email.widgets[0]
+        assert len(table.rows) == 10
+        assert table.rows[0] == ["90", "row-90"]
+        assert len(table.dataframe) == 100
+        assert "… 90 more rows" in self.email.export_str()
+
+    def test_add_table_from_df_polars(self):
+        """测试添加Polars DataFrame表格"""
+        pl = pytest.importorskip("polars")
+        pytest.importorskip("pyarrow")
+        df = pl.DataFrame({"id": range(100), "name": [f"row-{i}" for i in range(100)]})
+
+        with patch("email_widget.utils.optional_deps.check_optional_dependency") as check:
+            self.email.add_table_from_df(df.lazy(), max_rows=10)
+
+        assert "pandas" not in [call.args[0] for call in check.call_args_list]
+        table = self.email.widgets[0]
+        assert table.rows[0] == ["0", "row-0"]
+        assert "… 90 more rows" in self.email.export_str()
+
     def test_add_alert_default(self):
         """测试添加默认警告框"""
         result = self.email.add_alert("Default alert")
@@ -1241,6 +1268,240 @@ class TestEmailExport:
                 self.email.export_html("test.html", output_dir=temp_dir)
 
 
+class TestEmailStreaming:
+    """Email流式导出测试类"""
+
+    def setup_method(self):
+        """每个测试方法执行前的设置"""
+        self.email = Email("Stream Test")
+        self.email.add_text("Stream content")
+        self.email.add_table_from_data([["A", "1"], ["B", "2"]], ["Name", "Value"])
+
+    def test_export_stream_matches_export_str(self):
+        """测试流式导出与字符串导出结果一致"""
+        chunks = list(self.email.export_stream())
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == self.email.export_str()
+        assert Email._STREAM_PLACEHOLDER not in "".join(chunks)
+
+    def test_export_stream_renders_widgets_lazily(self):
+        """测试Widget在流到达时才渲染"""
+        stream = self.email.export_stream()
+
+        with patch.object(
+            TextWidget, "render_html", return_value="<p>lazy</p>"
+        ) as mock_render:
+            first_chunk = next(stream)
+            assert "<!DOCTYPE html>" in first_chunk
+            mock_render.assert_not_called()
+
+            rest = "".join(stream)
+            mock_render.assert_called_once()
+            assert "<p>lazy</p>" in rest
+
+    @patch("email_widget.widgets.text_widget.TextWidget.render_html")
+    def test_export_stream_skips_failed_widget(self, mock_render):
+        """测试流式导出跳过渲染失败的Widget"""
+        mock_render.side_effect = Exception("Widget render error")
+
+        html = "".join(self.email.export_stream())
+
+        assert "<!DOCTYPE html>" in html
+        assert "Name" in html
+
+    def test_export_stream_empty_email(self):
+        """测试空邮件的流式导出"""
+        email = Email("Empty Stream")
+
+        assert "".join(email.export_stream()) == email.export_str()
+
+    def test_export_html_streaming(self):
+        """测试流式写入HTML文件"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result_path = self.email.export_html(
+                "stream.html", output_dir=temp_dir, streaming=True
+            )
+
+            content = result_path.read_text(encoding="utf-8")
+            assert content == self.email.export_str()
+
+    def test_export_stream_row_source_table(self):
+        """测试行数据源表格在流式导出中分块输出，结果与普通表格一致"""
+        rows = [[f"Item {i}", str(i)] for i in range(7)]
+        table = TableWidget().set_headers(["Name", "Value"]).set_rows(list(rows))
+        email = Email("Row Source").add_widget(table)
+        expected = email.export_str()
+
+        table.clear_rows().set_row_source(iter(rows), chunk_size=3)
+        chunks = list(email.export_stream())
+
+        assert "".join(chunks) == expected
+        assert sum("<tr" in chunk and "<thead>" not in chunk for chunk in chunks) == 3
+
+
+class TestEmailParallelRendering:
+    """Email并行渲染测试类"""
+
+    def setup_method(self):
+        """每个测试方法执行前的设置"""
+        self.email = Email("Parallel Test")
+        for i in range(6):
+            self.email.add_text(f"Text {i}")
+            self.email.add_table_from_data([[f"row {i}", str(i)]], ["Name", "Value"])
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_export_str_parallel_matches_sequential(self, executor):
+        """测试并行渲染结果与顺序渲染一致"""
+        expected = self.email.export_str()
+
+        assert self.email.export_str(workers=3, executor=executor) == expected
+
+    def test_export_str_parallel_preserves_order(self):
+        """测试并行渲染保持Widget顺序"""
+        html = self.email.export_str(workers=4)
+
+        positions = [html.index(f"Text {i}") for i in range(6)]
+        assert positions == sorted(positions)
+
+    @pytest.mark.parametrize("executor", ["thread", "process"])
+    def test_export_str_parallel_fills_render_cache(self, executor):
+        """测试并行渲染结果写回各Widget的渲染缓存"""
+        self.email.export_str(workers=3, executor=executor)
+
+        assert all(widget._cached_html for widget in self.email.widgets)
+
+    def test_export_str_parallel_renders_only_changed_widgets(self):
+        """测试并行渲染只将缓存失效的Widget提交到线程池"""
+        expected = self.email.export_str(workers=3)
+        self.email.widgets[0].set_content("Changed")
+
+        with patch(
+            "email_widget.email._render_widget", wraps=_render_widget
+        ) as mock_render:
+            html = self.email.export_str(workers=3)
+
+        mock_render.assert_called_once_with(self.email.widgets[0])
+        assert html == expected.replace("Text 0", "Changed")
+
+    @patch("email_widget.widgets.text_widget.TextWidget._render_template")
+    def test_export_str_parallel_skips_failed_widget(self, mock_render):
+        """测试并行渲染跳过出错的Widget"""
+        mock_render.side_effect = Exception("Widget render error")
+
+        html = self.email.export_str(workers=4)
+
+        assert "<!DOCTYPE html>" in html
+        assert "row 5" in html
+        assert "Text 0" not in html
+
+    def test_export_str_single_worker_is_sequential(self):
+        """测试单个worker时使用顺序渲染"""
+        with patch.object(
+            self.email, "_iter_widget_html_parallel"
+        ) as mock_parallel:
+            self.email.export_str(workers=1)
+
+        mock_parallel.assert_not_called()
+
+    def test_export_str_invalid_executor(self):
+        """测试无效的executor参数"""
+        with pytest.raises(ValueError, match="Invalid executor"):
+            self.email.export_str(workers=2, executor="fiber")
+
+
+class TestEmailRenderProfile:
+    """Email渲染性能分析测试类"""
+
+    def setup_method(self):
+        """每个测试方法执行前的设置"""
+        self.email = Email("Profile Test")
+        self.email.add_text("Hello")
+        self.email.add_table_from_data(
+            [[f"row {i}", str(i)] for i in range(50)], ["Name", "Value"]
+        )
+
+    def test_profile_records_each_widget(self):
+        """测试每个Widget都有性能记录"""
+        profile = self.email.render_profile()
+
+        assert len(profile.widgets) == 2
+        assert {p.widget_type for p in profile.widgets} == {"TextWidget", "TableWidget"}
+        for widget_profile in profile.widgets:
+            assert widget_profile.context_time > 0
+            assert widget_profile.template_time > 0
+            assert widget_profile.render_time > 0
+            assert widget_profile.total_time >= widget_profile.render_time
+            assert widget_profile.output_bytes > 0
+
+    def test_profile_output_matches_export(self):
+        """测试分析结果的输出大小与导出一致"""
+        profile = self.email.render_profile()
+        html = self.email.export_str()
+
+        assert profile.output_bytes == len(html.encode("utf-8"))
+        table = next(p for p in profile.widgets if p.widget_type == "TableWidget")
+        assert table.output_bytes == len(self.email.widgets[1].render_html().encode("utf-8"))
+
+    def test_profile_sorting(self):
+        """测试排序方式"""
+        by_bytes = self.email.render_profile(sort_by="output_bytes")
+        by_index = self.email.render_profile(sort_by="index")
+
+        assert by_bytes.widgets[0].widget_type == "TableWidget"
+        assert [p.index for p in by_index.widgets] == [0, 1]
+
+    def test_profile_invalid_sort_field(self):
+        """测试无效的排序字段"""
+        with pytest.raises(ValueError, match="Invalid sort field"):
+            self.email.render_profile(sort_by="speed")
+
+    def test_profile_bypasses_render_cache(self):
+        """测试性能分析不使用渲染缓存"""
+        self.email.export_str()
+
+        with patch.object(
+            TextWidget, "get_template_context", wraps=self.email.widgets[0].get_template_context
+        ) as mock_context:
+            self.email.render_profile()
+
+        mock_context.assert_called_once()
+
+    def test_profile_report_formats(self):
+        """测试结构化报告和表格输出"""
+        profile = self.email.render_profile()
+
+        data = profile.to_dict()
+        assert set(data) == {"total_time", "email_time", "output_bytes", "widgets"}
+        assert data["widgets"][0]["widget_id"] == profile.widgets[0].widget_id
+
+        table = str(profile)
+        assert "TableWidget" in table and "TextWidget" in table
+        assert "Context ms" in table
+        assert "2 widgets" in table
+
+    @patch("email_widget.widgets.text_widget.TextWidget.render_profiled")
+    def test_profile_skips_failed_widget(self, mock_render):
+        """测试渲染出错的Widget被跳过"""
+        mock_render.side_effect = Exception("Widget render error")
+
+        profile = self.email.render_profile()
+
+        assert [p.widget_type for p in profile.widgets] == ["TableWidget"]
+
+    def test_export_not_instrumented(self):
+        """测试普通导出不记录阶段耗时"""
+        with patch.object(
+            self.email._template_engine,
+            "render_safe",
+            wraps=self.email._template_engine.render_safe,
+        ) as mock_render_safe:
+            self.email.widgets[0].invalidate_render_cache()
+            self.email.export_str()
+
+        assert all(call.kwargs.get("timings") is None for call in mock_render_safe.call_args_list)
+
+
 class TestEmailUtilities:
     """Email工具方法测试类"""
 
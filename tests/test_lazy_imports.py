@@ -0,0 +1,133 @@
+"""包级延迟导入测试用例"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import email_widget
+import email_widget.widgets
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# `import email_widget` 的累计导入耗时上限（微秒），远高于正常值，只用于发现回退到全量导入
+IMPORT_TIME_BUDGET_US = 100_000
+
+# 只有访问对应属性后才应被导入的模块
+HEAVY_MODULES = (
+    "jinja2",
+    "email_widget.email",
+    "email_widget.email_sender",
+    "email_widget.core.base",
+    "email_widget.core.template_engine",
+    "email_widget.widgets",
+)
+
+
+def run_importtime(code: str) -> dict[str, int]:
+    """在子进程中以 -X importtime 运行代码
+
+    Returns:
+        {模块名: 累计导入耗时（微秒）}
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line.split("|")
+        if cumulative.strip().isdigit():
+            timings[module.strip()] = int(cumulative)
+    return timings
+
+
+def loaded_modules(code: str) -> set[str]:
+    """在子进程中运行代码，返回运行后已加载的模块名"""
+    result = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint('\\n'.join(sys.modules))"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+class TestImportTime:
+    """导入耗时回归测试"""
+
+    def test_import_does_not_load_heavy_modules(self):
+        """测试导入包时不加载模板引擎和Widget模块"""
+        timings = run_importtime("import email_widget")
+
+        assert "email_widget" in timings
+        for module in HEAVY_MODULES:
+            assert module not in timings
+
+    def test_import_time_budget(self):
+        """测试导入包的累计耗时在预算内"""
+        timings = run_importtime("import email_widget")
+
+        assert timings["email_widget"] < IMPORT_TIME_BUDGET_US
+
+    def test_attribute_access_loads_only_needed_modules(self):
+        """测试只导入用到的Widget模块"""
+        modules = loaded_modules("from email_widget import Email, TextWidget")
+
+        assert "email_widget.email" in modules
+        assert "email_widget.widgets.text_widget" in modules
+        assert "email_widget.widgets.chart_widget" not in modules
+        assert "email_widget.email_sender" not in modules
+
+
+class TestLazyAttributes:
+    """延迟属性访问测试"""
+
+    @pytest.mark.parametrize("name", email_widget.__all__)
+    def test_all_names_resolve(self, name):
+        """测试__all__中的名称都可访问"""
+        assert getattr(email_widget, name) is not None
+
+    @pytest.mark.parametrize("name", email_widget.widgets.__all__)
+    def test_widgets_names_resolve(self, name):
+        """测试widgets包__all__中的名称都可访问"""
+        assert getattr(email_widget.widgets, name) is getattr(email_widget, name)
+
+    def test_same_object_as_defining_module(self):
+        """测试延迟导入的对象与定义模块中的对象相同"""
+        from email_widget.email import Email
+        from email_widget.widgets.table_widget import TableWidget
+
+        assert email_widget.Email is Email
+        assert email_widget.widgets.TableWidget is TableWidget
+
+    def test_unknown_attribute_raises(self):
+        """测试访问不存在的属性抛出AttributeError"""
+        name = "NoSuchWidget"
+        with pytest.raises(AttributeError, match=name):
+            getattr(email_widget, name)
+        with pytest.raises(AttributeError, match=name):
+            getattr(email_widget.widgets, name)
+
+    def test_dir_lists_public_names(self):
+        """测试dir()包含延迟导入的名称"""
+        assert set(email_widget.__all__) <= set(dir(email_widget))
+        assert set(email_widget.widgets.__all__) <= set(dir(email_widget.widgets))
+
+    def test_dir_lists_names_before_import(self):
+        """测试新进程中dir()在导入前就包含延迟导入的名称，且不触发导入"""
+        code = (
+            "import email_widget\n"
+            "assert 'Email' in dir(email_widget)\n"
+            "assert 'TableWidget' in dir(email_widget)"
+        )
+
+        assert "email_widget.email" not in loaded_modules(code)
+        assert "email_widget.widgets.table_widget" not in loaded_modules(code)
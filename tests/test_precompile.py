@@ -0,0 +1,146 @@
+"""模板预编译模块测试用例"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from email_widget.core.template_engine import (
+    PRECOMPILED_DIR_ENV,
+    TemplateEngine,
+    get_template_key,
+)
+from email_widget.email import Email
+from email_widget.precompile import collect_templates, main, precompile_templates
+from email_widget.widgets.table_widget import TableWidget
+from email_widget.widgets.text_widget import TextWidget
+
+
+@pytest.fixture
+def precompiled_dir(temp_dir):
+    """生成预编译模板目录"""
+    return precompile_templates(temp_dir / "precompiled")
+
+
+class TestCollectTemplates:
+    """模板收集测试"""
+
+    def test_collects_all_widgets_and_email(self):
+        """测试收集所有内置Widget和Email的模板"""
+        templates = collect_templates()
+
+        assert get_template_key(Email) in templates
+        assert get_template_key(TextWidget) in templates
+        assert get_template_key(TableWidget) in templates
+        assert len(templates) == 18
+        assert templates[get_template_key(TableWidget)] == TableWidget.TEMPLATE
+
+    def test_template_key_uses_defining_class(self):
+        """测试子类继承模板时使用定义模板的类作为键"""
+
+        class CustomTextWidget(TextWidget):
+            pass
+
+        assert get_template_key(CustomTextWidget) == get_template_key(TextWidget)
+
+
+class TestPrecompileTemplates:
+    """预编译生成测试"""
+
+    def test_writes_modules_and_manifest(self, precompiled_dir):
+        """测试生成模板模块和清单文件"""
+        manifest = json.loads((precompiled_dir / "manifest.json").read_text("utf-8"))
+
+        assert len(manifest["templates"]) == 18
+        assert len(list(precompiled_dir.glob("tmpl_*.py"))) == 18
+
+    def test_main_cli(self, temp_dir, capsys):
+        """测试命令行入口"""
+        main([str(temp_dir / "cli")])
+
+        assert (temp_dir / "cli" / "manifest.json").exists()
+        assert "EMAILWIDGET_PRECOMPILED_TEMPLATES" in capsys.readouterr().out
+
+
+class TestPrecompiledRendering:
+    """预编译模板渲染测试"""
+
+    def test_render_matches_runtime_compilation(self, precompiled_dir):
+        """测试预编译模板与运行时编译输出一致"""
+        runtime = TemplateEngine()
+        engine = TemplateEngine(precompiled_dir=precompiled_dir)
+        context = {
+            "rows_data": [{"index": 1, "row_style": "", "cells": []}],
+            "headers": ["A"],
+            "title": "T",
+        }
+        key = get_template_key(TableWidget)
+
+        with patch.object(engine._env, "from_string") as mock_compile:
+            result = engine.render(TableWidget.TEMPLATE, context, name=key)
+
+        mock_compile.assert_not_called()
+        assert result == runtime.render(TableWidget.TEMPLATE, context)
+        assert engine._template_cache == {}
+
+    def test_builtin_widgets_match_runtime_compilation(
+        self, precompiled_dir, builtin_widget_factory
+    ):
+        """测试所有内置Widget使用预编译模板渲染的结果与运行时编译一致"""
+        expected = builtin_widget_factory().render_html()
+
+        widget = builtin_widget_factory()
+        engine = TemplateEngine(precompiled_dir=precompiled_dir)
+        widget._template_engine = engine
+        with patch.object(engine._env, "from_string") as mock_compile:
+            result = widget.render_html()
+
+        mock_compile.assert_not_called()
+        assert result == expected
+
+    def test_sample_widgets_cover_all_templates(self, builtin_widget_factories):
+        """测试参数化的示例Widget覆盖所有内置Widget模板"""
+        widget_templates = {
+            get_template_key(type(factory()))
+            for factory in builtin_widget_factories.values()
+        }
+        assert widget_templates == set(collect_templates()) - {get_template_key(Email)}
+
+    def test_email_export_with_precompiled(self, precompiled_dir, monkeypatch):
+        """测试通过环境变量启用预编译模板导出邮件"""
+        email = Email("Precompiled")
+        email.add_text("Hello")
+        expected = email.export_str()
+
+        monkeypatch.setenv(PRECOMPILED_DIR_ENV, str(precompiled_dir))
+        email._template_engine = TemplateEngine()
+
+        assert email.export_str() == expected
+        assert email._template_engine.get_cache_stats()["precompiled_templates"] == 18
+
+    def test_stale_template_falls_back(self, precompiled_dir):
+        """测试模板源码变更后回退到运行时编译"""
+        engine = TemplateEngine(precompiled_dir=precompiled_dir)
+        key = get_template_key(TextWidget)
+
+        with patch.object(
+            engine, "_compile_template", wraps=engine._compile_template
+        ) as mock_compile:
+            result = engine.render("<p>{{ content }}</p>", {"content": "new"}, name=key)
+
+        assert result == "<p>new</p>"
+        mock_compile.assert_called_once()
+
+    def test_jinja_version_mismatch_ignored(self, precompiled_dir):
+        """测试Jinja2版本不一致时忽略预编译模板"""
+        with patch("email_widget.core.template_engine.jinja2.__version__", "0.0.0"):
+            engine = TemplateEngine(precompiled_dir=precompiled_dir)
+
+        assert engine.get_cache_stats()["precompiled_templates"] == 0
+
+    def test_missing_directory_ignored(self, temp_dir):
+        """测试预编译目录不存在时正常渲染"""
+        engine = TemplateEngine(precompiled_dir=temp_dir / "missing")
+
+        assert engine.get_cache_stats()["precompiled_dir"] is None
+        assert engine.render("<b>{{ v }}</b>", {"v": 1}, name="x") == "<b>1</b>"
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
+from email_widget.core.cache import ImageCache
 from email_widget.utils.image_utils import ImageUtils
 
 
@@ -255,7 +256,7 @@ class TestImageUtils:
         """测试缓存未命中的情况"""
         mock_exists.return_value = True
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # 缓存未命中
+        mock_cache.get_data_uri.return_value = None  # 缓存未命中
         mock_get_cache.return_value = mock_cache
 
         result = ImageUtils.process_image_source("test.jpg", cache=True, embed=True)
@@ -264,9 +265,9 @@ class TestImageUtils:
         expected_result = f"data:image/jpeg;base64,{expected_b64}"
 
         assert result == expected_result
-        mock_cache.get.assert_called_once_with("test.jpg")
+        mock_cache.get_data_uri.assert_called_once_with("test.jpg")
         mock_cache.set.assert_called_once_with(
-            "test.jpg", b"cached file data", "image/jpeg"
+            "test.jpg", b"cached file data", "image/jpeg", data_uri=expected_result
         )
 
     @patch("email_widget.utils.image_utils.get_image_cache")
@@ -274,18 +275,35 @@ class TestImageUtils:
     def test_process_image_source_with_cache_hit(self, mock_base64_img, mock_get_cache):
         """测试缓存命中的情况"""
         mock_cache = MagicMock()
-        mock_cache.get.return_value = (b"cached data", "image/png")  # 缓存命中
+        mock_cache.get_data_uri.return_value = "data:image/png;base64,cached_result"  # 缓存命中
         mock_get_cache.return_value = mock_cache
-        mock_base64_img.return_value = "data:image/png;base64,cached_result"
 
         result = ImageUtils.process_image_source("test.png", cache=True, embed=True)
 
         assert result == "data:image/png;base64,cached_result"
-        mock_cache.get.assert_called_once_with("test.png")
-        mock_base64_img.assert_called_once_with(b"cached data", "image/png")
+        mock_cache.get_data_uri.assert_called_once_with("test.png")
+        # 缓存中已有编码后的data URI，不应再次编码
+        mock_base64_img.assert_not_called()
         # 缓存命中时不应该调用set
         mock_cache.set.assert_not_called()
 
+    def test_process_image_source_reuses_cached_data_uri(self, tmp_path):
+        """测试重复嵌入同一图片时复用缓存的data URI"""
+        image_path = tmp_path / "logo.png"
+        image_path.write_bytes(b"logo image data")
+        cache = ImageCache(cache_dir=tmp_path / "cache")
+
+        with patch("email_widget.utils.image_utils.get_image_cache", return_value=cache):
+            first = ImageUtils.process_image_source(image_path)
+            with patch(
+                "email_widget.utils.image_utils.ImageUtils.base64_img"
+            ) as mock_base64_img:
+                second = ImageUtils.process_image_source(image_path)
+
+        assert second is first
+        mock_base64_img.assert_not_called()
+        assert cache.get_cache_stats()["hits"]["memory"] == 1
+
     def test_process_image_source_invalid_data(self):
         """测试无效的图片数据"""
         with patch("builtins.open", new_callable=mock_open, read_data=b""):
@@ -514,7 +532,7 @@ class TestImageUtilsIntegration:
     ):
         """测试embed=False时本地文件仍然使用缓存"""
         mock_cache = MagicMock()
-        mock_cache.get.return_value = None  # 缓存未命中
+        mock_cache.get_data_uri.return_value = None  # 缓存未命中
         mock_get_cache.return_value = mock_cache
 
         with patch(
@@ -527,5 +545,5 @@ class TestImageUtilsIntegration:
 
                 # 应该检查和设置缓存（因为本地文件强制嵌入）
                 mock_get_cache.assert_called_once()
-                mock_cache.get.assert_called_once_with("local.png")
+                mock_cache.get_data_uri.assert_called_once_with("local.png")
                 mock_cache.set.assert_called_once()
@@ -12,6 +12,7 @@ from email_widget.utils.optional_deps import (
     PandasMixin,
     check_optional_dependency,
     import_optional_dependency,
+    is_polars_frame,
     requires_pandas,
 )
 
@@ -185,6 +186,25 @@ class TestImportOptionalDependency:
                 mock_check.assert_called_once_with("test_module", "test_extra")
 
 
+class TestIsPolarsFrame:
+    """测试is_polars_frame函数"""
+
+    def test_polars_frames(self):
+        """测试Polars DataFrame和LazyFrame"""
+        pl = pytest.importorskip("polars")
+        df = pl.DataFrame({"a": [1, 2]})
+
+        assert is_polars_frame(df)
+        assert is_polars_frame(df.lazy())
+        assert not is_polars_frame(df["a"])
+
+    def test_other_objects(self):
+        """测试非Polars对象"""
+        assert not is_polars_frame(MagicMock())
+        assert not is_polars_frame([1, 2])
+        assert not is_polars_frame(None)
+
+
 class TestRequiresPandasDecorator:
     """测试requires_pandas装饰器"""
 
@@ -286,6 +286,55 @@ class TestColumnWidget:
             assert expected_width in context["cell_style"]
 
 
+class TestColumnWidgetRenderCache:
+    """ColumnWidget渲染缓存测试"""
+
+    def test_child_change_invalidates_column(self):
+        """测试子Widget修改后列布局重新渲染"""
+        from email_widget.widgets.text_widget import TextWidget
+
+        left = TextWidget().set_content("Left")
+        right = TextWidget().set_content("Right")
+        column = ColumnWidget().add_widgets([left, right])
+
+        first = column.render_html()
+        assert column.render_html() is first
+
+        right.set_content("Changed")
+        html = column.render_html()
+
+        assert "Changed" in html
+        assert "Left" in html
+
+    def test_unchanged_children_reuse_cache(self):
+        """测试只重新渲染修改过的子Widget"""
+        from email_widget.widgets.text_widget import TextWidget
+
+        left = TextWidget().set_content("Left")
+        right = TextWidget().set_content("Right")
+        column = ColumnWidget().add_widgets([left, right])
+        column.render_html()
+
+        BaseWidget.reset_render_cache_stats()
+        right.set_content("Changed")
+        column.render_html()
+
+        # 列本身和right未命中，left命中
+        stats = BaseWidget.get_render_cache_stats()
+        assert stats["misses"] == 2
+        assert stats["hits"] == 1
+
+    def test_uncached_child_disables_column_cache(self):
+        """测试子Widget关闭缓存时列布局也不缓存"""
+
+        class UncachedWidget(MockWidget):
+            RENDER_CACHE = False
+
+        column = ColumnWidget().add_widget(UncachedWidget())
+
+        assert column._get_render_version() is None
+
+
 class TestColumnWidgetIntegration:
     """ColumnWidget集成测试类"""
 
@@ -60,6 +60,14 @@ class TestLogEntry:
         entry = LogEntry("消息", timestamp=None)
         assert isinstance(entry.timestamp, datetime)
 
+    def test_slots(self):
+        """测试LogEntry使用__slots__，不创建实例__dict__"""
+        entry = LogEntry("消息")
+
+        assert not hasattr(entry, "__dict__")
+        with pytest.raises(AttributeError):
+            entry.extra = 1
+
 
 class TestLoGuruLogParser:
     """测试LoGuruLogParser解析器"""
@@ -451,6 +459,17 @@ class TestLogWidget:
         # 测试日志已清空
         assert len(self.widget._logs) == 0
 
+    def test_clear_invalidates_render_cache(self):
+        """测试清空日志后重新渲染"""
+        self.widget.append_log("INFO: Some log line")
+        before = self.widget.render_html()
+        assert "Some log line" in before
+
+        after = self.widget.clear().render_html()
+
+        assert after != before
+        assert "Some log line" not in after
+
     def test_set_title(self):
         """测试设置标题"""
         result = self.widget.set_title("测试标题")
@@ -1,5 +1,7 @@
 """状态信息Widget测试模块"""
 
+import pytest
+
 from email_widget.core.enums import LayoutType, StatusType
 from email_widget.widgets.status_widget import StatusItem, StatusWidget
 
@@ -23,6 +25,16 @@ class TestStatusItem:
         assert item.value == "成功"
         assert item.status == StatusType.SUCCESS
 
+    def test_slots(self):
+        """测试StatusItem使用__slots__，属性仍可修改"""
+        item = StatusItem("标签", "值")
+
+        assert not hasattr(item, "__dict__")
+        item.value = "新值"
+        assert item.value == "新值"
+        with pytest.raises(AttributeError):
+            item.extra = 1
+
 
 class TestStatusWidget:
     """StatusWidget测试类"""
@@ -1,5 +1,8 @@
 """表格Widget测试模块"""
 
+import sys
+from unittest.mock import patch
+
 import pytest
 
 # 尝试导入pandas，如果不可用则跳过相关测试
@@ -44,6 +47,16 @@ class TestTableCell:
         assert cell.bold is True
         assert cell.align == "center"
 
+    def test_slots(self):
+        """测试TableCell使用__slots__，不创建实例__dict__"""
+        cell = TableCell("值")
+
+        assert not hasattr(cell, "__dict__")
+        cell.value = "新值"
+        assert cell.value == "新值"
+        with pytest.raises(AttributeError):
+            cell.extra = 1
+
 
 class TestTableWidget:
     """TableWidget测试类"""
@@ -106,6 +119,84 @@ class TestTableWidget:
         assert status_cell.value == "进行中"
         assert status_cell.status == StatusType.INFO
 
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_set_dataframe_numeric_upcast(self):
+        """测试纯数值DataFrame按行统一类型转换（与iterrows一致）"""
+        df = pd.DataFrame({"A": [1, 2], "B": [0.5, float("nan")]})
+
+        self.widget.set_dataframe(df)
+
+        assert self.widget._rows == [["1.0", "0.5"], ["2.0", "nan"]]
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_set_dataframe_mixed_types(self):
+        """测试混合类型DataFrame逐列转换为字符串"""
+        df = pd.DataFrame(
+            {
+                "A": [1, 2],
+                "B": pd.Series(["x", None], dtype=object),
+                "C": [True, False],
+                "D": [{"no_status": 1}, "plain"],
+            }
+        )
+
+        self.widget.set_dataframe(df)
+
+        assert self.widget._rows == [
+            ["1", "x", "True", "{'no_status': 1}"],
+            ["2", "None", "False", "plain"],
+        ]
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    @pytest.mark.parametrize(
+        "columns",
+        [
+            ["整数", "对象"],
+            ["整数", "浮点"],
+            ["整数", "日期"],
+            ["日期"],
+            ["分类", "整数"],
+            ["对象", "分类", "布尔"],
+            ["整数", "对象", "浮点", "日期", "分类", "布尔"],
+        ],
+    )
+    def test_set_dataframe_matches_iterrows(self, columns):
+        """测试含缺失值的混合类型DataFrame与逐行iterrows转换结果一致"""
+        df = pd.DataFrame(
+            {
+                "整数": pd.array([1, None, 3, None], dtype="Int64"),
+                "对象": pd.Series(["a", "b", None, "d"], dtype=object),
+                "浮点": [1.5, float("nan"), 2.0, 4.0],
+                "日期": pd.to_datetime(
+                    ["2024-01-01", None, "2024-01-03", "2024-01-04"]
+                ),
+                "分类": pd.Categorical(["x", "y", None, "x"]),
+                "布尔": pd.array([True, None, False, True], dtype="boolean"),
+            }
+        )[columns]
+        expected = [
+            [str(row[column]) for column in df.columns] for _, row in df.iterrows()
+        ]
+
+        assert self.widget.set_dataframe(df)._rows == expected
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_set_dataframe_datetime(self):
+        """测试日期时间列使用Timestamp的文本表示"""
+        df = pd.DataFrame({"When": pd.to_datetime(["2024-01-01", "2024-01-02"])})
+
+        self.widget.set_dataframe(df)
+
+        assert self.widget._rows == [["2024-01-01 00:00:00"], ["2024-01-02 00:00:00"]]
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_set_dataframe_empty(self):
+        """测试空DataFrame"""
+        self.widget.set_dataframe(pd.DataFrame({"A": [], "B": []}))
+
+        assert self.widget._headers == ["A", "B"]
+        assert self.widget._rows == []
+
     def test_set_title(self):
         """测试设置标题"""
         result = self.widget.set_title("数据表格")
@@ -225,9 +316,9 @@ class TestTableWidget:
         result = self.widget.add_data_row([5, 6])
 
         assert result is self.widget
-        assert len(self.widget._dataframe) == 3
-        assert self.widget._dataframe.iloc[2]["A"] == 5
-        assert self.widget._dataframe.iloc[2]["B"] == 6
+        assert len(self.widget.dataframe) == 3
+        assert self.widget.dataframe.iloc[2]["A"] == 5
+        assert self.widget.dataframe.iloc[2]["B"] == 6
 
     @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
     def test_add_data_row_without_dataframe(self):
@@ -235,8 +326,63 @@ class TestTableWidget:
         result = self.widget.add_data_row([1, 2, 3])
 
         assert result is self.widget
-        assert self.widget._dataframe is not None
-        assert len(self.widget._dataframe) == 1
+        assert self.widget.dataframe is not None
+        assert len(self.widget.dataframe) == 1
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_add_data_row_buffers_until_read(self):
+        """测试逐行添加的数据在读取dataframe时才合并"""
+        self.widget.set_dataframe(pd.DataFrame({"A": [1], "B": [2]}))
+
+        with patch("pandas.concat", wraps=pd.concat) as mock_concat:
+            for i in range(5):
+                self.widget.add_data_row([i, i * 10])
+            assert len(self.widget._dataframe) == 1
+            assert mock_concat.call_count == 0
+
+            df = self.widget.dataframe
+            assert mock_concat.call_count == 1
+
+        assert df["A"].tolist() == [1, 0, 1, 2, 3, 4]
+        assert df["A"].dtype == "int64"
+        assert self.widget._pending_rows == []
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_add_data_rows_from_iterable(self):
+        """测试从生成器批量添加数据行"""
+        rows = ([f"item-{i}", i] for i in range(3))
+
+        result = self.widget.add_data_rows(rows)
+
+        assert result is self.widget
+        assert self.widget.dataframe.values.tolist() == [
+            ["item-0", 0],
+            ["item-1", 1],
+            ["item-2", 2],
+        ]
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_add_data_row_length_mismatch(self):
+        """测试行长度与列数不一致时抛出异常"""
+        self.widget.set_dataframe(pd.DataFrame({"A": [1], "B": [2]}))
+        with pytest.raises(ValueError, match="does not match"):
+            self.widget.add_data_row([1, 2, 3])
+
+        widget = TableWidget().add_data_row([1, 2])
+        with pytest.raises(ValueError, match="does not match"):
+            widget.add_data_rows([[3, 4], [5]])
+        assert len(widget.dataframe) == 2
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_set_dataframe_discards_pending_rows(self):
+        """测试set_dataframe和clear_data丢弃未合并的数据行"""
+        self.widget.add_data_row([1, 2])
+        self.widget.set_dataframe(pd.DataFrame({"A": [9]}))
+        assert self.widget.dataframe["A"].tolist() == [9]
+
+        self.widget.add_data_row([10])
+        self.widget.clear_data()
+        assert self.widget.dataframe is None
 
     @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
     def test_clear_data(self):
@@ -335,6 +481,684 @@ class TestTableWidget:
         assert "index_th_style" in context
         assert "index_td_style" in context
 
+    def test_get_template_context_reuses_styles(self):
+        """测试相同样式的单元格和同奇偶行共用样式字符串"""
+        self.widget.set_headers(["状态", "备注"])
+        for i in range(4):
+            self.widget.add_row([TableCell("OK", StatusType.SUCCESS), f"备注{i}"])
+
+        rows_data = self.widget.get_template_context()["rows_data"]
+
+        assert rows_data[0]["cells"][0]["style"] is rows_data[2]["cells"][0]["style"]
+        assert rows_data[0]["cells"][1]["style"] is rows_data[3]["cells"][1]["style"]
+        assert rows_data[1]["row_style"] is rows_data[3]["row_style"]
+        assert "#107c10" in rows_data[0]["cells"][0]["style"]
+
+
+class TestTableWidgetRowSource:
+    """TableWidget行数据源测试类"""
+
+    def setup_method(self):
+        """每个测试方法前的设置"""
+        self.rows = [
+            [f"项目{i}", str(i), TableCell("OK", status=StatusType.SUCCESS)]
+            for i in range(5)
+        ]
+        self.expected = (
+            TableWidget()
+            .set_headers(["名称", "数量", "状态"])
+            .set_rows(self.rows)
+            .show_index()
+        ).render_html()
+
+    def test_render_matches_materialized_rows(self):
+        """测试行数据源的渲染结果与set_rows一致"""
+        widget = TableWidget().set_row_source(
+            (row for row in self.rows), headers=["名称", "数量", "状态"], chunk_size=2
+        )
+        widget.show_index()
+
+        assert "".join(widget.render_html_stream()) == self.expected
+
+        widget.set_row_source(iter(self.rows), chunk_size=2)
+        assert widget.render_html() == self.expected
+
+    def test_stream_pulls_rows_in_chunks(self):
+        """测试流式渲染按块读取数据源"""
+        pulled = []
+
+        def source():
+            for row in self.rows:
+                pulled.append(row)
+                yield row
+
+        widget = TableWidget().set_row_source(
+            source(), headers=["名称", "数量", "状态"], chunk_size=2
+        )
+        stream = widget.render_html_stream()
+
+        assert "<thead>" in next(stream)
+        assert pulled == []
+        first_rows = next(stream)
+        assert first_rows.count("<tr") == 2
+        assert len(pulled) == 2
+
+        rest = list(stream)
+        assert len(pulled) == 5
+        assert [chunk.count("<tr") for chunk in rest] == [2, 1, 0]
+        assert "</tbody>" in rest[-1]
+
+    def test_stream_closes_table_when_source_fails(self):
+        """测试数据源中途出错时流式输出仍闭合表格"""
+
+        def source():
+            yield from self.rows[:3]
+            raise ConnectionError("cursor lost")
+
+        widget = TableWidget().set_row_source(
+            source(), headers=["名称", "数量", "状态"], chunk_size=2
+        )
+
+        with patch.object(widget._logger, "error") as mock_error:
+            html = "".join(widget.render_html_stream())
+
+        assert "项目0" in html and "项目1" in html
+        assert html.count("<table") == html.count("</table>")
+        assert "</tbody>" in html
+        assert "cursor lost" in str(mock_error.call_args)
+
+    def test_added_rows_render_before_source(self):
+        """测试add_row添加的行在数据源之前渲染"""
+        widget = (
+            TableWidget()
+            .add_row(["first", "0"])
+            .set_row_source(iter([["second", "1"]]))
+        )
+
+        html = widget.render_html()
+
+        assert html.index("first") < html.index("second")
+        assert widget.rows == [["first", "0"]]
+
+    def test_headers_from_cursor_description(self):
+        """测试从DB-API游标读取表头"""
+        import sqlite3
+
+        connection = sqlite3.connect(":memory:")
+        cursor = connection.execute("SELECT 'Alice' AS name, 42 AS score")
+
+        widget = TableWidget().set_row_source(cursor)
+        html = widget.render_html()
+        connection.close()
+
+        assert widget.headers == ["name", "score"]
+        assert ">Alice</td>" in html
+        assert ">42</td>" in html
+
+    def test_render_cache_disabled(self):
+        """测试行数据源只在第一次渲染时被消费，且不使用渲染缓存"""
+        widget = TableWidget().set_row_source(
+            iter(self.rows), headers=["名称", "数量", "状态"]
+        )
+
+        assert widget._get_render_version() is None
+        assert "项目4" in widget.render_html()
+        assert "项目4" not in widget.render_html()
+
+    def test_replacing_rows_drops_source(self):
+        """测试set_rows和clear_rows会移除数据源"""
+        widget = TableWidget().set_row_source(iter(self.rows))
+        widget.set_rows([["a", "b"]])
+        assert widget._row_source is None
+        assert widget._get_render_version() is not None
+
+        widget.set_row_source(iter(self.rows)).clear_rows()
+        assert widget._row_source is None
+
+    def test_invalid_chunk_size(self):
+        """测试无效的分块大小"""
+        with pytest.raises(ValueError, match="chunk_size"):
+            TableWidget().set_row_source(iter([]), chunk_size=0)
+
+
+class TestTableWidgetMaxRows:
+    """TableWidget行数限制测试类"""
+
+    def setup_method(self):
+        """每个测试方法前的设置"""
+        self.rows = [[str(i), f"项目{i}"] for i in range(10)]
+
+    @staticmethod
+    def summarize(widget):
+        """把行数据转为 (序号, 第一个单元格) 列表"""
+        return [
+            (row["index"], row["cells"][0]["value"])
+            for row in widget.get_template_context()["rows_data"]
+        ]
+
+    @pytest.mark.parametrize(
+        "strategy, expected",
+        [
+            ("head", [(1, "0"), (2, "1"), (3, "2"), (4, "3"), ("", "… 6 more rows")]),
+            ("tail", [("", "… 6 more rows"), (7, "6"), (8, "7"), (9, "8"), (10, "9")]),
+            (
+                "head_tail",
+                [(1, "0"), (2, "1"), ("", "… 6 more rows"), (9, "8"), (10, "9")],
+            ),
+        ],
+    )
+    def test_strategies(self, strategy, expected):
+        """测试各截断策略保留的行和溢出行位置"""
+        widget = TableWidget().set_headers(["ID", "名称"]).set_rows(self.rows)
+        widget.set_max_rows(4, strategy=strategy)
+
+        assert self.summarize(widget) == expected
+
+    def test_sample_keeps_order_and_is_reproducible(self):
+        """测试抽样策略按原顺序保留行且结果可复现"""
+        widget = (
+            TableWidget().set_rows(self.rows).set_max_rows(4, strategy="sample", seed=1)
+        )
+
+        values = [int(value) for _, value in self.summarize(widget)[:-1]]
+        assert len(values) == 4
+        assert values == sorted(values)
+        assert self.summarize(widget) == self.summarize(
+            TableWidget().set_rows(self.rows).set_max_rows(4, strategy="sample", seed=1)
+        )
+
+    def test_under_limit_has_no_overflow_row(self):
+        """测试行数未超过限制时不显示溢出行"""
+        widget = TableWidget().set_rows(self.rows).set_max_rows(10)
+
+        assert len(self.summarize(widget)) == 10
+
+    def test_overflow_row_spans_columns(self):
+        """测试溢出行跨越所有列"""
+        widget = (
+            TableWidget()
+            .set_headers(["ID", "名称"])
+            .set_rows(self.rows)
+            .set_max_rows(1)
+        )
+
+        html = widget.render_html()
+        assert 'colspan="2"' in html
+        assert "… 9 more rows" in html
+        assert html.count('<td style="padding: 8px;') == 3
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    def test_dataframe_trimmed_before_conversion(self):
+        """测试DataFrame在转换单元格前截断"""
+        df = pd.DataFrame(
+            {
+                "ID": range(1000),
+                "名称": pd.Series([f"项目{i}" for i in range(1000)], dtype=object),
+            }
+        )
+
+        with patch.object(
+            TableWidget, "_convert_dataframe_value", side_effect=str
+        ) as convert:
+            widget = (
+                TableWidget().set_max_rows(6, strategy="head_tail").set_dataframe(df)
+            )
+
+        assert convert.call_count == 6
+        assert [row[0] for row in widget.rows] == ["0", "1", "2", "997", "998", "999"]
+        assert len(widget.dataframe) == 1000
+        assert self.summarize(widget)[3] == ("", "… 994 more rows")
+        assert self.summarize(widget)[4] == (998, "997")
+
+    @pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+    @pytest.mark.parametrize("new_limit, shown", [(None, 20), (50, 20), (8, 9)])
+    def test_change_limit_after_dataframe(self, new_limit, shown):
+        """测试设置DataFrame后提高、移除或改变行数限制"""
+        df = pd.DataFrame({"ID": range(20)})
+        widget = TableWidget().set_max_rows(5).set_dataframe(df)
+
+        widget.set_max_rows(new_limit)
+
+        assert len(self.summarize(widget)) == shown
+        html = widget.render_html()
+        assert "… 15 more rows" not in html
+        assert ("… 12 more rows" in html) == (new_limit == 8)
+
+    def test_remove_limit_after_csv_clears_overflow(self, tmp_path):
+        """测试from_csv截断后移除限制不再显示过期的溢出行"""
+        path = tmp_path / "rows.csv"
+        path.write_text("ID\n" + "\n".join(map(str, range(10))), encoding="utf-8")
+        widget = TableWidget.from_csv(path, max_rows=4)
+
+        widget.set_max_rows(None)
+
+        assert self.summarize(widget) == [(1, "0"), (2, "1"), (3, "2"), (4, "3")]
+
+    def test_row_source_stream(self):
+        """测试行数据源流式渲染时的截断"""
+        expected = (
+            TableWidget()
+            .set_headers(["ID", "名称"])
+            .set_rows(self.rows)
+            .set_max_rows(3, "tail")
+        ).render_html()
+        widget = (
+            TableWidget()
+            .set_row_source(iter(self.rows), headers=["ID", "名称"], chunk_size=2)
+            .set_max_rows(3, "tail")
+        )
+
+        assert "".join(widget.render_html_stream()) == expected
+
+    def test_set_rows_resets_overflow(self):
+        """测试重新设置行数据后不再显示之前的溢出行"""
+        widget = TableWidget().set_max_rows(2)
+        if PANDAS_AVAILABLE:
+            widget.set_dataframe(pd.DataFrame({"ID": range(5)}))
+        widget.set_max_rows(None).set_rows(self.rows)
+
+        assert len(self.summarize(widget)) == 10
+
+    @pytest.mark.parametrize(
+        "max_rows, strategy", [(0, "head"), (-1, "head"), (5, "middle")]
+    )
+    def test_invalid_arguments(self, max_rows, strategy):
+        """测试无效参数"""
+        with pytest.raises(ValueError):
+            TableWidget().set_max_rows(max_rows, strategy=strategy)
+
+
+@pytest.mark.skipif(not PANDAS_AVAILABLE, reason="pandas not installed")
+class TestTableWidgetRules:
+    """TableWidget条件格式规则测试类"""
+
+    def setup_method(self):
+        """每个测试方法前的设置"""
+        self.df = pd.DataFrame(
+            {
+                "名称": ["A", "B", "C", "D"],
+                "增长": [-0.2, 0.05, 0.3, float("nan")],
+                "地区": ["EU-1", "US", "EU-2", "APAC"],
+            }
+        )
+
+    @staticmethod
+    def styles(widget, column):
+        """返回某列每行的单元格样式"""
+        return [
+            row["cells"][column]["style"]
+            for row in widget.get_template_context()["rows_data"]
+        ]
+
+    def test_threshold_rules(self):
+        """测试阈值规则为匹配的单元格设置样式"""
+        widget = (
+            TableWidget()
+            .add_rule("增长", "<", 0, status=StatusType.ERROR)
+            .add_rule("增长", ">=", 0.1, status=StatusType.SUCCESS, bold=True)
+            .set_dataframe(self.df)
+        )
+
+        styles = self.styles(widget, 1)
+        assert "#d13438" in styles[0]
+        assert "#d13438" not in styles[1] and "#107c10" not in styles[1]
+        assert "#107c10" in styles[2] and "font-weight: bold" in styles[2]
+        assert styles[3] == styles[1]  # NaN不匹配任何规则
+        assert self.styles(widget, 0)[0] == styles[1]
+
+    def test_callable_rule(self):
+        """测试函数规则使用列的布尔掩码"""
+        widget = TableWidget().set_dataframe(self.df)
+        widget.add_rule("地区", lambda s: s.str.startswith("EU"), color="#0078d4")
+
+        assert ["#0078d4" in style for style in self.styles(widget, 2)] == [
+            True,
+            False,
+            True,
+            False,
+        ]
+
+    def test_operators(self):
+        """测试between、in和contains运算符"""
+        widget = (
+            TableWidget()
+            .add_rule("增长", "between", (0, 0.1), color="#111111")
+            .add_rule("名称", "in", ["A", "D"], color="#222222")
+            .add_rule("地区", "contains", "PA", color="#333333")
+            .set_dataframe(self.df)
+        )
+
+        assert ["#111111" in style for style in self.styles(widget, 1)] == [
+            False,
+            True,
+            False,
+            False,
+        ]
+        assert ["#222222" in style for style in self.styles(widget, 0)] == [
+            True,
+            False,
+            False,
+            True,
+        ]
+        assert "#333333" in self.styles(widget, 2)[3]
+
+    def test_last_rule_wins(self):
+        """测试多条规则匹配时最后添加的规则生效"""
+        widget = (
+            TableWidget()
+            .set_dataframe(self.df)
+            .add_rule("增长", ">", 0, color="#111111")
+            .add_rule("增长", ">", 0.1, color="#222222")
+        )
+
+        styles = self.styles(widget, 1)
+        assert "#111111" in styles[1]
+        assert "#222222" in styles[2] and "#111111" not in styles[2]
+
+    def test_no_table_cells_created(self):
+        """测试规则不为格式化的单元格创建TableCell"""
+        widget = TableWidget().add_rule("增长", "<", 0, status=StatusType.ERROR)
+        widget.set_dataframe(self.df)
+
+        assert not any(
+            isinstance(cell, TableCell) for row in widget.rows for cell in row
+        )
+        assert widget._row_formats.itemsize == 1
+        assert len(widget._format_patterns) == 2
+
+    def test_rules_follow_max_rows(self):
+        """测试截断后规则仍作用于对应的行"""
+        widget = (
+            TableWidget()
+            .set_max_rows(2, strategy="tail")
+            .add_rule("增长", ">=", 0.1, status=StatusType.SUCCESS)
+            .set_dataframe(self.df)
+        )
+
+        rows_data = widget.get_template_context()["rows_data"]
+        assert rows_data[1]["cells"][0]["value"] == "C"
+        assert "#107c10" in rows_data[1]["cells"][1]["style"]
+
+    def test_clear_rules_and_rows(self):
+        """测试清除规则或行数据后不再应用格式"""
+        widget = (
+            TableWidget()
+            .add_rule("增长", "<", 0, color="#111111")
+            .set_dataframe(self.df)
+        )
+        widget.clear_rules()
+        assert all("#111111" not in style for style in self.styles(widget, 1))
+
+        widget.add_rule("增长", "<", 0, color="#111111")
+        widget.set_rows([["X", "-1", "EU"]])
+        assert widget._row_formats is None
+
+    def test_invalid_rules(self):
+        """测试无效规则"""
+        widget = TableWidget().set_dataframe(self.df)
+
+        with pytest.raises(ValueError):
+            widget.add_rule("增长", "~", 0, color="#111111")
+        with pytest.raises(ValueError):
+            widget.add_rule("增长", "<", 0)
+        with pytest.raises(ValueError):
+            widget.add_rule("不存在", "<", 0, color="#111111")
+        assert widget._rules == []
+
+    def test_failing_rule_rolled_back(self):
+        """测试求值出错的规则被移除且其他规则的格式保留"""
+        widget = (
+            TableWidget()
+            .set_dataframe(self.df)
+            .add_rule("增长", "<", 0, color="#111111")
+        )
+        expected = self.styles(widget, 1)
+
+        with pytest.raises(TypeError):
+            widget.add_rule("名称", ">", 5, color="#222222")
+
+        assert len(widget._rules) == 1
+        assert self.styles(widget, 1) == expected
+        widget.set_dataframe(self.df)
+        assert self.styles(widget, 1) == expected
+
+    def test_unknown_rule_column_keeps_table(self):
+        """测试新DataFrame缺少规则列时表格保持不变"""
+        widget = (
+            TableWidget()
+            .add_rule("增长", "<", 0, color="#111111")
+            .set_dataframe(self.df)
+        )
+        rows = widget.rows
+
+        with pytest.raises(ValueError, match="增长"):
+            widget.set_dataframe(pd.DataFrame({"其他": [1, 2]}))
+
+        assert widget.rows == rows
+        assert widget.dataframe.equals(self.df)
+        assert widget.headers == ["名称", "增长", "地区"]
+
+
+class TestTableWidgetFileSources:
+    """TableWidget从CSV、Arrow、Parquet导入的测试类"""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        """写入一个CSV文件"""
+        path = tmp_path / "data.csv"
+        lines = ["ID,名称,金额"] + [f"{i},项目{i},{i * 1.5}" for i in range(10)]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        return path
+
+    @pytest.fixture
+    def arrow_table(self):
+        """构建一个Arrow表"""
+        pa = pytest.importorskip("pyarrow")
+        return pa.table(
+            {
+                "ID": list(range(10)),
+                "名称": [f"项目{i}" if i != 3 else None for i in range(10)],
+                "金额": [i * 1.5 for i in range(10)],
+            }
+        )
+
+    def test_from_csv(self, csv_path):
+        """测试从CSV创建表格"""
+        widget = TableWidget.from_csv(csv_path)
+
+        assert widget.headers == ["ID", "名称", "金额"]
+        assert len(widget.rows) == 10
+        assert widget.rows[2] == ["2", "项目2", "3.0"]
+
+    def test_from_csv_columns_and_max_rows(self, csv_path):
+        """测试CSV列选择和行数限制"""
+        widget = TableWidget.from_csv(
+            csv_path, columns=["金额", "ID"], max_rows=3, max_rows_strategy="tail"
+        )
+
+        assert widget.headers == ["金额", "ID"]
+        assert widget.rows == [["10.5", "7"], ["12.0", "8"], ["13.5", "9"]]
+        assert "… 7 more rows" in widget.render_html()
+
+    def test_from_csv_format_params(self, tmp_path):
+        """测试传递给csv.reader的格式参数"""
+        path = tmp_path / "data.csv"
+        path.write_text("a;b\n1;2\n", encoding="utf-8")
+
+        assert TableWidget.from_csv(path, delimiter=";").rows == [["1", "2"]]
+
+    def test_from_csv_unknown_column(self, csv_path):
+        """测试选择不存在的列"""
+        with pytest.raises(ValueError):
+            TableWidget.from_csv(csv_path, columns=["不存在"])
+
+    def test_from_arrow(self, arrow_table):
+        """测试从Arrow表创建表格，缺失值显示为空"""
+        widget = TableWidget.from_arrow(arrow_table, columns=["名称", "金额"])
+
+        assert widget.headers == ["名称", "金额"]
+        assert widget.rows[1] == ["项目1", "1.5"]
+        assert widget.rows[3] == ["", "4.5"]
+
+    def test_from_arrow_max_rows(self, arrow_table):
+        """测试Arrow行数限制"""
+        widget = TableWidget.from_arrow(
+            arrow_table, max_rows=4, max_rows_strategy="head_tail"
+        )
+
+        assert [row[0] for row in widget.rows] == ["0", "1", "8", "9"]
+        rows_data = widget.get_template_context()["rows_data"]
+        assert rows_data[2]["cells"][0]["value"] == "… 6 more rows"
+        assert rows_data[3]["index"] == 9
+
+    def test_from_arrow_status_struct(self):
+        """测试Arrow结构体状态值转换为TableCell"""
+        pa = pytest.importorskip("pyarrow")
+        table = pa.table({"状态": [{"text": "完成", "status": "success"}]})
+
+        cell = TableWidget.from_arrow(table).rows[0][0]
+        assert isinstance(cell, TableCell)
+        assert cell.status == StatusType.SUCCESS
+
+    @pytest.mark.parametrize("strategy", ["head", "tail", "head_tail", "sample"])
+    def test_from_parquet_matches_arrow(self, arrow_table, tmp_path, strategy):
+        """测试Parquet按行组读取的结果与Arrow一致"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "data.parquet"
+        pq.write_table(arrow_table, path, row_group_size=3)
+
+        widget = TableWidget.from_parquet(
+            path, columns=["ID", "名称"], max_rows=4, max_rows_strategy=strategy
+        )
+        expected = TableWidget.from_arrow(
+            arrow_table, columns=["ID", "名称"], max_rows=4, max_rows_strategy=strategy
+        )
+
+        assert widget.rows == expected.rows
+        assert widget.render_html() == expected.render_html()
+
+    def test_from_parquet_without_limit(self, arrow_table, tmp_path):
+        """测试不限制行数时读取整个Parquet文件"""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "data.parquet"
+        pq.write_table(arrow_table, path)
+
+        assert (
+            TableWidget.from_parquet(path).rows
+            == TableWidget.from_arrow(arrow_table).rows
+        )
+
+
+class TestTableWidgetPolars:
+    """TableWidget导入Polars DataFrame和LazyFrame的测试类"""
+
+    DATA = {
+        "名称": [f"项目{i}" for i in range(10)],
+        "增长": [(-1) ** i * i / 10 for i in range(10)],
+        "地区": ["EU", "US"] * 5,
+    }
+
+    @pytest.fixture
+    def frames(self):
+        """构建内容相同的pandas和Polars DataFrame"""
+        pd = pytest.importorskip("pandas")
+        pl = pytest.importorskip("polars")
+        return pd.DataFrame(self.DATA), pl.DataFrame(self.DATA)
+
+    def test_unknown_rule_column_keeps_table(self, frames):
+        """测试Polars数据缺少规则列时表格保持不变"""
+        pandas_df, polars_df = frames
+        widget = (
+            TableWidget()
+            .add_rule("增长", "<", 0, color="#111111")
+            .set_dataframe(pandas_df)
+        )
+
+        for frame in (polars_df.drop("增长"), polars_df.lazy().drop("增长")):
+            with pytest.raises(ValueError, match="增长"):
+                widget.set_dataframe(frame)
+
+        assert widget.dataframe is not None
+        assert widget.dataframe.equals(pandas_df)
+
+    def test_set_polars_dataframe(self, frames):
+        """测试Polars DataFrame直接导入，不复制原对象"""
+        pandas_df, polars_df = frames
+        widget = TableWidget().set_dataframe(polars_df)
+
+        assert widget.dataframe is polars_df
+        assert widget.headers == ["名称", "增长", "地区"]
+        assert widget.rows == TableWidget().set_dataframe(pandas_df).rows
+
+    @pytest.mark.parametrize("strategy", ["head", "tail", "head_tail", "sample"])
+    def test_polars_matches_pandas(self, frames, strategy):
+        """测试Polars与pandas在行数限制和规则下渲染结果一致"""
+
+        def build(df):
+            return (
+                TableWidget()
+                .set_max_rows(4, strategy)
+                .add_rule("增长", "<", 0, status=StatusType.ERROR)
+                .add_rule("增长", "between", (0.2, 0.5), color="#107c10")
+                .add_rule("地区", "contains", "E", bold=True)
+                .set_dataframe(df)
+            )
+
+        pandas_df, polars_df = frames
+        expected = build(pandas_df).render_html()
+
+        assert build(polars_df).render_html() == expected
+        assert build(polars_df.lazy()).render_html() == expected
+
+    def test_lazy_frame_collects_kept_rows(self, frames):
+        """测试LazyFrame只收集保留的行"""
+        _, polars_df = frames
+        widget = TableWidget().set_max_rows(2, "tail").set_dataframe(polars_df.lazy())
+
+        assert widget.rows == [["项目8", "0.8", "EU"], ["项目9", "-0.9", "US"]]
+        assert "… 8 more rows" in widget.render_html()
+
+    def test_polars_rule_in(self, frames):
+        """测试Polars列上的in规则"""
+        _, polars_df = frames
+        widget = TableWidget().add_rule("地区", "in", ["US"], bold=True)
+        widget.set_dataframe(polars_df)
+
+        styles = [
+            row["cells"][2]["style"]
+            for row in widget.get_template_context()["rows_data"]
+        ]
+        assert ["font-weight: bold" in style for style in styles] == [False, True] * 5
+
+    def test_missing_values(self, frames):
+        """测试缺失值：pandas显示str()结果，Polars显示为空"""
+        pl = pytest.importorskip("polars")
+        data = {"名称": ["项目0", None], "增长": [0.5, None]}
+
+        assert TableWidget().set_dataframe(pd.DataFrame(data)).rows[1][1] == "nan"
+        assert TableWidget().set_dataframe(pl.DataFrame(data)).rows[1] == ["", ""]
+        assert TableWidget().set_dataframe(pl.DataFrame(data).lazy()).rows[1] == [
+            "",
+            "",
+        ]
+
+    def test_polars_without_pyarrow(self, frames, monkeypatch):
+        """测试Polars数据导入不依赖pyarrow"""
+        pandas_df, polars_df = frames
+        expected = TableWidget().set_dataframe(pandas_df).rows
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+        assert TableWidget().set_dataframe(polars_df).rows == expected
+        assert TableWidget().set_dataframe(polars_df.lazy()).rows == expected
+
+    def test_add_data_row_rejects_polars(self, frames):
+        """测试Polars数据上不支持add_data_row"""
+        _, polars_df = frames
+        widget = TableWidget().set_dataframe(polars_df)
+
+        with pytest.raises(TypeError):
+            widget.add_data_row(["项目10", "1.0", "EU"])
+
 
 class TestTableWidgetIntegration:
     """TableWidget集成测试类"""